@@ -5,6 +5,7 @@ from core.database import Database
 from loguru import logger
 import os
 
+from core.warmup import GuildWarmup
 from modules.invite_tracker.service import InviteTrackerService
 
 
@@ -46,11 +47,10 @@ class ShopBot(commands.Bot):
         if os.path.exists("modules"):
             for root, dirs, files in os.walk("modules"):
                 for file in files:
-                    if file.endswith(".py") and not file.startswith("__"):
-                        # Skip common non-extension files
-                        if file in ["models.py", "services.py", "ui.py", "__init__.py"]:
-                            continue
-                            
+                    # Only cog files are extensions. Anything else (services, models, ui helpers)
+                    # is imported normally; running it through load_extension would execute a second
+                    # copy of the module, with its own class-level state.
+                    if file in ["cog.py", "cogs.py"]:
                         # Construct module path: modules.shop.categories
                         rel_path = os.path.relpath(os.path.join(root, file), ".")
                         module_name = rel_path.replace(os.path.sep, ".")[:-3]
@@ -59,8 +59,7 @@ class ShopBot(commands.Bot):
                             await self.load_extension(module_name)
                             logger.info(f"Loaded extension: {module_name}")
                         except commands.NoEntryPointError:
-                            # Expected for utils/helper files that aren't cogs
-                            pass
+                            logger.warning(f"{module_name} has no setup(), skipped")
                         except Exception as e:
                             logger.error(f"Failed to load extension {module_name}: {e}")
 
@@ -72,12 +71,11 @@ class ShopBot(commands.Bot):
             activity= discord.Game(name=f"Official OP Shop bot")
         )
 
-        for guild in self.guilds:
-            await  InviteTrackerService.cache_guild(guild=guild)
+        await GuildWarmup.run(guilds=self.guilds, concurrency=settings.warmup_concurrency)
 
     async def on_guild_join(self, guild: discord.Guild):
-        """Seed tje cache when bot joins a new guild."""
-        await InviteTrackerService.cache_guild(guild=guild)
+        """Seed the caches when bot joins a new guild."""
+        await GuildWarmup.warm_guild(guild)
 
     async def on_invite_create(self, invite: discord.Invite):
         """Keep cache fresh when a new invite is created."""
@@ -95,5 +93,6 @@ class ShopBot(commands.Bot):
     async def close(self):
         """Called when bot is shutting down."""
         logger.info("Shutting down...")
-        await Database.close()
+        # Unloads cogs first so buffered writes are flushed before the DB goes away
         await super().close()
+        await Database.close()
@@ -12,6 +12,9 @@ class Settings(BaseSettings):
     owner_id: int
     openai_api_key: str
 
+    # Max guilds warmed concurrently on startup (each warmup makes one invites REST call)
+    warmup_concurrency: int = 5
+
     class Config:
         env_file = ".env"
         case_sensitive = False
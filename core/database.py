@@ -1,5 +1,7 @@
-from motor.motor_asyncio import AsyncIOMotorClient
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorGridFSBucket
+from pymongo.errors import OperationFailure
 from core.config import settings
+from core.indexes import INDEX_MANIFEST
 from loguru import logger
 
 
@@ -20,6 +22,55 @@ class Database:
             logger.error(f"Failed to connect to MongoDB: {e}")
             raise e
 
+        await cls.ensure_indexes()
+
+    @classmethod
+    async def ensure_indexes(cls):
+        """
+        Reconcile INDEX_MANIFEST against the live collections.
+        Missing indexes are created, extra/drifted/unused ones are only reported.
+        """
+        db = cls.get_db()
+        for collection_name, declared in INDEX_MANIFEST.items():
+            collection = db[collection_name]
+            declared_by_name = {model.document["name"]: model for model in declared}
+
+            try:
+                existing = {idx["name"]: idx async for idx in collection.list_indexes()}
+            except OperationFailure as e:
+                logger.error(f"[Indexes] Failed to list indexes for {collection_name}: {e}")
+                continue
+
+            for name, model in declared_by_name.items():
+                spec = model.document
+                current = existing.get(name)
+                if current is None:
+                    try:
+                        await collection.create_indexes([model])
+                        logger.info(f"[Indexes] Created {collection_name}.{name}")
+                    except OperationFailure as e:
+                        # e.g. duplicate keys blocking a unique constraint
+                        logger.error(f"[Indexes] Failed to create {collection_name}.{name}: {e}")
+                    continue
+
+                if list(current["key"].items()) != list(spec["key"].items()) or current.get("unique", False) != spec.get("unique", False):
+                    logger.warning(f"[Indexes] {collection_name}.{name} differs from manifest (drop it to rebuild)")
+
+            extra = [name for name in existing if name != "_id_" and name not in declared_by_name]
+            if extra:
+                logger.warning(f"[Indexes] {collection_name} has indexes not in manifest: {', '.join(extra)}")
+
+            # $indexStats counters reset on server restart, so this is a hint only
+            try:
+                unused = [
+                    stat["name"] async for stat in collection.aggregate([{"$indexStats": {}}])
+                    if stat["name"] != "_id_" and stat.get("accesses", {}).get("ops", 0) == 0
+                ]
+            except OperationFailure:
+                unused = []
+            if unused:
+                logger.info(f"[Indexes] {collection_name} indexes with no recorded use: {', '.join(unused)}")
+
     @classmethod
     async def close(cls):
         """Close connection to MongoDB."""
@@ -51,6 +102,19 @@ class Database:
     def tickets(cls):
         return cls.get_db().tickets
 
+    @classmethod
+    def ticket_messages(cls):
+        return cls.get_db().ticket_messages
+
+    @classmethod
+    def transcripts_bucket(cls) -> AsyncIOMotorGridFSBucket:
+        """GridFS bucket holding the compressed transcript archive (transcripts.files / transcripts.chunks)."""
+        return AsyncIOMotorGridFSBucket(cls.get_db(), bucket_name="transcripts")
+
+    @classmethod
+    def transcript_jobs(cls):
+        return cls.get_db().transcript_jobs
+
     @classmethod
     def ticket_settings(cls):
         return cls.get_db().ticket_settings
@@ -71,6 +135,14 @@ class Database:
     def invite_joins(cls):
         return cls.get_db().invites_joins
 
+    @classmethod
+    def invite_counts(cls):
+        return cls.get_db().invite_counts
+
+    @classmethod
+    def level_configs(cls):
+        return cls.get_db().level_configs
+
     @classmethod
     def guild_settings(cls):
         return cls.get_db().guild_settings
@@ -0,0 +1,97 @@
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+
+# Declarative index manifest: { collection_name: [IndexModel, ...] }
+# Every index carries an explicit name so Database.ensure_indexes() can
+# reconcile by name (create missing, report extra / drifted / unused).
+INDEX_MANIFEST: dict[str, list[IndexModel]] = {
+    "users": [
+        # EconomyService.get_user on every balance / XP / rep operation
+        IndexModel([("discord_id", ASCENDING)], name="discord_id_unique", unique=True),
+        # XPService leaderboard reload and get_rank counts
+        IndexModel([("level", DESCENDING), ("xp", DESCENDING)], name="level_xp"),
+    ],
+    "tickets": [
+        # TicketService.get_ticket_by_channel on every ticket message
+        IndexModel([("channel_id", ASCENDING)], name="channel_id"),
+        # TicketService.create_ticket "already has an open ticket" check
+        IndexModel(
+            [("user_id", ASCENDING), ("status", ASCENDING), ("guild_id", ASCENDING)],
+            name="user_id_status_guild_id",
+        ),
+    ],
+    "ticket_messages": [
+        # Transcript reads stream a ticket's log in order
+        IndexModel([("ticket_id", ASCENDING), ("created_at", ASCENDING)], name="ticket_id_created_at"),
+    ],
+    "transcript_jobs": [
+        # TranscriptWorkerService claims the oldest runnable job
+        IndexModel(
+            [("status", ASCENDING), ("run_after", ASCENDING), ("created_at", ASCENDING)],
+            name="status_run_after_created_at",
+        ),
+        # One job per ticket
+        IndexModel([("ticket_id", ASCENDING)], name="ticket_id_unique", unique=True),
+    ],
+    "transcripts.files": [
+        # GridFS's own index (created by the driver on first upload)
+        IndexModel([("filename", ASCENDING), ("uploadDate", ASCENDING)], name="filename_1_uploadDate_1"),
+        # TranscriptArchiveService.load / store (replace previous versions)
+        IndexModel([("metadata.ticket_id", ASCENDING), ("metadata.format", ASCENDING)], name="metadata_ticket_id_format"),
+        # TranscriptArchiveService.get_storage_stats
+        IndexModel([("metadata.guild_id", ASCENDING), ("uploadDate", ASCENDING)], name="metadata_guild_id_upload_date"),
+    ],
+    "transcripts.chunks": [
+        # GridFS's own index (created by the driver on first upload)
+        IndexModel([("files_id", ASCENDING), ("n", ASCENDING)], name="files_id_1_n_1", unique=True),
+    ],
+    "level_configs": [
+        # LevelTableService.set_level upsert key
+        IndexModel([("level", ASCENDING)], name="level_unique", unique=True),
+    ],
+    "ticket_settings": [
+        IndexModel([("guild_id", ASCENDING)], name="guild_id_unique", unique=True),
+    ],
+    "guild_settings": [
+        IndexModel([("guild_id", ASCENDING)], name="guild_id_unique", unique=True),
+    ],
+    "invites": [
+        # InviteTrackerService snapshot upserts and DB-history diff
+        IndexModel([("guild_id", ASCENDING), ("code", ASCENDING)], name="guild_id_code_unique", unique=True),
+    ],
+    "invites_joins": [
+        # InviteTrackerService.process_join_batch upsert / get_join_data
+        IndexModel([("guild_id", ASCENDING), ("user_id", ASCENDING)], name="guild_id_user_id_unique", unique=True),
+        # Per-inviter rollup (repair_db rebuilds invite_counts from it)
+        IndexModel([("guild_id", ASCENDING), ("inviter_id", ASCENDING)], name="guild_id_inviter_id"),
+    ],
+    "invite_counts": [
+        # InviteTrackerService counter upserts
+        IndexModel([("guild_id", ASCENDING), ("inviter_id", ASCENDING)], name="guild_id_inviter_id_unique", unique=True),
+        # /invites leaderboard (top-N per guild)
+        IndexModel([("guild_id", ASCENDING), ("total", DESCENDING)], name="guild_id_total"),
+    ],
+    "reputations_tier": [
+        # ReputationService.check_and_update_roles sorts tiers by threshold
+        IndexModel([("guild_id", ASCENDING), ("threshold", ASCENDING)], name="guild_id_threshold"),
+        # ReputationService.save_reputation_tier upsert key
+        IndexModel([("guild_id", ASCENDING), ("role_id", ASCENDING)], name="guild_id_role_id_unique", unique=True),
+    ],
+    "shop_panels": [
+        # ShopPanelService.get_panel_by_channel
+        IndexModel([("channel_id", ASCENDING), ("type", ASCENDING)], name="channel_id_type"),
+        # ShopPanelService.delete_panel
+        IndexModel([("message_id", ASCENDING)], name="message_id"),
+    ],
+    "items": [
+        # ItemService.get_items_by_category / get_item_count
+        IndexModel([("category_id", ASCENDING), ("is_active", ASCENDING)], name="category_id_is_active"),
+    ],
+    "categories": [
+        # CategoryService.get_active_categories / get_all_categories (sorted by rank)
+        IndexModel(
+            [("parent_id", ASCENDING), ("is_active", ASCENDING), ("rank", ASCENDING)],
+            name="parent_id_is_active_rank",
+        ),
+    ],
+}
@@ -0,0 +1,37 @@
+import time
+
+
+class TokenBucket:
+    """Token-bucket model of a Discord rate limit: `capacity` calls, refilled evenly over `period` seconds."""
+
+    def __init__(self, capacity: int, period: float):
+        self.capacity = capacity
+        self.rate = capacity / period
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def available(self) -> float:
+        self._refill()
+        return self.tokens
+
+    def wait_time(self) -> float:
+        """Seconds until a token is available (0 if one is available now)."""
+        self._refill()
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def take(self):
+        self._refill()
+        self.tokens -= 1
+
+    def refund(self):
+        self.tokens = min(self.capacity, self.tokens + 1)
+
+    def drain(self):
+        """Discord said 429: assume the budget is spent."""
+        self._refill()
+        self.tokens = min(self.tokens, 0.0)
@@ -0,0 +1,79 @@
+import asyncio
+import statistics
+import time
+
+import discord
+from loguru import logger
+
+from modules.guild.service import GuildSettingService
+from modules.invite_tracker.service import InviteTrackerService
+from modules.reputation.service import ReputationService
+from modules.tickets.services import TicketService
+
+
+class GuildWarmup:
+    """
+    Startup stage that warms every per-guild cache.
+    Guilds are warmed concurrently, bounded by a semaphore so the invites REST calls
+    stay well inside the rate limits; within a guild the individual loads run in parallel.
+    """
+
+    # Last readiness report. Structure: { guild_id: latency_seconds }
+    latencies: dict[int, float] = {}
+    # Structure: { guild_id: exception }
+    failures: dict[int, Exception] = {}
+
+    @staticmethod
+    async def warm_guild(guild: discord.Guild):
+        """Load everything the hot paths of a single guild need."""
+        await asyncio.gather(
+            InviteTrackerService.cache_guild(guild=guild),
+            GuildSettingService.get_guild_settings(guild=guild),
+            TicketService.get_ticket_settings(guild_id=guild.id),
+            ReputationService.get_tiers(guild_id=guild.id),
+        )
+
+    @classmethod
+    async def run(cls, guilds: list[discord.Guild], concurrency: int) -> dict[int, float]:
+        """Warm all guilds with at most `concurrency` in flight. Returns per-guild latency in seconds."""
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        latencies: dict[int, float] = {}
+        failures: dict[int, Exception] = {}
+
+        async def _warm(guild: discord.Guild):
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    await cls.warm_guild(guild)
+                    latencies[guild.id] = time.perf_counter() - start
+                except Exception as e:
+                    failures[guild.id] = e
+                    logger.error(f"[Warmup] Guild {guild.name} ({guild.id}) failed: {e}")
+
+        start = time.perf_counter()
+        await asyncio.gather(*(_warm(guild) for guild in guilds))
+        total = time.perf_counter() - start
+
+        cls.latencies, cls.failures = latencies, failures
+        cls._report(total=total, concurrency=concurrency)
+        return latencies
+
+    @classmethod
+    def _report(cls, total: float, concurrency: int):
+        ready = len(cls.latencies)
+        if not ready:
+            logger.warning(f"[Warmup] No guilds warmed ({len(cls.failures)} failed) in {total:.2f}s")
+            return
+
+        values = sorted(cls.latencies.values())
+        p95 = values[min(len(values) - 1, int(len(values) * 0.95))]
+        slowest = sorted(cls.latencies.items(), key=lambda kv: kv[1], reverse=True)[:3]
+
+        logger.info(
+            f"[Warmup] Ready: {ready} guilds ({len(cls.failures)} failed) in {total:.2f}s "
+            f"with concurrency {concurrency} | "
+            f"p50 {statistics.median(values) * 1000:.0f}ms, p95 {p95 * 1000:.0f}ms, max {values[-1] * 1000:.0f}ms"
+        )
+        logger.info(
+            "[Warmup] Slowest: " + ", ".join(f"{guild_id} ({latency * 1000:.0f}ms)" for guild_id, latency in slowest)
+        )
@@ -3,6 +3,7 @@ from discord.ui import View, Modal, TextInput, Select, Button
 
 from modules.guild.service import GuildSettingService
 from modules.shop.services import CategoryService, ItemService, logger
+from modules.shop.services_catalog import CatalogService
 from modules.shop.models import Category, Item
 import json
 
@@ -496,6 +497,8 @@ class AdminRootView(View):
 
     @discord.ui.button(label="Refresh", style=discord.ButtonStyle.secondary, row=1)
     async def refresh_btn(self, interaction: discord.Interaction, button: Button):
+        # Pick up catalog edits made outside the bot (seed scripts, manual DB fixes)
+        await CatalogService.rebuild()
         await self.refresh(interaction)
 
     async def refresh(self, interaction: discord.Interaction, initial_setup: bool = False):
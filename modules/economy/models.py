@@ -20,4 +20,6 @@ class Transaction(MongoModel):
 class EconomyConfig(MongoModel):
     tax_rate: float = Field(default=0.0, description="Tax rate for transfers (0.0 - 1.0)")
     xp_multiplier: float = Field(default=1.0, description="Global XP multiplier")
+    activity_xp: int = Field(default=5, ge=0, description="XP per message, at most once per cooldown")
+    activity_cooldown_seconds: int = Field(default=60, ge=0, description="Per-user activity XP window")
     currency_name: str = Field(default="tokens", description="Name of the main currency")
@@ -1,4 +1,6 @@
 from typing import Tuple, Optional
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 from core.database import Database
 from core.models.user import User
 from modules.economy.models import Transaction
@@ -22,10 +24,14 @@ class EconomyService:
         if doc:
             return User(**doc)
         
-        # Create new user
-        new_user = User(discord_id=user_id, username=username, tokens=0, xp=0, level=1, reputations=0, rep_given_counter=0)
-        await Database.users().insert_one(new_user.to_mongo())
-        return new_user
+        # Create new user (upsert so concurrent first-touches don't collide on the unique index)
+        doc = await Database.users().find_one_and_update(
+            {"discord_id": user_id},
+            {"$setOnInsert": EconomyService._new_user_defaults(user_id, username)},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        return User(**doc)
 
     @staticmethod
     async def get_balances(user_id: int) -> int:
@@ -34,19 +40,51 @@ class EconomyService:
         return user.tokens
 
 
+    @staticmethod
+    def _new_user_defaults(user_id: int, username: str = "Unknown", exclude: tuple = ()) -> dict:
+        """Default fields for a user document, for use in $setOnInsert."""
+        doc = User(discord_id=user_id, username=username, tokens=0, xp=0, level=1, reputations=0, rep_given_counter=0).to_mongo()
+        # discord_id comes from the upsert filter; excluded fields are set by other operators
+        for key in ("discord_id", *exclude):
+            doc.pop(key, None)
+        return doc
+
     @staticmethod
     async def modify_tokens(user_id: int, amount: int, reason: str, actor_id: int) -> int:
-        """Add/remove tokens and log transaction."""
-        user = await EconomyService.get_user(user_id)
-        new_balance = user.tokens + amount
-        if new_balance < 0:
+        """
+        Add/remove tokens atomically and log the transaction.
+        A single conditional $inc (tokens >= -amount) replaces read-modify-write, so concurrent
+        rewards cannot lose updates and a debit can never overdraw. Returns the new balance.
+        """
+        query = {"discord_id": user_id}
+        if amount < 0:
+            query["tokens"] = {"$gte": -amount}
+
+        update = {"$inc": {"tokens": amount}}
+        # Only credits may create the user; a missing user has 0 tokens so a debit fails anyway
+        if amount >= 0:
+            update["$setOnInsert"] = EconomyService._new_user_defaults(user_id, exclude=("tokens",))
+
+        try:
+            doc = await Database.users().find_one_and_update(
+                query,
+                update,
+                projection={"tokens": 1},
+                upsert=amount >= 0,
+                return_document=ReturnDocument.AFTER,
+            )
+        except DuplicateKeyError:
+            # Lost an upsert race against another writer; the user exists now
+            doc = await Database.users().find_one_and_update(
+                query,
+                {"$inc": {"tokens": amount}},
+                projection={"tokens": 1},
+                return_document=ReturnDocument.AFTER,
+            )
+
+        if doc is None:
             raise ValueError("Insufficient tokens")
 
-        await Database.users().update_one(
-            {"discord_id": user_id},
-            {"$set": {"tokens": new_balance}}
-        )
-
         txn = Transaction(
             user_id=user_id,
             type='reward' if amount > 0 else 'redeem',
@@ -56,7 +94,7 @@ class EconomyService:
         )
         await TransactionService.log_transaction(txn)
 
-        return new_balance
+        return doc["tokens"]
 
     @staticmethod
     async def transfer_tokens(from_id: int, to_id: int, amount: int) -> bool:
@@ -64,14 +102,6 @@ class EconomyService:
         if amount <= 0:
             raise ValueError("Amount must be positive")
 
-        # Check sender balance
-        sender = await EconomyService.get_user(from_id)
-        if sender.tokens < amount:
-            raise ValueError("Insufficient funds")
-
-        # Receiver ensure exists
-        await EconomyService.get_user(to_id)
-
         # Get Tax Config
         config = await EconomyConfigService.get_config()
         tax_amount = 0.0
@@ -80,8 +110,11 @@ class EconomyService:
             
         receive_amount = amount - tax_amount
 
-        # Updates
-        await EconomyService.modify_tokens(from_id, -amount, f"Transfer to {to_id}", from_id)
+        # Debit is conditional on the sender's balance, credit upserts the receiver
+        try:
+            await EconomyService.modify_tokens(from_id, -amount, f"Transfer to {to_id}", from_id)
+        except ValueError:
+            raise ValueError("Insufficient funds")
         await EconomyService.modify_tokens(to_id, int(receive_amount), f"Transfer from {from_id} (Tax: {tax_amount})", from_id)
         
         return True
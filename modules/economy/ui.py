@@ -1,6 +1,7 @@
 import discord
 from discord.ui import View, Modal, TextInput, Button
 from modules.economy.services import EconomyConfigService
+from modules.xp.services_activity import ActivityXPService
 
 class EconomyRulesModal(Modal):
     def __init__(self, config):
@@ -17,6 +18,16 @@ class EconomyRulesModal(Modal):
             default=str(config.xp_multiplier),
             placeholder="e.g. 1.0, 2.0"
         )
+        self.activity_xp_input = TextInput(
+            label="Activity XP per message",
+            default=str(config.activity_xp),
+            placeholder="e.g. 5 (0 disables)"
+        )
+        self.activity_cooldown_input = TextInput(
+            label="Activity XP cooldown (seconds)",
+            default=str(config.activity_cooldown_seconds),
+            placeholder="e.g. 60"
+        )
         self.currency_input = TextInput(
             label="Currency Name", 
             default=config.currency_name,
@@ -25,6 +36,8 @@ class EconomyRulesModal(Modal):
         
         self.add_item(self.tax_input)
         self.add_item(self.xp_input)
+        self.add_item(self.activity_xp_input)
+        self.add_item(self.activity_cooldown_input)
         self.add_item(self.currency_input)
 
     async def on_submit(self, interaction: discord.Interaction):
@@ -36,6 +49,11 @@ class EconomyRulesModal(Modal):
             xp = float(self.xp_input.value)
             if xp < 0:
                 raise ValueError("XP Multiplier must be positive.")
+
+            activity_xp = int(self.activity_xp_input.value)
+            activity_cooldown = int(self.activity_cooldown_input.value)
+            if activity_xp < 0 or activity_cooldown < 0:
+                raise ValueError("Activity XP and cooldown must be positive.")
                 
         except ValueError as e:
             await interaction.response.send_message(f"Invalid input: {str(e)}", ephemeral=True)
@@ -44,6 +62,8 @@ class EconomyRulesModal(Modal):
         updates = {
             "tax_rate": tax,
             "xp_multiplier": xp,
+            "activity_xp": activity_xp,
+            "activity_cooldown_seconds": activity_cooldown,
             "currency_name": self.currency_input.value
         }
         
@@ -51,6 +71,7 @@ class EconomyRulesModal(Modal):
         
         # Refresh the view
         new_config = await EconomyConfigService.get_config()
+        ActivityXPService.apply_config(new_config)
         view = EconomyRulesView()
         embed = view.get_embed(new_config)
         await interaction.response.edit_message(embed=embed, view=view)
@@ -70,6 +91,11 @@ class EconomyRulesView(View):
         embed.add_field(name="💸 Tax Rate", value=f"{config.tax_rate * 100:.1f}%", inline=True)
         embed.add_field(name="⚡ XP Multiplier", value=f"{config.xp_multiplier}x", inline=True)
         embed.add_field(name="💰 Currency Name", value=config.currency_name, inline=True)
+        embed.add_field(
+            name="💬 Activity XP",
+            value=f"{config.activity_xp} XP / {config.activity_cooldown_seconds}s",
+            inline=True
+        )
         
         return embed
 
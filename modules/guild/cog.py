@@ -2,7 +2,7 @@ import discord
 from discord.ext import  commands
 from discord import app_commands
 
-from core.database import Database
+from modules.guild.service import GuildSettingService
 
 
 class GuildCog(commands.Cog):
@@ -17,10 +17,9 @@ class GuildCog(commands.Cog):
         await interaction.response.defer(ephemeral=True)
 
         try:
-            await Database.guild_settings().update_one(
-                {"guild_id": interaction.guild.id},
-                {"$set": {"seller_role_id": role.id}},
-                upsert=True
+            await GuildSettingService.update_guild_settings(
+                interaction.guild.id,
+                {"seller_role_id": role.id}
             )
             await interaction.followup.send(f"{role.mention} has been set to your seller role.")
         except Exception as e :
@@ -34,10 +33,9 @@ class GuildCog(commands.Cog):
         await interaction.response.defer(ephemeral=True)
 
         try:
-            await Database.guild_settings().update_one(
-                {"guild_id": interaction.guild.id},
-                {"$set": {"server_logs_channel_id": channel.id}},
-                upsert=True
+            await GuildSettingService.update_guild_settings(
+                interaction.guild.id,
+                {"server_logs_channel_id": channel.id}
             )
             await interaction.followup.send(f"{channel.mention} has been set for server logs.")
         except Exception as e:
@@ -1,5 +1,6 @@
 import discord
 import re
+import time
 from core.database import Database
 from modules.guild.model import GuildSettings
 
@@ -7,16 +8,60 @@ from modules.guild.model import GuildSettings
 CUSTOM_EMOJI_REGEX = re.compile(r'^<a?:\w{2,32}:(\d{17,20})>$')
 
 class GuildSettingService:
+    CACHE_TTL_SECONDS = 300
 
-    @staticmethod
-    async def get_guild_settings(guild: discord.Guild) -> GuildSettings:
+    # Structure: { guild_id: (expires_at, GuildSettings) }
+    _cache: dict[int, tuple[float, GuildSettings]] = {}
+
+    # Cache counters, exposed via cache_stats()
+    _hits: int = 0
+    _misses: int = 0
+
+    @classmethod
+    async def get_guild_settings(cls, guild: discord.Guild) -> GuildSettings:
+        """Read-through cached settings. Writers must go through update_guild_settings()/invalidate()."""
+        cached = cls._cache.get(guild.id)
+        if cached and cached[0] > time.monotonic():
+            cls._hits += 1
+            return cached[1]
+
+        cls._misses += 1
         doc = await Database.guild_settings().find_one({"guild_id": guild.id})
 
         if doc:
-            return GuildSettings(**doc)
-
-        # return default settings object
-        return GuildSettings(guild_id=guild.id)
+            guild_settings = GuildSettings(**doc)
+        else:
+            # return default settings object
+            guild_settings = GuildSettings(guild_id=guild.id)
+
+        cls._cache[guild.id] = (time.monotonic() + cls.CACHE_TTL_SECONDS, guild_settings)
+        return guild_settings
+
+    @classmethod
+    async def update_guild_settings(cls, guild_id: int, updates: dict):
+        """Upsert settings fields and drop the cached copy."""
+        result = await Database.guild_settings().update_one(
+            {"guild_id": guild_id},
+            {"$set": updates},
+            upsert=True
+        )
+        cls.invalidate(guild_id)
+        return result
+
+    @classmethod
+    def invalidate(cls, guild_id: int):
+        """Forget the cached settings for a guild."""
+        cls._cache.pop(guild_id, None)
+
+    @classmethod
+    def cache_stats(cls) -> dict:
+        total = cls._hits + cls._misses
+        return {
+            "hits": cls._hits,
+            "misses": cls._misses,
+            "hit_rate": cls._hits / total if total else 0.0,
+            "size": len(cls._cache),
+        }
 
     @staticmethod
     async def get_seller_role(guild: discord.Guild) -> discord.Role | None:
@@ -2,9 +2,9 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 from core.database import Database
-from loguru import logger
 
 from core.models.user import User
+from modules.guild.service import GuildSettingService
 from modules.invite_tracker.service import InviteTrackerService
 
 
@@ -14,8 +14,6 @@ class InviteTrackerCog(commands.Cog):
 
     @commands.Cog.listener(name="on_member_join")
     async def on_member_join(self, member: discord.Member):
-        guild = member.guild
-        
         # 1. Always ensure User exists in DB
         user = User(
             discord_id=member.id,
@@ -32,40 +30,26 @@ class InviteTrackerCog(commands.Cog):
             upsert=True,
         )
 
-        # 2. Detect used invite
-        # Serialize per-guild so two simultaneous joins don't race each other
-        async with InviteTrackerService._get_lock(guild.id):
-            used_invite = await InviteTrackerService.detect_used_invite(guild)
+        # 2. Detect used invite, process the join (logs, rewards, etc.)
+        # Joins are coalesced per guild so a burst shares one invites fetch
+        InviteTrackerService.enqueue_join(member=member, client=self.bot)
 
-        inviter = None
+    invites_group = app_commands.Group(name="invites", description="Invite tracker stats", guild_only=True)
 
-        if used_invite:
-            # We found a specific invite!
-            if used_invite.inviter:
-                inviter = guild.get_member(used_invite.inviter.id) or used_invite.inviter
-            else:
-                logger.warning(f"[InviteTracker] Invite {used_invite.code} has no inviter (vanity/server discovery?)")
-        else:
-            # Fallback: Invite unknown (race condition, bot restart, etc.)
-            # Check if this is a rejoin to recover original inviter
-            join_data = await InviteTrackerService.get_join_data(member.id, guild.id)
-            if join_data:
-                logger.info(f"[InviteTracker] {member.id} rejoined {guild.id} (Invite unknown/expired)")
-                inviter_id = join_data.get("inviter_id")
-                if inviter_id:
-                    try:
-                        inviter = await self.bot.fetch_user(inviter_id)
-                    except discord.NotFound:
-                        inviter = None
-            else:
-                logger.warning(f"[InviteTracker] Unknown invite for {member.id} in {guild.id}")
+    @invites_group.command(name="leaderboard", description="View the top inviters of this server")
+    async def invites_leaderboard(self, interaction: discord.Interaction, limit: app_commands.Range[int, 1, 25] = 10):
+        rows = await InviteTrackerService.get_invite_leaderboard(guild_id=interaction.guild_id, limit=limit)
 
-        # 3. Process the join (logs, rewards, etc.)
-        await InviteTrackerService.process_join(
-            member=member,
-            inviter=inviter,
-            guild=guild,
+        desc = ""
+        for idx, row in enumerate(rows, 1):
+            desc += f"**{idx}.** <@{row['inviter_id']}> - {row['total']:,} invites\n"
+
+        embed = discord.Embed(
+            title="📨 Invite Leaderboard",
+            description=desc or "No invites tracked yet.",
+            color=discord.Color.gold()
         )
+        await interaction.response.send_message(embed=embed)
 
     @app_commands.command(name="set_invite_logs_channel", description="Set a logs channel for invite tracker")
     @commands.guild_only()
@@ -75,12 +59,9 @@ class InviteTrackerCog(commands.Cog):
         if channel is None:
             channel = interaction.channel
 
-        await Database.guild_settings().update_one(
-            {
-                "guild_id": interaction.guild.id
-            },
-            {"$set":{"invite_logs_channel_id":channel.id}},
-            upsert= True
+        await GuildSettingService.update_guild_settings(
+            interaction.guild.id,
+            {"invite_logs_channel_id": channel.id}
         )
         await interaction.followup.send(f"{channel.mention} has been set as invite logs channel", ephemeral=True)
 
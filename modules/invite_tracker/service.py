@@ -1,7 +1,10 @@
 import asyncio
 import datetime
+import time
 
 import discord
+from pymongo import DeleteMany, UpdateOne
+from pymongo.errors import BulkWriteError
 
 from core.constant import Emoji
 from core.database import Database, logger
@@ -21,6 +24,18 @@ class InviteTrackerService:
     # Track if a guild's cache is fully initialized
     _ready: dict[int, bool] = {}
 
+    # Joins within this window share a single invites fetch
+    JOIN_COALESCE_WINDOW_SECONDS = 1.5
+
+    # Retries for rebuilding invite_counts after a failed counter $inc
+    COUNTS_REBUILD_ATTEMPTS = 3
+
+    # Structure: { guild_id: [members waiting for invite attribution] }
+    _pending_joins: dict[int, list[discord.Member]] = {}
+
+    # Structure: { guild_id: drain task }
+    _join_tasks: dict[int, asyncio.Task] = {}
+
     @classmethod
     def _get_lock(cls, guild_id: int) -> asyncio.Lock:
         """Return a per-guild lock, creating it if needed"""
@@ -38,24 +53,38 @@ class InviteTrackerService:
         """
         Snapshot all current invite uses for a guild.
         Must be called on bot startup/guild join to populate the baseline.
+        The lock only covers the in-memory snapshot; persistence happens after it is released,
+        so stored uses only ever move up ($max).
         """
+        start = time.perf_counter()
         async with cls._get_lock(guild_id=guild.id):
-            await cls._cache_guild_unsafe(guild)
+            invites = await cls._cache_guild_unsafe(guild)
+        fetched = time.perf_counter()
+
+        if invites is None:
+            return
+
+        await cls._persist_snapshot(guild.id, invites)
+        logger.info(
+            f"[InviteTracker] Snapshot for guild {guild.id}: {len(invites)} invites, "
+            f"fetch {(fetched - start) * 1000:.0f}ms, persist {(time.perf_counter() - fetched) * 1000:.0f}ms"
+        )
 
     @classmethod
-    async def _cache_guild_unsafe(cls, guild: discord.Guild):
+    async def _cache_guild_unsafe(cls, guild: discord.Guild) -> list[discord.Invite] | None:
         """
         Internal method to cache invites without acquiring the lock.
         Caller MUST hold the lock before calling this.
+        Returns the fetched invites, or None if they could not be fetched.
         """
         try:
             invites = await guild.invites()
         except discord.Forbidden:
             logger.warning(f"[InviteTracker] Missing 'Manage Guild' permissions for {guild.id}")
-            return
+            return None
         except discord.HTTPException as e:
             logger.error(f"[InviteTracker] Failed to fetch invites for {guild.id}: {e}")
-            return
+            return None
 
         # Build the cache snapshot
         snapshot = {invite.code: invite.uses for invite in invites}
@@ -63,151 +92,259 @@ class InviteTrackerService:
         cls._ready[guild.id] = True
         
         logger.info(f"[InviteTracker] Cached {len(snapshot)} invites for guild {guild.id}")
+        return invites
 
-        # Persist to DB for analytics (optional, but good for history)
-        for invite in invites:
-            await Database.invites().update_one(
-                {"guild_id": guild.id, "code": invite.code},
+    @staticmethod
+    async def _persist_snapshot(guild_id: int, invites: list[discord.Invite]):
+        """Persist a snapshot for analytics/DB-history fallback in one unordered bulk write, pruning stale codes."""
+        operations = [
+            UpdateOne(
+                {"guild_id": guild_id, "code": invite.code},
                 {
-                    "$set": {
-                        "uses": invite.uses,
-                        "inviter_id": invite.inviter.id if invite.inviter else None
-                    }
+                    # $max: this write runs outside the lock, so it may land after a newer join-path write
+                    "$max": {"uses": invite.uses},
+                    "$setOnInsert": {"inviter_id": invite.inviter.id if invite.inviter else None}
                 },
                 upsert=True
             )
+            for invite in invites
+        ]
+        operations.append(
+            DeleteMany({"guild_id": guild_id, "code": {"$nin": [invite.code for invite in invites]}})
+        )
+
+        try:
+            await Database.invites().bulk_write(operations, ordered=False)
+        except Exception as e:
+            logger.error(f"[InviteTracker] Failed to persist invite snapshot for {guild_id}: {e}")
 
     @classmethod
-    async def detect_used_invite(cls, guild: discord.Guild) -> discord.Invite | None:
+    def enqueue_join(cls, member: discord.Member, client: discord.Client):
         """
-        Diff the cache snapshot against current invites to find which
-        invite was just used. Returns the used Invite or None.
-        
+        Queue a join for coalesced invite detection.
+        Joins arriving within JOIN_COALESCE_WINDOW_SECONDS of each other share one invites fetch
+        and are processed together by _drain_joins().
+        """
+        guild_id = member.guild.id
+        cls._pending_joins.setdefault(guild_id, []).append(member)
+
+        task = cls._join_tasks.get(guild_id)
+        if task is None or task.done():
+            cls._join_tasks[guild_id] = asyncio.create_task(cls._drain_joins(guild=member.guild, client=client))
+
+    @classmethod
+    async def _drain_joins(cls, guild: discord.Guild, client: discord.Client):
+        """Process queued joins for a guild in windows until the queue stays empty."""
+        while cls._pending_joins.get(guild.id):
+            await asyncio.sleep(cls.JOIN_COALESCE_WINDOW_SECONDS)
+            try:
+                async with cls._get_lock(guild_id=guild.id):
+                    members = cls._pending_joins.pop(guild.id, [])
+                    if not members:
+                        continue
+                    used_invites = await cls._attribute_joins(guild=guild, count=len(members))
+
+                joins = [
+                    (member, await cls._resolve_inviter(member=member, invite=invite, client=client))
+                    for member, invite in zip(members, used_invites)
+                ]
+                await cls.process_join_batch(guild=guild, joins=joins)
+            except Exception as e:
+                logger.error(f"[InviteTracker] Failed to process join batch for {guild.id}: {e}")
+
+    @classmethod
+    async def _attribute_joins(cls, guild: discord.Guild, count: int) -> list[discord.Invite | None]:
+        """
+        Fetch invites once and hand out the use deltas to `count` pending joiners, in join order.
+        Returns one Invite (or None when unattributed) per joiner.
+
+        Discord does not say which joiner used which invite, so when several invites were used in
+        the same window the pairing is best-effort; the number of uses credited per invite is exact.
+
         CRITICAL: This assumes the caller holds the guild lock!
         """
         try:
             new_invites = await guild.invites()
         except discord.Forbidden:
             logger.warning(f"[InviteTracker] Cannot fetch invites for guild {guild.id} (Permission Log)")
-            return None
+            return [None] * count
         except discord.HTTPException:
-            return None
+            return [None] * count
 
         # If cache IS ready, use in-memory diff (fast)
         if cls.is_ready(guild.id):
-            old_snapshot = cls._cache.get(guild.id, {})
-            used_invite = None
-            
-            for invite in new_invites:
-                old_uses = old_snapshot.get(invite.code, 0)
-                if invite.uses > old_uses:
-                    used_invite = invite
-                    break
-
+            baseline = cls._cache.get(guild.id, {})
         else:
             # Cache NOT ready (Bot restart, race condition).
             # Attempt "Smart Panic Fetch": Compare API vs DB (Last Known State)
             logger.info(f"[InviteTracker] Cache not ready for {guild.id}. comparing vs DB history...")
-            
-            used_invite = None
-            # Fetch all stored invites for this guild
             cursor = Database.invites().find({"guild_id": guild.id})
-            db_snapshot = {doc["code"]: doc["uses"] async for doc in cursor}
-            
-            if not db_snapshot:
+            baseline = {doc["code"]: doc["uses"] async for doc in cursor}
+
+            if not baseline:
                 # First run ever, no history. Cannot detect.
                 logger.warning(f"[InviteTracker] No DB history for {guild.id}, cannot detect invite.")
-                used_invite = None
-            else:
-                for invite in new_invites:
-                    old_uses = db_snapshot.get(invite.code, 0)
-                    if invite.uses > old_uses:
-                        logger.info(f"[InviteTracker] Detected used invite via DB history: {invite.code} ({old_uses} -> {invite.uses})")
-                        used_invite = invite
-                        break
-        
+
+        # One slot per new use of each invite
+        slots: list[discord.Invite] = []
+        if baseline:
+            for invite in new_invites:
+                delta = invite.uses - baseline.get(invite.code, 0)
+                if delta > 0:
+                    slots.extend([invite] * delta)
+
+        if len(slots) != count:
+            logger.info(f"[InviteTracker] {len(slots)} invite uses for {count} joins in guild {guild.id}")
+
         # Update cache with new state immediately
         cls._cache[guild.id] = {inv.code: inv.uses for inv in new_invites}
         cls._ready[guild.id] = True
-        
-        # Persist new state to DB
-        if used_invite:
-            await Database.invites().update_one(
-                {"guild_id": guild.id, "code": used_invite.code},
-                {
-                    "$set": {
-                        "uses": used_invite.uses,
-                        "inviter_id": used_invite.inviter.id if used_invite.inviter else None
-                    }
-                },
-                upsert=True
-            )
-            
-        return used_invite
+
+        # Persist new state of the used invites to DB
+        used = {invite.code: invite for invite in slots}
+        if used:
+            try:
+                await Database.invites().bulk_write(
+                    [
+                        UpdateOne(
+                            {"guild_id": guild.id, "code": invite.code},
+                            {
+                                "$max": {"uses": invite.uses},
+                                "$setOnInsert": {"inviter_id": invite.inviter.id if invite.inviter else None}
+                            },
+                            upsert=True
+                        )
+                        for invite in used.values()
+                    ],
+                    ordered=False
+                )
+            except Exception as e:
+                logger.error(f"[InviteTracker] Failed to persist used invites for {guild.id}: {e}")
+
+        return (slots + [None] * count)[:count]
 
     @classmethod
-    async def process_join(
+    async def _resolve_inviter(
             cls,
             member: discord.Member,
-            inviter: discord.Member | discord.User | None,
+            invite: discord.Invite | None,
+            client: discord.Client,
+    ) -> discord.Member | discord.User | None:
+        guild = member.guild
+
+        if invite:
+            # We found a specific invite!
+            if invite.inviter:
+                return guild.get_member(invite.inviter.id) or invite.inviter
+            logger.warning(f"[InviteTracker] Invite {invite.code} has no inviter (vanity/server discovery?)")
+            return None
+
+        # Fallback: Invite unknown (race condition, bot restart, etc.)
+        # Check if this is a rejoin to recover original inviter
+        join_data = await cls.get_join_data(member.id, guild.id)
+        if not join_data:
+            logger.warning(f"[InviteTracker] Unknown invite for {member.id} in {guild.id}")
+            return None
+
+        logger.info(f"[InviteTracker] {member.id} rejoined {guild.id} (Invite unknown/expired)")
+        inviter_id = join_data.get("inviter_id")
+        if not inviter_id:
+            return None
+        try:
+            return guild.get_member(inviter_id) or await client.fetch_user(inviter_id)
+        except discord.NotFound:
+            return None
+
+    @classmethod
+    async def process_join_batch(
+            cls,
             guild: discord.Guild,
+            joins: list[tuple[discord.Member, discord.Member | discord.User | None]],
     ) -> None:
+        """
+        Record, reward and log a batch of (member, inviter) joins.
+        Join records go out in one bulk write; rewards are aggregated per inviter.
+        """
         # Prevent self-invite edge case
-        if inviter and member.id == inviter.id:
+        joins = [(member, inviter) for member, inviter in joins if not (inviter and member.id == inviter.id)]
+        if not joins:
             return
 
-        # Atomic upsert: only insert if this (user, guild) pair doesn't exist yet.
-        update_data = {
-            "user_id": member.id,
-            "guild_id": guild.id,
-            "timestamp": datetime.datetime.utcnow(),
-        }
-        if inviter:
-            update_data["inviter_id"] = inviter.id
-
-        result = await Database.invite_joins().update_one(
-            {"user_id": member.id, "guild_id": guild.id},
-            {
-                "$setOnInsert": update_data
-            },
-            upsert=True,
+        # Atomic upserts: only insert if this (user, guild) pair doesn't exist yet.
+        operations = []
+        for member, inviter in joins:
+            update_data = {
+                "user_id": member.id,
+                "guild_id": guild.id,
+                "timestamp": datetime.datetime.utcnow(),
+            }
+            if inviter:
+                update_data["inviter_id"] = inviter.id
+            operations.append(
+                UpdateOne({"user_id": member.id, "guild_id": guild.id}, {"$setOnInsert": update_data}, upsert=True)
+            )
+
+        try:
+            result = await Database.invite_joins().bulk_write(operations, ordered=False)
+            inserted = set(result.upserted_ids)
+        except BulkWriteError as e:
+            # A concurrent upsert of the same member loses with a duplicate key: treat it as a rejoin
+            inserted = {upsert["index"] for upsert in e.details.get("upserted", [])}
+
+        # Check which ones are rejoins
+        rejoins = [index not in inserted for index in range(len(joins))]
+
+        # Keep the per-inviter counters in step with the recorded joins
+        counts = await cls._update_invite_counts(
+            guild_id=guild.id,
+            new_joins=[inviter.id for (_, inviter), is_rejoin in zip(joins, rejoins) if inviter and not is_rejoin],
+            inviter_ids={inviter.id for _, inviter in joins if inviter},
         )
+        for (member, _), is_rejoin in zip(joins, rejoins):
+            if is_rejoin:
+                logger.info(f"[InviteTracker] Rejoin detected for {member.id} in {guild.id}, skipping rewards.")
+
+        # --- Rewards (only for new joins AND if inviter known), once per inviter ---
+        new_joins_by_inviter: dict[int, list] = {}
+        for (member, inviter), is_rejoin in zip(joins, rejoins):
+            if is_rejoin:
+                continue
+            if inviter:
+                new_joins_by_inviter.setdefault(inviter.id, [inviter, 0])[1] += 1
+            else:
+                logger.warning(f"[InviteTracker] Unknown inviter for {member.id} in {guild.id}, skipping rewards.")
 
-        # Check if this is a rejoin
-        is_rejoin = result.upserted_id is None
+        seller_role = await GuildSettingService.get_seller_role(guild=guild)
+        # Structure: { inviter_id: has_seller_role }
+        seller_inviters: dict[int, bool] = {}
 
-        if is_rejoin:
-            logger.info(f"[InviteTracker] Rejoin detected for {member.id} in {guild.id}, skipping rewards.")
-        else:
-            # --- Rewards (only for new joins AND if inviter known) ---
+        async def _reward(inviter: discord.Member | discord.User, joins_count: int):
             try:
-                if inviter:
-                    seller_role = await GuildSettingService.get_seller_role(guild=guild)
-
-                    # Try to get inviter as member to check roles
-                    inviter_member = guild.get_member(inviter.id)
-                    if not inviter_member:
-                        # Try fetching if not in cache
-                        try:
-                            inviter_member = await guild.fetch_member(inviter.id)
-                        except discord.NotFound:
-                            inviter_member = None
-
-                    has_seller_role = inviter_member and seller_role in inviter_member.roles
-
-                    if has_seller_role:
-                        await ReputationService.add_rep(user_id=inviter.id, guild=guild)
-                    else:
-                         await EconomyService.modify_tokens(
-                            user_id=inviter.id, amount=10, reason="Invite Reward", actor_id=inviter.id
-                        )
-
-                    await XPService.add_xp(user_id=inviter.id, amount=50, source="Invite reward")
+                # Try to get inviter as member to check roles
+                inviter_member = guild.get_member(inviter.id)
+                if not inviter_member:
+                    # Try fetching if not in cache
+                    try:
+                        inviter_member = await guild.fetch_member(inviter.id)
+                    except discord.NotFound:
+                        inviter_member = None
+
+                has_seller_role = bool(inviter_member and seller_role in inviter_member.roles)
+                seller_inviters[inviter.id] = has_seller_role
+
+                if has_seller_role:
+                    await ReputationService.add_rep(user_id=inviter.id, guild=guild, reputation_amount=joins_count)
                 else:
-                    logger.warning(f"[InviteTracker] Unknown inviter for {member.id} in {guild.id}, skipping rewards.")
+                    await EconomyService.modify_tokens(
+                        user_id=inviter.id, amount=10 * joins_count, reason="Invite Reward", actor_id=inviter.id
+                    )
+
+                await XPService.add_xp(user_id=inviter.id, amount=50 * joins_count, source="Invite reward")
             except Exception as e:
                 logger.error(f"[InviteTracker] Error giving rewards: {e}")
 
+        await asyncio.gather(*(_reward(inviter, n) for inviter, n in new_joins_by_inviter.values()))
+
         # --- Logging ---
         guild_settings = await GuildSettingService.get_guild_settings(guild=guild)
         if not guild_settings:
@@ -221,14 +358,121 @@ class InviteTrackerService:
         if not log_channel:
              return
 
-        if inviter:
-            count = await Database.invite_joins().count_documents(
-                {"guild_id": guild.id, "inviter_id": inviter.id}
+        embeds = [
+            cls._build_join_embed(
+                member=member,
+                inviter=inviter,
+                guild=guild,
+                is_rejoin=is_rejoin,
+                count=counts.get(inviter.id, 0) if inviter else 0,
+                has_seller_role=seller_inviters.get(inviter.id, False) if inviter else False,
             )
-        else:
-            count = 0
+            for (member, inviter), is_rejoin in zip(joins, rejoins)
+        ]
+
+        # Discord allows up to 10 embeds per message
+        for i in range(0, len(embeds), 10):
+            try:
+                await log_channel.send(embeds=embeds[i:i + 10])
+            except Exception as e:
+                 logger.error(f"[InviteTracker] Failed to send log: {e}")
+
+    @classmethod
+    async def _update_invite_counts(cls, guild_id: int, new_joins: list[int], inviter_ids: set[int]) -> dict[int, int]:
+        """
+        $inc the materialized (guild, inviter) counters by the new joins of a batch (the join upserts
+        that actually inserted), then read back the totals of every inviter in it. Returns { inviter_id: total }.
+        If the $inc fails the joins are already recorded, so the affected counters are rebuilt from
+        invites_joins instead (an idempotent $set, safe to retry, unlike the $inc).
+        """
+        increments: dict[int, int] = {}
+        for inviter_id in new_joins:
+            increments[inviter_id] = increments.get(inviter_id, 0) + 1
+
+        if increments:
+            try:
+                await Database.invite_counts().bulk_write(
+                    [
+                        UpdateOne(
+                            {"guild_id": guild_id, "inviter_id": inviter_id},
+                            {"$inc": {"total": amount}},
+                            upsert=True
+                        )
+                        for inviter_id, amount in increments.items()
+                    ],
+                    ordered=False
+                )
+            except Exception as e:
+                logger.warning(f"[InviteTracker] Counter update failed for {guild_id}, rebuilding from joins: {e}")
+                await cls.rebuild_invite_counts(guild_id=guild_id, inviter_ids=set(increments))
+
+        if not inviter_ids:
+            return {}
+        try:
+            cursor = Database.invite_counts().find(
+                {"guild_id": guild_id, "inviter_id": {"$in": list(inviter_ids)}},
+                {"inviter_id": 1, "total": 1}
+            )
+            return {doc["inviter_id"]: doc["total"] async for doc in cursor}
+        except Exception as e:
+            logger.error(f"[InviteTracker] Failed to read invite counters for {guild_id}: {e}")
+            return {}
+
+    @classmethod
+    async def rebuild_invite_counts(cls, guild_id: int, inviter_ids: set[int] = None) -> bool:
+        """Recompute counters from invites_joins (all inviters of the guild if none given). Returns success."""
+        match = {"guild_id": guild_id, "inviter_id": {"$ne": None}}
+        if inviter_ids:
+            match["inviter_id"] = {"$in": list(inviter_ids)}
+        pipeline = [
+            {"$match": match},
+            {"$group": {"_id": "$inviter_id", "total": {"$sum": 1}}},
+        ]
+
+        for attempt in range(1, cls.COUNTS_REBUILD_ATTEMPTS + 1):
+            try:
+                totals = {row["_id"]: row["total"] async for row in Database.invite_joins().aggregate(pipeline)}
+                # Inviters with no recorded joins left go back to 0
+                for inviter_id in inviter_ids or ():
+                    totals.setdefault(inviter_id, 0)
+                if totals:
+                    await Database.invite_counts().bulk_write(
+                        [
+                            UpdateOne(
+                                {"guild_id": guild_id, "inviter_id": inviter_id},
+                                {"$set": {"total": total}},
+                                upsert=True
+                            )
+                            for inviter_id, total in totals.items()
+                        ],
+                        ordered=False
+                    )
+                return True
+            except Exception as e:
+                logger.error(f"[InviteTracker] Counter rebuild attempt {attempt} failed for {guild_id}: {e}")
+                await asyncio.sleep(attempt)
+        return False
 
-        # Build embed
+    @staticmethod
+    async def get_invite_leaderboard(guild_id: int, limit: int = 10) -> list[dict]:
+        """Top inviters of a guild, read straight from the counter collection."""
+        cursor = (
+            Database.invite_counts()
+            .find({"guild_id": guild_id, "total": {"$gt": 0}}, {"_id": 0, "inviter_id": 1, "total": 1})
+            .sort("total", -1)
+            .limit(limit)
+        )
+        return await cursor.to_list(length=limit)
+
+    @staticmethod
+    def _build_join_embed(
+            member: discord.Member,
+            inviter: discord.Member | discord.User | None,
+            guild: discord.Guild,
+            is_rejoin: bool,
+            count: int,
+            has_seller_role: bool,
+    ) -> discord.Embed:
         if is_rejoin:
             desc = f"{member.mention} rejoined"
             if inviter:
@@ -244,55 +488,46 @@ class InviteTrackerService:
             if inviter:
                 embed.add_field(name="Inviter Total", value=f"**{count}** total invites", inline=True)
             embed.add_field(name="Note", value="No rewards given for rejoins", inline=True)
+            return embed
 
-        else:
-            # New join
-            try:
-                if inviter:
-                    desc = f"{member.mention} joined using {inviter.mention}'s invite!"
-                    embed = discord.Embed(
-                        title="🎉 New Invite Join",
-                        description=desc,
-                        color=discord.Color.green(),
-                    )
-
-                    # Build reward message string
-                    reward_message = ""
-                    inviter_member = guild.get_member(inviter.id)
-                    has_seller_role = inviter_member and seller_role in inviter_member.roles
-
-                    if has_seller_role:
-                        emoji = GuildSettingService.get_server_emoji(emoji_id=int(Emoji.BLUE_STAR.value), guild=guild)
-                        reward_message = f"{emoji or '🔮'} +1 reputation!"
-                    else:
-                        emoji = GuildSettingService.get_server_emoji(emoji_id=int(Emoji.SHOP_TOKEN.value), guild=guild)
-                        reward_message = f"{emoji or '🪙'} 10 Shop Tokens"
-
-                    # xp_emoji = GuildSettingService.get_server_emoji(emoji_id=int(Emoji.XP.value), guild=guild)
-                    xp_emoji = None
-                    reward_message += f"\n{xp_emoji or '⭐'} +50 XP"
-
-                    embed.add_field(name="Inviter Total", value=f"**{count}** total invites", inline=True)
-                    embed.add_field(name="Invite Reward", value=reward_message, inline=True)
+        # New join
+        try:
+            if inviter:
+                desc = f"{member.mention} joined using {inviter.mention}'s invite!"
+                embed = discord.Embed(
+                    title="🎉 New Invite Join",
+                    description=desc,
+                    color=discord.Color.green(),
+                )
+
+                # Build reward message string
+                if has_seller_role:
+                    emoji = GuildSettingService.get_server_emoji(emoji_id=int(Emoji.BLUE_STAR.value), guild=guild)
+                    reward_message = f"{emoji or '🔮'} +1 reputation!"
                 else:
-                    # Unknown inviter (e.g. vanity, bot restart race condition)
-                    embed = discord.Embed(
-                        title="👋 New Member Joined",
-                        description=f"{member.mention} joined the server.",
-                        color=discord.Color.light_grey(),
-                    )
-                    embed.add_field(name="Invite Info", value="Unknown (Bot restart or Vanity URL)", inline=True)
-            except Exception as e:
-                logger.error(f"[InviteTracker] Error building log embed for new join: {e}")
-                # Fallback embed
-                embed = discord.Embed(title="Member Joined", description=f"{member.mention} joined.", color=discord.Color.red())
-                embed.add_field(name="Error", value="Could not build full log message")
+                    emoji = GuildSettingService.get_server_emoji(emoji_id=int(Emoji.SHOP_TOKEN.value), guild=guild)
+                    reward_message = f"{emoji or '🪙'} 10 Shop Tokens"
 
-        try:
-            await log_channel.send(embed=embed)
-        except Exception as e:
-             logger.error(f"[InviteTracker] Failed to send log: {e}")
+                # xp_emoji = GuildSettingService.get_server_emoji(emoji_id=int(Emoji.XP.value), guild=guild)
+                xp_emoji = None
+                reward_message += f"\n{xp_emoji or '⭐'} +50 XP"
 
+                embed.add_field(name="Inviter Total", value=f"**{count}** total invites", inline=True)
+                embed.add_field(name="Invite Reward", value=reward_message, inline=True)
+            else:
+                # Unknown inviter (e.g. vanity, bot restart race condition)
+                embed = discord.Embed(
+                    title="👋 New Member Joined",
+                    description=f"{member.mention} joined the server.",
+                    color=discord.Color.light_grey(),
+                )
+                embed.add_field(name="Invite Info", value="Unknown (Bot restart or Vanity URL)", inline=True)
+        except Exception as e:
+            logger.error(f"[InviteTracker] Error building log embed for new join: {e}")
+            # Fallback embed
+            embed = discord.Embed(title="Member Joined", description=f"{member.mention} joined.", color=discord.Color.red())
+            embed.add_field(name="Error", value="Could not build full log message")
+        return embed
 
     @staticmethod
     async def get_join_data(user_id: int, guild_id: int):
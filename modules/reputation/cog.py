@@ -2,7 +2,6 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
-from core.database import Database
 from modules.guild.service import GuildSettingService
 from modules.reputation.service import ReputationService
 
@@ -63,10 +62,9 @@ class Reputation(commands.Cog):
     @app_commands.describe(channel="Mention a channel where you want the reputation to work")
     async def rep_channel(self, interaction: discord.Interaction, channel: discord.TextChannel):
         await interaction.response.defer(ephemeral=True)
-        result = await Database.guild_settings().update_one(
-            {"guild_id": interaction.guild.id},
-            {"$set": {"rep_channel": channel.id}},
-            upsert=True
+        result = await GuildSettingService.update_guild_settings(
+            interaction.guild.id,
+            {"rep_channel": channel.id}
         )
 
         if result.acknowledged:
@@ -92,10 +90,9 @@ class Reputation(commands.Cog):
     @app_commands.checks.has_permissions(administrator=True)
     async def set_rep_log_channel(self, interaction: discord.Interaction, channel: discord.TextChannel):
         await interaction.response.defer(ephemeral=True)
-        result = await Database.guild_settings().update_one(
-            {"guild_id": interaction.guild.id},
-            {"$set": {"rep_log_channel": channel.id}},
-            upsert=True
+        result = await GuildSettingService.update_guild_settings(
+            interaction.guild.id,
+            {"rep_log_channel": channel.id}
         )
         if result.acknowledged:
             await interaction.followup.send(f"{channel.mention} reputation logs channel updated.", ephemeral=True)
@@ -15,6 +15,24 @@ from modules.xp.services import XPService
 class ReputationService:
     COOLDOWN_SECONDS = 60 * 60 * 24
 
+    TIERS_CACHE_TTL_SECONDS = 300
+
+    # Tier cache. Structure: { guild_id: (expires_at, [ReputationTier sorted by threshold]) }
+    # Invalidated by save_reputation_tier/remove_reputation_tier
+    _tiers: dict[int, tuple[float, list[ReputationTier]]] = {}
+
+    @classmethod
+    async def get_tiers(cls, guild_id: int) -> list[ReputationTier]:
+        """Configured reputation tiers for a guild, ascending by threshold."""
+        cached = cls._tiers.get(guild_id)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        cursor = Database.reputations_tier().find({"guild_id": guild_id}).sort("threshold", 1)
+        tiers = [ReputationTier(**doc) async for doc in cursor]
+        cls._tiers[guild_id] = (time.monotonic() + cls.TIERS_CACHE_TTL_SECONDS, tiers)
+        return tiers
+
     @staticmethod
     async def reputation(message: discord.Message):
 
@@ -43,7 +61,6 @@ class ReputationService:
             await message.reply("You can not rep yourself!")
             return
 
-        guild_settings = await GuildSettingService.get_guild_settings(guild=guild)
         logger.debug(f"Guild settings: {guild_settings}")
         seller_role = guild.get_role(guild_settings.seller_role_id)
         logger.debug(f"Seller role: {seller_role}")
@@ -174,12 +191,10 @@ class ReputationService:
             return # User not in guild anymore? Ghost! 👻
 
         # 3. Get all configured tiers for this guild
-        cursor = Database.reputations_tier().find({"guild_id": guild.id}).sort("threshold", 1)
-        tiers = await cursor.to_list(length=None)
+        tiers = await ReputationService.get_tiers(guild_id=guild.id)
 
         # 4. Iterate and Award/Revoke
-        for tier_doc in tiers:
-            tier = ReputationTier(**tier_doc)
+        for tier in tiers:
             role = guild.get_role(tier.role_id)
             
             if not role:
@@ -253,11 +268,13 @@ class ReputationService:
             {"$set": rep.to_mongo() },
             upsert=True
         )
+        ReputationService._tiers.pop(guild_id, None)
         return result.acknowledged
 
     @staticmethod
     async def remove_reputation_tier(role_id: int, guild_id: int) -> bool:
         result = await Database.reputations_tier().delete_one({"guild_id": guild_id, "role_id": role_id})
+        ReputationService._tiers.pop(guild_id, None)
         return result.deleted_count > 0
 
 
@@ -2,6 +2,7 @@ from typing import List, Optional
 from bson import ObjectId
 from core.database import Database
 from modules.shop.models import Category, Item
+from modules.shop.services_catalog import CatalogService
 from loguru import logger
 
 
@@ -12,38 +13,26 @@ class CategoryService:
         result = await Database.categories().insert_one(category.to_mongo())
         category.id = result.inserted_id
         logger.info(f"Created category: {category.name} ({category.id})")
+        await CatalogService.rebuild()
         return category
 
     @staticmethod
     async def get_active_categories(parent_id: Optional[str] = None) -> List[Category]:
         """Fetch active categories, optionally filtered by parent_id."""
-        query = {"is_active": True, "parent_id": parent_id}
-        cursor = Database.categories().find(query).sort("rank", 1)
-        categories = []
-        async for doc in cursor:
-            categories.append(Category(**doc))
-        return categories
+        snapshot = await CatalogService.get_snapshot()
+        return snapshot.get_children(parent_id, active_only=True)
 
     @staticmethod
     async def get_category(category_id: str) -> Optional[Category]:
         """Get a category by ID."""
-        try:
-            doc = await Database.categories().find_one({"_id": ObjectId(category_id)})
-            if doc:
-                return Category(**doc)
-        except Exception:
-            pass
-        return None
+        snapshot = await CatalogService.get_snapshot()
+        return snapshot.get_category(category_id)
 
     @staticmethod
     async def get_all_categories(parent_id: Optional[str] = None) -> List[Category]:
         """Fetch all categories (including inactive), optionally filters by parent_id."""
-        query = {"parent_id": parent_id}
-        cursor = Database.categories().find(query).sort("rank", 1)
-        categories = []
-        async for doc in cursor:
-            categories.append(Category(**doc))
-        return categories
+        snapshot = await CatalogService.get_snapshot()
+        return snapshot.get_children(parent_id, active_only=False)
 
     @staticmethod
     async def update_category(category_id: str, updates: dict) -> bool:
@@ -52,6 +41,7 @@ class CategoryService:
             {"_id": ObjectId(category_id)},
             {"$set": updates}
         )
+        await CatalogService.rebuild()
         return result.modified_count > 0
 
     @staticmethod
@@ -68,27 +58,12 @@ class CategoryService:
         if not category_ids:
             return {}
 
-        stats = {cid: {'items': 0, 'subcats': 0} for cid in category_ids}
-        
-        # 1. Count Items
-        item_pipeline = [
-            {"$match": {"category_id": {"$in": category_ids}}},
-            {"$group": {"_id": "$category_id", "count": {"$sum": 1}}}
-        ]
-        async for doc in Database.items().aggregate(item_pipeline):
-            if doc["_id"] in stats:
-                stats[doc["_id"]]["items"] = doc["count"]
-
-        # 2. Count Subcategories
-        subcat_pipeline = [
-            {"$match": {"parent_id": {"$in": category_ids}}},
-            {"$group": {"_id": "$parent_id", "count": {"$sum": 1}}}
-        ]
-        async for doc in Database.categories().aggregate(subcat_pipeline):
-            if doc["_id"] in stats:
-                stats[doc["_id"]]["subcats"] = doc["count"]
-                
-        return stats
+        # Served from the catalog snapshot, counts are precomputed at build time
+        snapshot = await CatalogService.get_snapshot()
+        return {
+            cid: dict(snapshot.stats.get(cid, {'items': 0, 'subcats': 0}))
+            for cid in category_ids
+        }
 
     @staticmethod
     async def delete_category(category_id: str) -> bool:
@@ -104,6 +79,7 @@ class CategoryService:
             raise ValueError(f"Cannot delete category: Contains {sub_count} subcategories. Delete them first.")
         
         result = await Database.categories().delete_one({"_id": ObjectId(category_id)})
+        await CatalogService.rebuild()
         return result.deleted_count > 0
 
 class ItemService:
@@ -118,31 +94,20 @@ class ItemService:
         result = await Database.items().insert_one(item.to_mongo())
         item.id = result.inserted_id
         logger.info(f"Created item: {item.name} ({item.id})")
+        await CatalogService.rebuild()
         return item
 
     @staticmethod
     async def get_items_by_category(category_id: str, active_only: bool = True) -> List[Item]:
         """Fetch items in a specific category."""
-        query = {"category_id": category_id}
-        if active_only:
-            query["is_active"] = True
-            
-        cursor = Database.items().find(query)
-        items = []
-        async for doc in cursor:
-            items.append(Item(**doc))
-        return items
+        snapshot = await CatalogService.get_snapshot()
+        return snapshot.get_items(category_id, active_only=active_only)
 
     @staticmethod
     async def get_item(item_id: str) -> Optional[Item]:
         """Get an item by ID."""
-        try:
-            doc = await Database.items().find_one({"_id": ObjectId(item_id)})
-            if doc:
-                return Item(**doc)
-        except Exception:
-            pass
-        return None
+        snapshot = await CatalogService.get_snapshot()
+        return snapshot.get_item(item_id)
 
     @staticmethod
     async def update_item(item_id: str, updates: dict) -> bool:
@@ -151,25 +116,20 @@ class ItemService:
             {"_id": ObjectId(item_id)},
             {"$set": updates}
         )
+        await CatalogService.rebuild()
         return result.modified_count > 0
 
     @staticmethod
     async def delete_item(item_id: str) -> bool:
         """Delete an item."""
         result = await Database.items().delete_one({"_id": ObjectId(item_id)})
+        await CatalogService.rebuild()
         return result.deleted_count > 0
 
     @staticmethod
     async def get_all_items(active_only: bool = False) -> List[Item]:
         """Fetch all items across all categories."""
-        query = {}
-        if active_only:
-            query["is_active"] = True
-            
-        cursor = Database.items().find(query)
-        items = []
-        async for doc in cursor:
-            items.append(Item(**doc))
-        return items
+        snapshot = await CatalogService.get_snapshot()
+        return snapshot.get_all_items(active_only=active_only)
 
 
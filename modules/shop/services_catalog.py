@@ -0,0 +1,103 @@
+import asyncio
+import time
+from types import MappingProxyType
+from typing import Optional
+
+from loguru import logger
+
+from core.database import Database
+from modules.shop.models import Category, Item
+
+
+class CatalogSnapshot:
+    """
+    Immutable in-memory view of the whole catalog (active and inactive).
+    Built in one pass from two queries; never mutated, only replaced by CatalogService.rebuild().
+    Lookups are plain dict/tuple accesses.
+    """
+
+    def __init__(self, version: int, categories: list[Category], items: list[Item]):
+        self.version = version
+        self.built_at = time.time()
+
+        self.categories_by_id = MappingProxyType({str(c.id): c for c in categories})
+        self.items_by_id = MappingProxyType({str(i.id): i for i in items})
+
+        # Category tree: { parent_id: (children sorted by rank) }
+        children: dict[Optional[str], list[Category]] = {}
+        for category in sorted(categories, key=lambda c: c.rank):
+            children.setdefault(category.parent_id, []).append(category)
+        self.children = MappingProxyType({pid: tuple(cats) for pid, cats in children.items()})
+
+        items_by_category: dict[str, list[Item]] = {}
+        for item in items:
+            items_by_category.setdefault(item.category_id, []).append(item)
+        self.items_by_category = MappingProxyType({cid: tuple(its) for cid, its in items_by_category.items()})
+
+        # Same semantics as the old aggregation: counts include inactive entries
+        self.stats = MappingProxyType({
+            cid: {
+                'items': len(self.items_by_category.get(cid, ())),
+                'subcats': len(self.children.get(cid, ())),
+            }
+            for cid in self.categories_by_id
+        })
+
+    def get_category(self, category_id: str) -> Optional[Category]:
+        return self.categories_by_id.get(str(category_id)) if category_id else None
+
+    def get_item(self, item_id: str) -> Optional[Item]:
+        return self.items_by_id.get(str(item_id)) if item_id else None
+
+    def get_children(self, parent_id: Optional[str], active_only: bool = True) -> list[Category]:
+        categories = self.children.get(parent_id, ())
+        if active_only:
+            return [c for c in categories if c.is_active]
+        return list(categories)
+
+    def get_items(self, category_id: str, active_only: bool = True) -> list[Item]:
+        items = self.items_by_category.get(category_id, ())
+        if active_only:
+            return [i for i in items if i.is_active]
+        return list(items)
+
+    def get_all_items(self, active_only: bool = False) -> list[Item]:
+        if active_only:
+            return [i for i in self.items_by_id.values() if i.is_active]
+        return list(self.items_by_id.values())
+
+
+class CatalogService:
+    """Holds the current CatalogSnapshot. Admin writes in CategoryService/ItemService call rebuild()."""
+    _snapshot: CatalogSnapshot | None = None
+    _version: int = 0
+    _lock: asyncio.Lock = asyncio.Lock()
+
+    @classmethod
+    async def get_snapshot(cls) -> CatalogSnapshot:
+        if cls._snapshot is None:
+            async with cls._lock:
+                # Another caller may have built it while we waited
+                if cls._snapshot is None:
+                    await cls._build()
+        return cls._snapshot
+
+    @classmethod
+    async def rebuild(cls) -> CatalogSnapshot:
+        """Reload the catalog from the DB and atomically swap in a new snapshot."""
+        async with cls._lock:
+            await cls._build()
+        return cls._snapshot
+
+    @classmethod
+    async def _build(cls):
+        start = time.perf_counter()
+        categories = [Category(**doc) async for doc in Database.categories().find({})]
+        items = [Item(**doc) async for doc in Database.items().find({})]
+
+        cls._version += 1
+        cls._snapshot = CatalogSnapshot(version=cls._version, categories=categories, items=items)
+        logger.info(
+            f"[Catalog] Built snapshot v{cls._version}: {len(categories)} categories, {len(items)} items "
+            f"in {(time.perf_counter() - start) * 1000:.1f}ms"
+        )
@@ -8,7 +8,7 @@ from modules.guild.service import GuildSettingService
 from modules.shop.models import Category, Item
 from modules.shop.services import CategoryService, ItemService
 from modules.tickets.models import Ticket
-from modules.tickets.services import TicketService
+from modules.tickets.services_queue import TicketCreationQueueService
 from modules.tickets.ui import TicketControlView
 
 PAGE_SIZE = 20
@@ -292,11 +292,7 @@ class ShopItemView(View):
     async def buy_now(self, interaction: discord.Interaction, button: Button):
         await interaction.response.send_message("Opening ticket...", ephemeral=True)
         try:
-            ticket, status = await TicketService.create_ticket(
-                interaction.user,
-                interaction.guild,
-                self.item
-            )
+            ticket, status = await TicketCreationQueueService.submit(interaction=interaction, item=self.item)
 
             if status == "exists":
                 channel = interaction.guild.get_channel(ticket.channel_id)
@@ -306,6 +302,10 @@ class ShopItemView(View):
                 )
                 return
 
+            if not ticket:
+                await interaction.followup.send(TicketCreationQueueService.failure_message(status), ephemeral=True)
+                return
+
             channel = interaction.guild.get_channel(ticket.channel_id)
 
             if channel:
@@ -420,10 +420,9 @@ class ItemOrderButton(Button):
             category_path = category.name if category else "Unknown"
 
             # Create ticket directly
-            ticket, status = await TicketService.create_ticket(
-                interaction.user,
-                interaction.guild,
-                item,
+            ticket, status = await TicketCreationQueueService.submit(
+                interaction=interaction,
+                item=item,
                 category_path=f"{category_path} > {item.name}",
                 message_id=interaction.message.id
             )
@@ -435,6 +434,10 @@ class ItemOrderButton(Button):
                 )
                 return
 
+            if not ticket:
+                await interaction.followup.send(TicketCreationQueueService.failure_message(status), ephemeral=True)
+                return
+
             channel = interaction.guild.get_channel(ticket.channel_id)
 
             if channel:
@@ -596,10 +599,9 @@ class EphemeralItemView(View):
         try:
             # Create ticket with category path context
             category_context = " > ".join(self.category_path + [self.item.name])
-            ticket, status = await TicketService.create_ticket(
-                interaction.user,
-                interaction.guild,
-                self.item,
+            ticket, status = await TicketCreationQueueService.submit(
+                interaction=interaction,
+                item=self.item,
                 category_path=category_context
             )
             if status == "exists":
@@ -610,6 +612,10 @@ class EphemeralItemView(View):
                 )
                 return
 
+            if not ticket:
+                await interaction.followup.send(TicketCreationQueueService.failure_message(status), ephemeral=True)
+                return
+
             channel = interaction.guild.get_channel(ticket.channel_id)
 
             if channel:
@@ -1,9 +1,17 @@
 import discord
+from bson import ObjectId
 from discord.ext import commands
 from discord import app_commands
 from loguru import logger
-from modules.tickets.ui import get_ticket_settings_embed, TicketSettingsView, TicketControlView, TicketClosedView, \
-    EmbedJsonModal, ShopPanelView
+from modules.tickets.services import TicketService
+from modules.tickets.services_archive import TranscriptArchiveService
+from modules.tickets.services_logs import TicketLogBufferService
+from modules.tickets.services_messages import TicketMessageLogService
+from modules.tickets.services_pool import TicketChannelPoolService
+from modules.tickets.services_queue import TicketCreationQueueService
+from modules.tickets.services_transcripts import TranscriptWorkerService
+from modules.tickets.ui import get_ticket_settings_embed, TicketSettingsView, EmbedJsonModal, ShopPanelView, \
+    TICKET_DYNAMIC_ITEMS
 
 
 class TicketsCog(commands.Cog):
@@ -12,32 +20,35 @@ class TicketsCog(commands.Cog):
 
     async def cog_load(self) -> None:
         logger.info(f"Loading {TicketsCog.__name__}")
-        from modules.tickets.services import TicketService
-        tickets = await TicketService.get_all_tickets()
-        count = 0
-        for ticket in tickets:
-            if not ticket.status == "deleted":
-                view = TicketControlView(ticket_id=str(ticket.id), claimed_by=ticket.claimed_by)
-                count += 1
-                closed_view = TicketClosedView(ticket_id=str(ticket.id), root_view=view)
-                self.bot.add_view(view)
-                self.bot.add_view(closed_view)
+
+        # One handler per control type; the ticket id is parsed from each button's custom_id
+        self.bot.add_dynamic_items(*TICKET_DYNAMIC_ITEMS)
 
         # Register persistent ShopPanelView
         self.bot.add_view(ShopPanelView())
-        
-        logger.info(f"Loaded {count} tickets")
+
+        open_count = await TicketService.load_open_channels()
+        logger.info(f"Registered {len(TICKET_DYNAMIC_ITEMS)} ticket control handlers ({open_count} open ticket channels)")
+
+        TicketMessageLogService.start()
+        await TranscriptWorkerService.start(bot=self.bot)
+        TicketChannelPoolService.start(bot=self.bot)
+        TicketLogBufferService.start()
+
+    async def cog_unload(self) -> None:
+        self.bot.remove_dynamic_items(*TICKET_DYNAMIC_ITEMS)
+        await TicketChannelPoolService.stop()
+        await TicketLogBufferService.stop()
+        await TranscriptWorkerService.stop()
+        await TicketMessageLogService.stop()
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
         if message.author.bot:
             return
 
-        # Log message if it's in a ticket channel
-        # Optimization: We should cache ticket channel IDs to avoid DB hit every msg
-        # keeping it simple for now as per "Core Foundation"
-        if isinstance(message.channel, discord.TextChannel) and message.channel.name.startswith("ticket-"):
-            from modules.tickets.services import TicketService
+        # Log message if it's in an open ticket channel (in-memory registry, no DB hit)
+        if TicketService.is_open_ticket_channel(message.channel.id):
             await TicketService.log_message(message.channel.id, message)
 
     @app_commands.command(name="ticket_panel", description="Manager ticket settings")
@@ -54,7 +65,6 @@ class TicketsCog(commands.Cog):
     @app_commands.checks.has_permissions(administrator=True)
     @app_commands.describe(channel="Mention a channel where to post ticket", button_name="Button name of the ticket")
     async def create_ticket(self, interaction: discord.Interaction, channel: discord.TextChannel, button_name: str, emoji: str):
-        from modules.tickets.services import TicketService
         modal = EmbedJsonModal(
             title="Ticket Creation",
             channel=channel,
@@ -69,7 +79,6 @@ class TicketsCog(commands.Cog):
     @app_commands.checks.has_permissions(administrator=True)
     @app_commands.describe(channel="Mention a channel where to post directory")
     async def create_directory(self, interaction: discord.Interaction, channel: discord.TextChannel):
-        from modules.tickets.services import TicketService
         modal = EmbedJsonModal(
             title="Directory Creation",
             channel=channel,
@@ -84,7 +93,6 @@ class TicketsCog(commands.Cog):
     @app_commands.checks.has_permissions(administrator=True)
     @app_commands.describe(channel="Channel to post the shop panel")
     async def create_shop_panel(self, interaction: discord.Interaction, channel: discord.TextChannel, button_name: str = "Open Shop",emoji: str ="🛒"):
-        from modules.tickets.services import TicketService
         modal = EmbedJsonModal(
             title="Shop Panel Creation",
             channel=channel,
@@ -98,49 +106,117 @@ class TicketsCog(commands.Cog):
     @app_commands.command(name="ticket_complete", description="Mark the ticket as completed")
     @app_commands.guild_only()
     async def ticket_complete(self, interaction: discord.Interaction):
-        from modules.tickets.services import TicketService
-        from modules.tickets.ui import TicketControlView
-        ticket = await TicketService.get_ticket_by_channel(interaction.channel_id)
-
-        view = TicketControlView(ticket_id= str(ticket.id))
-        await TicketService.complete_order(interaction=interaction, root_view= view)
+        await TicketService.complete_order(interaction=interaction)
 
     @app_commands.command(name="ticket_close", description="Close a ticket")
     @app_commands.guild_only()
     async def ticket_close(self, interaction: discord.Interaction):
-        from modules.tickets.services import TicketService
-        from modules.tickets.ui import TicketControlView
-        ticket = await TicketService.get_ticket_by_channel(interaction.channel_id)
-
-        view = TicketControlView(ticket_id=str(ticket.id))
-        await TicketService.close_ticket_btn(interaction=interaction, root_view=view)
+        await TicketService.close_ticket_btn(interaction=interaction)
 
     @app_commands.command(name="ticket_claim", description="Claim a ticket")
     @app_commands.guild_only()
     async def ticket_claim(self, interaction: discord.Interaction):
-        from modules.tickets.services import TicketService
-        from modules.tickets.ui import TicketControlView
-        ticket = await TicketService.get_ticket_by_channel(interaction.channel_id)
-
-        view = TicketControlView(ticket_id=str(ticket.id))
-        await TicketService.claim_ticket_func(interaction=interaction, root_view=view, ticket_id=str(ticket.id))
+        await TicketService.claim_ticket_func(interaction=interaction)
 
     @app_commands.command(name="ticket_unclaim", description="Unclaim a ticket")
     @app_commands.guild_only()
     async def ticket_unclaim(self, interaction: discord.Interaction):
-        from modules.tickets.services import TicketService
-        from modules.tickets.ui import TicketControlView
-        ticket = await TicketService.get_ticket_by_channel(interaction.channel_id)
-
-        view = TicketControlView(ticket_id=str(ticket.id))
-        await TicketService.unclaim_ticket_btn(interaction=interaction, root_view=view)
+        await TicketService.unclaim_ticket_btn(interaction=interaction)
 
     @app_commands.command(name="ticket_delete", description="Delete a ticket")
     @app_commands.guild_only()
-    async def ticket_unclaim(self, interaction: discord.Interaction):
-        from modules.tickets.services import TicketService
+    async def ticket_delete(self, interaction: discord.Interaction):
         await TicketService.delete_ticket_btn(interaction=interaction)
 
+    @app_commands.command(name="ticket_transcript", description="Get the archived transcript of a ticket")
+    @app_commands.guild_only()
+    @app_commands.describe(ticket_id="Ticket ID", fmt="html (readable) or ndjson (raw messages)")
+    @app_commands.choices(fmt=[
+        app_commands.Choice(name="html", value="html"),
+        app_commands.Choice(name="ndjson", value="ndjson"),
+    ])
+    async def ticket_transcript(self, interaction: discord.Interaction, ticket_id: str, fmt: str = "html"):
+        await interaction.response.defer(ephemeral=True)
+
+        manager_role = await TicketService.get_ticket_manager_role(guild=interaction.guild)
+        if not (interaction.user.guild_permissions.administrator or manager_role in interaction.user.roles):
+            await interaction.followup.send("Only admin and ticket manager can view transcripts!", ephemeral=True)
+            return
+
+        if not ObjectId.is_valid(ticket_id):
+            await interaction.followup.send("Invalid ticket ID!", ephemeral=True)
+            return
+
+        archived = await TranscriptArchiveService.load(ticket_id=ObjectId(ticket_id), guild_id=interaction.guild_id, fmt=fmt)
+        if not archived:
+            await interaction.followup.send("No archived transcript for this ticket.", ephemeral=True)
+            return
+
+        filename, data = archived
+        await interaction.followup.send(file=discord.File(data, filename=filename), ephemeral=True)
+
+    @app_commands.command(name="ticket_transcript_stats", description="Transcript archive storage usage")
+    @app_commands.guild_only()
+    @app_commands.checks.has_permissions(administrator=True)
+    async def ticket_transcript_stats(self, interaction: discord.Interaction):
+        await interaction.response.defer(ephemeral=True)
+        stats = await TranscriptArchiveService.get_storage_stats(guild_id=interaction.guild_id)
+
+        desc = ""
+        for month in stats["months"][-12:]:
+            desc += f"**{month['month']}** - {month['tickets']:,} tickets, {month['stored_bytes'] / 1024:,.1f} KiB\n"
+
+        embed = discord.Embed(title="🗄️ Transcript Archive", description=desc or "No transcripts archived yet.", color=discord.Color.blurple())
+        embed.add_field(name="Tickets", value=f"{stats['tickets']:,}", inline=True)
+        embed.add_field(name="Stored", value=f"{stats['stored_bytes'] / 1024 / 1024:,.2f} MiB", inline=True)
+        embed.add_field(name="Compression", value=f"{stats['ratio']:.1f}x", inline=True)
+        await interaction.followup.send(embed=embed, ephemeral=True)
+
+    @app_commands.command(name="ticket_pool", description="Keep pre-created hidden ticket channels for instant tickets")
+    @app_commands.guild_only()
+    @app_commands.checks.has_permissions(administrator=True)
+    @app_commands.describe(size="Channels to keep ready (0 disables the pool)")
+    async def ticket_pool(self, interaction: discord.Interaction, size: app_commands.Range[int, 0, 10]):
+        await interaction.response.defer(ephemeral=True)
+
+        await TicketService.update_ticket_settings(interaction.guild_id, {"channel_pool_size": size})
+        created = await TicketChannelPoolService.replenish(interaction.guild)
+        await interaction.followup.send(
+            f"Ticket channel pool set to **{size}** ({TicketChannelPoolService.available(interaction.guild)} ready, "
+            f"{created} created now; the rest fill in while the queue is quiet).",
+            ephemeral=True
+        )
+
+    @app_commands.command(name="ticket_queue_stats", description="Ticket creation queue depth and wait times")
+    @app_commands.guild_only()
+    @app_commands.checks.has_permissions(administrator=True)
+    async def ticket_queue_stats(self, interaction: discord.Interaction):
+        metrics = TicketCreationQueueService.get_metrics(guild_id=interaction.guild_id)
+
+        embed = discord.Embed(title="🚦 Ticket Queue", color=discord.Color.blurple())
+        embed.add_field(name="Queued", value=f"{metrics['depth']} (peak {metrics['peak_depth']})", inline=True)
+        embed.add_field(name="Created budget", value=f"{metrics['tokens']} channels", inline=True)
+        embed.add_field(name="Processed", value=f"{metrics['processed']:,}", inline=True)
+        embed.add_field(
+            name="Wait",
+            value=f"avg {metrics['avg_wait']:.1f}s, p95 {metrics['p95_wait']:.1f}s, max {metrics['max_wait']:.1f}s",
+            inline=False
+        )
+        embed.add_field(name="Rate limited", value=f"{metrics['rate_limited']}", inline=True)
+        embed.add_field(name="Rejected (full)", value=f"{metrics['rejected']}", inline=True)
+
+        close_stats = TicketService.get_close_latency_stats()
+        if close_stats:
+            embed.add_field(
+                name="Close pipeline",
+                value="\n".join(
+                    f"{stage}: avg {s['avg'] * 1000:.0f}ms, p95 {s['p95'] * 1000:.0f}ms, max {s['max'] * 1000:.0f}ms"
+                    for stage, s in close_stats.items()
+                ),
+                inline=False
+            )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
 async def setup(bot):
     await bot.add_cog(TicketsCog(bot))
 
@@ -1,11 +1,17 @@
 from pydantic import Field, field_validator
-from core.models.base import MongoModel
+from core.models.base import MongoModel, PyObjectId
 from typing import List, Optional, Literal
 from datetime import datetime
 
 class TicketMessage(MongoModel):
+    """A single chat line, stored in the append-only ticket_messages collection."""
+    ticket_id: PyObjectId = Field(..., description="Ticket this message belongs to")
+    channel_id: int = Field(..., description="Discord Channel ID")
     user_id: int = Field(..., description="Discord ID of the sender")
+    message_id: Optional[int] = Field(None, description="Discord Message ID")
+    username: Optional[str] = Field(None, description="Sender display name at send time")
     content: str = Field(...)
+    attachments: List[str] = Field(default_factory=list, description="Attachment URLs")
     is_staff: bool = False
     
 class Ticket(MongoModel):
@@ -20,10 +26,10 @@ class Ticket(MongoModel):
     
     # Context
     related_item_id: Optional[str] = Field(None, description="If this ticket is for an item purchase")
-    
-    messages: List[TicketMessage] = Field(default_factory=list)
+
     closed_at: Optional[datetime] = None
     closed_by: Optional[int] = None
+    transcript_status: Optional[Literal['pending', 'done', 'failed']] = None
 
     @field_validator('status')
     def validate_status(cls, v):
@@ -31,6 +37,16 @@ class Ticket(MongoModel):
             raise ValueError('Invalid status')
         return v
 
+class TranscriptJob(MongoModel):
+    """A queued transcript render, persisted in transcript_jobs so restarts resume it."""
+    ticket_id: PyObjectId = Field(..., description="Ticket to render")
+    guild_id: int = Field(..., description="Discord ID of the guild")
+    channel_id: Optional[int] = Field(None, description="Discord Channel ID of the ticket")
+    status: Literal['pending', 'running'] = Field(default='pending')
+    attempts: int = 0
+    last_error: Optional[str] = None
+    run_after: datetime = Field(default_factory=datetime.utcnow)
+
 class TicketSettingsModel(MongoModel):
     guild_id: int = Field(..., description="Discord ID of the guild")
     open_ticket_category_id: Optional[int] = Field(None, description="Discord ID of the ticket category")
@@ -38,3 +54,4 @@ class TicketSettingsModel(MongoModel):
     ticket_logs_channel_id: Optional[int] = Field(None, description="Discord ID of the ticket logs channel")
     ticket_transcript_channel_id: Optional[int] = Field(None, description="Discord ID of the ticket transcript channel")
     ticket_manager_role_id: Optional[int] = Field(None, description="Discord ID of the ticket manager role")
+    channel_pool_size: int = Field(0, description="Pre-created hidden ticket channels to keep (0 = disabled)")
@@ -1,9 +1,11 @@
 import asyncio
 import time
+from collections import deque
 from datetime import datetime
 from typing import List
 
 import discord
+from bson import ObjectId
 from loguru import logger
 from pymongo.asynchronous.collection import ReturnDocument
 
@@ -16,12 +18,54 @@ from modules.guild.service import GuildSettingService
 from modules.reputation.service import ReputationService
 from modules.shop.models import Item
 from modules.shop.services import ItemService
-from modules.tickets.models import Ticket, TicketMessage, TicketSettingsModel
-from modules.tickets.ui import TicketClosedView
+from modules.tickets.models import Ticket, TicketSettingsModel
+from modules.tickets.services_categories import TicketCategoryPoolService
+from modules.tickets.services_logs import TicketLogBufferService
+from modules.tickets.services_messages import TicketMessageLogService
+from modules.tickets.services_pool import TicketChannelPoolService
+from modules.tickets.services_transcripts import TranscriptWorkerService
+from modules.tickets.ui import TicketClosedView, TicketControlView
 from utils.discord_utils import safe_channel_edit
 
 
 class TicketService:
+    # Open ticket registry. Structure: { channel_id: ticket ObjectId }
+    # Loaded on startup, maintained by create/close/delete so message logging never has to query.
+    _open_channels: dict[int, ObjectId] = {}
+
+    SETTINGS_CACHE_TTL_SECONDS = 300
+
+    # Close pipeline stage timeouts (seconds) and latency samples. Structure: { stage: deque[seconds] }
+    CLOSE_STAGE_TIMEOUTS = {"logs": 10, "move": 20}
+    CLOSE_LATENCY_SAMPLES = 200
+    _close_latencies: dict[str, deque] = {}
+
+    # Ticket settings cache. Structure: { guild_id: (expires_at, TicketSettingsModel) }
+    # Writers must go through update_ticket_settings()/invalidate_ticket_settings()
+    _settings_cache: dict[int, tuple[float, TicketSettingsModel]] = {}
+
+    @classmethod
+    async def load_open_channels(cls) -> int:
+        """Populate the open ticket registry from the DB."""
+        cursor = Database.tickets().find(
+            {"status": "open", "channel_id": {"$ne": None}},
+            {"_id": 1, "channel_id": 1}
+        )
+        cls._open_channels = {doc["channel_id"]: doc["_id"] async for doc in cursor}
+        return len(cls._open_channels)
+
+    @classmethod
+    def is_open_ticket_channel(cls, channel_id: int) -> bool:
+        return channel_id in cls._open_channels
+
+    @classmethod
+    def register_open_channel(cls, channel_id: int, ticket_id: ObjectId):
+        cls._open_channels[channel_id] = ticket_id
+
+    @classmethod
+    def unregister_open_channel(cls, channel_id: int):
+        cls._open_channels.pop(channel_id, None)
+
     @staticmethod
     async def create_ticket(
             user: discord.User,
@@ -87,29 +131,35 @@ class TicketService:
             else:
                 topic = "Support Ticket"
 
-            # 5. Get to Create category
-            open_ticket_category = await  TicketService.create_or_get_ticket_category(guild=guild,
-                                                                                      category_name="Open Ticket",
-                                                                                      category_type="open")
-
-            if not open_ticket_category:
-                logger.info(f"Failed to get open ticket category {open_ticket_category.name}")
-                return None, "error"
-
-            # 6. Create channel (rate limited: 10 per 10 minutes per guild)
+            # 5. Claim a pre-created channel if the guild keeps a pool (one edit instead of a create)
             channel_name = f"ticket-{item.name if item else "support"}-{user.name[:10]}-{str(user.id)[-4:]}"
-            try:
-                channel = await open_ticket_category.create_text_channel(
-                    name=channel_name,
-                    overwrites=overwrites,
-                    topic=topic
-                )
-            except discord.HTTPException as e:
-                if e.status == 429:
+            channel = await TicketChannelPoolService.claim(
+                guild=guild, name=channel_name, topic=topic, overwrites=overwrites
+            )
+
+            # 6. Otherwise get a slot in the open category pool (spills into "Open Ticket 2..N" past 50 channels)
+            #    and create the channel (rate limited: 10 per 10 minutes per guild)
+            if channel is None:
+                open_ticket_category = await TicketCategoryPoolService.acquire(guild=guild, kind="open")
+                try:
+                    channel = await open_ticket_category.create_text_channel(
+                        name=channel_name,
+                        overwrites=overwrites,
+                        topic=topic
+                    )
+                except discord.RateLimited:
+                    # discord.py gave up waiting out a long rate limit; TicketCreationQueueService re-queues these
+                    TicketCategoryPoolService.release(open_ticket_category)
                     logger.error(f"Rate limited on channel creation for guild {guild.name}{guild.id}")
+                    return None, "rate_limited"
+                except discord.HTTPException as e:
+                    TicketCategoryPoolService.release(open_ticket_category)
+                    if e.status == 429:
+                        logger.error(f"Rate limited on channel creation for guild {guild.name}{guild.id}")
+                        return None, "rate_limited"
+                    logger.error(f"Failed to create channel for guild {guild.name}{guild.id}: {e}")
                     return None, "error"
-                logger.error(f"Failed to create channel for guild {guild.name}{guild.id}: {e}")
-                return None, "error"
+                TicketCategoryPoolService.release(open_ticket_category, channel)
 
             ticket = Ticket(
                 user_id=user.id,
@@ -130,6 +180,7 @@ class TicketService:
                 await channel.delete(reason=f"Ticket database insert failed")
                 return None, "error"
 
+            TicketService.register_open_channel(channel.id, ticket.id)
             logger.info(f"Create ticket {ticket.id} for user {user.id} in channel {channel.name}")
 
             # 8. Send logs in background (non- blocking)
@@ -217,48 +268,35 @@ class TicketService:
 
     @staticmethod
     async def get_ticket_by_channel(channel_id: int) -> Ticket:
-        doc = await Database.tickets().find_one({"channel_id": channel_id})
+        doc = await Database.tickets().find_one({"channel_id": channel_id}, {"messages": 0})
         if doc:
             return Ticket(**doc)
         return None
 
     @staticmethod
-    async def send_ticket_transcribe(channel: discord.TextChannel):
-        import chat_exporter
-        import io
+    async def get_transcript_channel(guild: discord.Guild) -> discord.TextChannel:
+        """Configured transcript channel, created (and saved to settings) if missing."""
+        ticket_settings = await TicketService.get_ticket_settings(guild_id=guild.id)
 
-        ticket_settings = await TicketService.get_ticket_settings(guild_id=channel.guild.id)
         channel_id = None
-        try:
-            transcript_html = await chat_exporter.export(channel)
-            if transcript_html:
-                transcript_file = discord.File(
-                    io.BytesIO(transcript_html.encode("utf-8")),
-                    filename=f"transcript-{channel.name}.html"
-                )
-
-                if ticket_settings and ticket_settings.ticket_transcript_channel_id:
-                    channel_id = int(ticket_settings.ticket_transcript_channel_id)
-
-                transcript_channel = channel.guild.get_channel(channel_id) if channel_id else None
-                if not transcript_channel:
-                    transcript_channel = await channel.guild.create_text_channel(
-                        name="ticket-transcript",
-                        overwrites={
-                            channel.guild.default_role: discord.PermissionOverwrite(read_messages=False),
-                            channel.guild.me: discord.PermissionOverwrite(read_messages=True, manage_messages=True)
-                        }
-                    )
+        if ticket_settings and ticket_settings.ticket_transcript_channel_id:
+            channel_id = int(ticket_settings.ticket_transcript_channel_id)
 
-                    await Database.ticket_settings().update_one(
-                        {"guild_id": channel.guild.id},
-                        {"$set": {"ticket_transcript_channel_id": transcript_channel.id}},
-                        upsert=True
-                    )
+        transcript_channel = guild.get_channel(channel_id) if channel_id else None
+        if not transcript_channel:
+            transcript_channel = await guild.create_text_channel(
+                name="ticket-transcript",
+                overwrites={
+                    guild.default_role: discord.PermissionOverwrite(read_messages=False),
+                    guild.me: discord.PermissionOverwrite(read_messages=True, manage_messages=True)
+                }
+            )
 
-                await transcript_channel.send(file=transcript_file)
-        except Exception as e:
-            logger.error(f"Failed to generate transcript: {e}")
+            await TicketService.update_ticket_settings(
+                guild.id,
+                {"ticket_transcript_channel_id": transcript_channel.id}
+            )
+        return transcript_channel
 
     @staticmethod
     async def claim_ticket(ticket: Ticket, claimed_by: int, guild: discord.Guild) -> tuple[Ticket, bool]:
@@ -333,40 +371,100 @@ class TicketService:
             logger.error(f"Failed to unclaim ticket: {e}")
             return None
 
-    @staticmethod
-    async def close_ticket(ticket: Ticket, closed_by_user_id: int, bot: discord.Client, guild: discord.Guild) -> bool:
-        """Mark ticket as closed in DB and generate transcript."""
-
-        # 1. Generate Transcript
-        channel = bot.get_channel(ticket.channel_id)
-        if channel:
-            await TicketService.send_ticket_transcribe(channel=channel)
-            await TicketService.send_logs_to_channel(
-                guild=guild,
-                title="Ticket Closed",
-                description=f"Ticket closed for user <@{closed_by_user_id}> in channel {channel.name}",
-                color=discord.Color.dark_red()
-            )
+    @classmethod
+    async def close_ticket(
+            cls,
+            ticket: Ticket,
+            closed_by_user_id: int,
+            bot: discord.Client,
+            guild: discord.Guild,
+            ticket_manager_role: discord.Role = None,
+    ) -> bool:
+        """
+        Close pipeline. Stage 1 commits the state transition (and queues the transcript);
+        stage 2 runs the log send and the channel move concurrently, each under its own timeout.
+        Returns False if the ticket was already closed.
+        """
+        timings: dict[str, float] = {}
+        start = time.perf_counter()
 
+        # 1. Commit: open -> closed, transcript queued for the background worker
         updates = {
             "status": "closed",
             "closed_at": datetime.utcnow(),
-            "closed_by": closed_by_user_id
+            "closed_by": closed_by_user_id,
+            "transcript_status": "pending"
         }
-        await Database.tickets().update_one(
-            {"_id": ticket.id},
+        result = await Database.tickets().update_one(
+            {"_id": ticket.id, "status": "open"},
             {"$set": updates}
         )
+        if result.modified_count == 0:
+            logger.info(f"[TicketClose] Ticket {ticket.id} was already closed")
+            return False
+        cls.unregister_open_channel(ticket.channel_id)
+        await TranscriptWorkerService.enqueue(ticket=ticket)
+        cls._record_close_stage("commit", time.perf_counter() - start, timings)
 
-        await TicketService.move_channel_to_close(channel=channel, ticket_owner=ticket.user_id)
+        # 2. Side effects, concurrently
+        channel = bot.get_channel(ticket.channel_id)
+        stages = []
+        if channel:
+            stages.append(cls._run_close_stage("logs", cls.send_logs_to_channel(
+                guild=guild,
+                title="Ticket Closed",
+                description=f"Ticket closed for user <@{closed_by_user_id}> in channel {channel.name}\n"
+                            f"Transcript pending",
+                color=discord.Color.dark_red()
+            ), timings))
+            stages.append(cls._run_close_stage("move", cls.move_channel_to_close(
+                channel=channel, ticket_owner=ticket.user_id, ticket_manager_role=ticket_manager_role
+            ), timings))
+        await asyncio.gather(*stages)
+
+        cls._record_close_stage("total", time.perf_counter() - start, timings)
+        logger.info(
+            f"[TicketClose] Ticket {ticket.id}: " + ", ".join(f"{name} {seconds * 1000:.0f}ms" for name, seconds in timings.items())
+        )
         return True
 
+    @classmethod
+    async def _run_close_stage(cls, name: str, coro, timings: dict[str, float]):
+        """Run one close step under its timeout; failures are logged, never raised."""
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(coro, timeout=cls.CLOSE_STAGE_TIMEOUTS[name])
+        except asyncio.TimeoutError:
+            logger.warning(f"[TicketClose] Stage '{name}' timed out after {cls.CLOSE_STAGE_TIMEOUTS[name]}s")
+        except Exception as e:
+            logger.error(f"[TicketClose] Stage '{name}' failed: {e}")
+        cls._record_close_stage(name, time.perf_counter() - start, timings)
+
+    @classmethod
+    def _record_close_stage(cls, name: str, seconds: float, timings: dict[str, float]):
+        timings[name] = seconds
+        cls._close_latencies.setdefault(name, deque(maxlen=cls.CLOSE_LATENCY_SAMPLES)).append(seconds)
+
+    @classmethod
+    def get_close_latency_stats(cls) -> dict[str, dict[str, float]]:
+        """Per-stage close latency over the recent samples. Structure: { stage: { avg, p95, max } } in seconds."""
+        stats = {}
+        for name, samples in cls._close_latencies.items():
+            values = sorted(samples)
+            stats[name] = {
+                "avg": sum(values) / len(values),
+                "p95": values[min(len(values) - 1, int(len(values) * 0.95))],
+                "max": values[-1],
+            }
+        return stats
+
     @staticmethod
     async def delete_ticket(ticket: Ticket, delete_by_user: int, guild: discord.Guild) -> bool:
         logger.info("Enter delete ticket function.....")
         try:
             logger.info(f"Enter Ticket Try BLock Ticket ID: {ticket.id}")
             if ticket:
+                TicketService.unregister_open_channel(ticket.channel_id)
                 await TicketService.send_logs_to_channel(
                     guild=guild,
                     title="Ticket Deleted",
@@ -389,11 +487,12 @@ class TicketService:
             return False
 
     @staticmethod
-    async def move_channel_to_close(channel: discord.TextChannel, ticket_owner: int):
+    async def move_channel_to_close(channel: discord.TextChannel, ticket_owner: int,
+                                    ticket_manager_role: discord.Role = None):
         guild = channel.guild
-        ticket_manager_role = await TicketService.get_ticket_manager_role(guild=guild)
-        close_category = await TicketService.create_or_get_ticket_category(guild=guild, category_name="Close Ticket",
-                                                                           category_type="close")
+        if ticket_manager_role is None:
+            ticket_manager_role = await TicketService.get_ticket_manager_role(guild=guild)
+        close_category = await TicketCategoryPoolService.acquire(guild=guild, kind="close")
         ticket_owner = guild.get_member(ticket_owner)
         overrides = {
             guild.default_role: discord.PermissionOverwrite(read_messages=False, view_channel=False),
@@ -402,7 +501,13 @@ class TicketService:
             guild.me: discord.PermissionOverwrite(read_messages=True, manage_messages=True, send_messages=True),
             ticket_owner: discord.PermissionOverwrite(read_messages=True, manage_messages=False, send_messages=False),
         }
-        await channel.edit(category=close_category, overwrites=overrides)
+        try:
+            await channel.edit(category=close_category, overwrites=overrides)
+        except Exception:
+            TicketCategoryPoolService.release(close_category)
+            raise
+        TicketCategoryPoolService.release(close_category, channel)
+        TicketCategoryPoolService.schedule_reclaim(guild=guild, kind="open")
 
     @staticmethod
     async def get_ticket_manager_role(guild: discord.Guild) -> discord.Role:
@@ -413,15 +518,11 @@ class TicketService:
             role_id = int(ticket_settings.ticket_manager_role_id)
 
         ticket_manager_role = guild.get_role(role_id) if role_id else None
+        if ticket_manager_role:
+            return ticket_manager_role
 
-        if not ticket_manager_role:
-            ticket_manager_role = await guild.create_role(name="Ticket Manager")
-
-        await Database.ticket_settings().update_one(
-            {"guild_id": guild.id},
-            {"$set": {"ticket_manager_role_id": ticket_manager_role.id}},
-            upsert=True
-        )
+        ticket_manager_role = await guild.create_role(name="Ticket Manager")
+        await TicketService.update_ticket_settings(guild.id, {"ticket_manager_role_id": ticket_manager_role.id})
         return ticket_manager_role
 
     @staticmethod
@@ -432,7 +533,6 @@ class TicketService:
     ) -> discord.CategoryChannel:
 
         ticket_settings = await TicketService.get_ticket_settings(guild_id=guild.id)
-        ticket_manager_role = await TicketService.get_ticket_manager_role(guild=guild)
 
         category_id = None
         mongo_key = None
@@ -450,6 +550,7 @@ class TicketService:
         ticket_category = guild.get_channel(category_id) if category_id else None
 
         if not ticket_category:
+            ticket_manager_role = await TicketService.get_ticket_manager_role(guild=guild)
             ticket_category = await guild.create_category(
                 name=category_name,
                 overwrites={
@@ -459,35 +560,24 @@ class TicketService:
                 }
             )
 
-            await Database.ticket_settings().update_one(
-                {"guild_id": guild.id},
-                {"$set": {mongo_key: ticket_category.id}},
-                upsert=True
-            )
+            await TicketService.update_ticket_settings(guild.id, {mongo_key: ticket_category.id})
 
         return ticket_category
 
-    @staticmethod
-    async def log_message(channel_id: int, message: discord.Message):
+    @classmethod
+    async def log_message(cls, channel_id: int, message: discord.Message):
         """Append a message to the ticket transcript."""
-        # Check if this channel is a ticket
-        ticket = await TicketService.get_ticket_by_channel(channel_id)
-        if not ticket:
+        # Check if this channel is an open ticket
+        ticket_id = cls._open_channels.get(channel_id)
+        if not ticket_id:
             return
 
-        msg_entry = TicketMessage(
-            user_id=message.author.id,
-            content=message.content,
-            is_staff=message.author.bot  # Simple check, assumes bot = system/staff context often
-        )
-
-        await Database.tickets().update_one(
-            {"_id": ticket.id},
-            {"$push": {"messages": msg_entry.to_mongo()}}
-        )
+        # Buffered; written to ticket_messages in batches
+        TicketMessageLogService.append(ticket_id=ticket_id, message=message)
 
     @staticmethod
-    async def send_logs_to_channel(guild: discord.Guild, title: str, description: str, color: discord.Color):
+    async def get_logs_channel(guild: discord.Guild) -> discord.TextChannel:
+        """Configured ticket-logs channel, created (and saved to settings) if missing."""
         ticket_settings = await TicketService.get_ticket_settings(guild_id=guild.id)
 
         channel_id = None
@@ -503,12 +593,12 @@ class TicketService:
                     guild.default_role: discord.PermissionOverwrite(view_channel=False),
                 }
             )
-            await Database.ticket_settings().update_one(
-                {"guild_id": guild.id},
-                {"$set": {"ticket_logs_channel_id": ticket_logs_channel.id}},
-                upsert=True
-            )
+            await TicketService.update_ticket_settings(guild.id, {"ticket_logs_channel_id": ticket_logs_channel.id})
+        return ticket_logs_channel
 
+    @staticmethod
+    async def send_logs_to_channel(guild: discord.Guild, title: str, description: str, color: discord.Color):
+        """Queue a ticket log entry; TicketLogBufferService sends it batched with others."""
         t = time.localtime()
         formatted_time = time.strftime("%y-%m-%d %H:%M:%S", t)
         embed = discord.Embed(
@@ -519,22 +609,49 @@ class TicketService:
         embed.add_field(name="Time", value=formatted_time)
         if guild.me.avatar.url:
             embed.set_thumbnail(url=guild.me.avatar.url)
-        await ticket_logs_channel.send(embed=embed)
+        TicketLogBufferService.append(guild=guild, embed=embed)
+
+    @classmethod
+    async def get_ticket_settings(cls, guild_id: int) -> TicketSettingsModel:
+        """Read-through cached settings; creates the default document on first use."""
+        cached = cls._settings_cache.get(guild_id)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
 
-    @staticmethod
-    async def get_ticket_settings(guild_id: int) -> TicketSettingsModel:
         doc = await Database.ticket_settings().find_one({"guild_id": guild_id})
         if doc:
-            return TicketSettingsModel(**doc)
+            ticket_settings = TicketSettingsModel(**doc)
+        else:
+            ## Create default settings
+            ticket_settings = TicketSettingsModel(guild_id=guild_id)
+            await Database.ticket_settings().update_one(
+                {"guild_id": guild_id},
+                {"$setOnInsert": ticket_settings.model_dump()},
+                upsert=True
+            )
 
-        ## Create default settings
-        default = TicketSettingsModel(guild_id=guild_id)
-        await Database.ticket_settings().insert_one(default.model_dump())
-        return default
+        cls._settings_cache[guild_id] = (time.monotonic() + cls.SETTINGS_CACHE_TTL_SECONDS, ticket_settings)
+        return ticket_settings
+
+    @classmethod
+    async def update_ticket_settings(cls, guild_id: int, updates: dict):
+        """Upsert settings fields and drop the cached copy."""
+        result = await Database.ticket_settings().update_one(
+            {"guild_id": guild_id},
+            {"$set": updates},
+            upsert=True
+        )
+        cls.invalidate_ticket_settings(guild_id)
+        return result
+
+    @classmethod
+    def invalidate_ticket_settings(cls, guild_id: int):
+        """Forget the cached settings for a guild."""
+        cls._settings_cache.pop(guild_id, None)
 
     @staticmethod
     async def get_all_tickets() -> List[Ticket]:
-        cursor = Database.tickets().find({})
+        cursor = Database.tickets().find({}, {"messages": 0})
         tickets = []
         async for doc in cursor:
             tickets.append(Ticket(**doc))
@@ -702,14 +819,9 @@ class TicketService:
         await interaction.followup.send("✅ Shop Panel Created!", ephemeral=True)
 
     @staticmethod
-    async def complete_order(interaction: discord.Interaction, root_view):
+    async def complete_order(interaction: discord.Interaction):
         await interaction.response.defer(ephemeral=True)
 
-        for item in root_view.children:
-            if item.custom_id == f"complete_order_ticket_{root_view.ticket_id}":
-                item.disabled = True
-                break
-
         ## Check Access
         manager_role = await TicketService.get_ticket_manager_role(guild=interaction.guild)
         seller_role = await GuildSettingService.get_seller_role(guild=interaction.guild)
@@ -815,16 +927,21 @@ class TicketService:
         else:
             embed = message.embeds[0]
 
-        await TicketService.close_ticket(ticket, interaction.user.id, interaction.client, interaction.guild)
+        closed = await TicketService.close_ticket(
+            ticket, interaction.user.id, interaction.client, interaction.guild, ticket_manager_role=manager_role
+        )
+        if not closed:
+            await interaction.followup.send(f"This ticket has already been closed!", ephemeral=True)
+            return
         await message.edit(
             content="# Thank you for shopping at op shop",
-            view=TicketClosedView(ticket_id=str(ticket.id),root_view=root_view),
+            view=TicketClosedView(ticket_id=str(ticket.id)),
             embed=embed
         )
-        await interaction.followup.send("Order completed! formatting transcript...", ephemeral=True)
+        await interaction.followup.send("Order completed! Transcript pending...", ephemeral=True)
 
     @staticmethod
-    async def close_ticket_btn(interaction: discord.Interaction, root_view):
+    async def close_ticket_btn(interaction: discord.Interaction):
         await interaction.response.defer(ephemeral=True)
 
         ticket_manager_role = await TicketService.get_ticket_manager_role(guild=interaction.guild)
@@ -844,7 +961,13 @@ class TicketService:
             if ticket.status != "open":
                 await interaction.followup.send(f"This ticket has already been closed!", ephemeral=True)
                 return
-            await TicketService.close_ticket(ticket, interaction.user.id, interaction.client, interaction.guild)
+            closed = await TicketService.close_ticket(
+                ticket, interaction.user.id, interaction.client, interaction.guild,
+                ticket_manager_role=ticket_manager_role
+            )
+            if not closed:
+                await interaction.followup.send(f"This ticket has already been closed!", ephemeral=True)
+                return
         else:
             await interaction.followup.send(f"Ticket not found!", ephemeral=True)
             return
@@ -858,12 +981,12 @@ class TicketService:
         else:
             embed = message.embeds[0]
 
-        await interaction.followup.send("Closing ticket...", ephemeral=True)
-        await message.edit(view=TicketClosedView(ticket_id=str(ticket.id), root_view=root_view), embed=embed)
+        await interaction.followup.send("Closing ticket... Transcript pending.", ephemeral=True)
+        await message.edit(view=TicketClosedView(ticket_id=str(ticket.id)), embed=embed)
         await interaction.channel.send(f"🔒 **Ticket Closed** by {interaction.user.mention}. Closing in 5 seconds.")
 
     @staticmethod
-    async def claim_ticket_func(interaction: discord.Interaction, ticket_id, root_view):
+    async def claim_ticket_func(interaction: discord.Interaction):
         await interaction.response.defer(ephemeral=True)
         seller_role = await GuildSettingService.get_seller_role(interaction.guild)
         # 1. Check the claimer is a seller or admin or not
@@ -898,14 +1021,8 @@ class TicketService:
             await interaction.followup.send(f"Ticket not found!", ephemeral=True)
             return
 
-        for item in root_view.children:
-            if item.custom_id == f"claim_ticket_{ticket_id}":
-                item.label = "Unclaim Ticket"
-                item.emoji = "📍"
-                item.style = discord.ButtonStyle.grey
-                item.custom_id = f"unclaim_ticket_{ticket_id}"
-                item.callback = root_view.unclaim_ticket_btn
-                break
+        # Swap Claim -> Unclaim
+        view = TicketControlView(ticket_id=str(ticket.id), claimed_by=interaction.user.id)
 
         channel: discord.TextChannel = interaction.channel
         msg = await channel.fetch_message(ticket.message_id)
@@ -948,7 +1065,7 @@ class TicketService:
         await msg.edit(
             content=f"{interaction.user.mention} {ticket_owner.mention}",
             embed=embed,
-            view=root_view
+            view=view
         )
 
         item = None
@@ -964,7 +1081,7 @@ class TicketService:
         await interaction.followup.send("Ticket claimed successfully!", ephemeral=True)
 
     @staticmethod
-    async def unclaim_ticket_btn(interaction: discord.Interaction, root_view):
+    async def unclaim_ticket_btn(interaction: discord.Interaction):
         await interaction.response.defer(ephemeral=True)
 
         seller_role = await GuildSettingService.get_seller_role(guild=interaction.guild)
@@ -994,14 +1111,8 @@ class TicketService:
 
         un_claimed_ticket = await TicketService.unclaim_ticket(ticket=ticket, guild=interaction.guild)
 
-        for item in root_view.children:
-            if item.custom_id == f"unclaim_ticket_{root_view.ticket_id}":
-                item.label = "Claim Ticket"
-                item.emoji = "📍"
-                item.style = discord.ButtonStyle.green
-                item.custom_id = f"claim_ticket_{root_view.ticket_id}"
-                item.callback = root_view.claim_ticket_btn
-                break
+        # Swap Unclaim -> Claim
+        view = TicketControlView(ticket_id=str(ticket.id))
 
         channel: discord.TextChannel = interaction.channel
         msg = await channel.fetch_message(un_claimed_ticket.message_id)
@@ -1035,7 +1146,7 @@ class TicketService:
         await msg.edit(
             content=f"{ticket_owner.mention} {seller_role.mention if seller_role else ""}",
             embed=embed,
-            view=root_view
+            view=view
         )
 
         item = None
@@ -1077,3 +1188,5 @@ class TicketService:
 
         await TicketService.delete_ticket(ticket=ticket, delete_by_user=interaction.user.id, guild=interaction.guild)
         await interaction.channel.delete(reason="Ticket Deleted")
+        TicketCategoryPoolService.schedule_reclaim(guild=interaction.guild, kind="open")
+        TicketCategoryPoolService.schedule_reclaim(guild=interaction.guild, kind="close")
@@ -0,0 +1,100 @@
+import asyncio
+import gzip
+import io
+
+from bson import ObjectId
+from gridfs.errors import NoFile
+from loguru import logger
+
+from core.database import Database
+from modules.tickets.models import Ticket
+
+
+class TranscriptArchiveService:
+    """
+    Compressed transcript archive in GridFS (bucket "transcripts"), keyed by ticket id.
+    Each ticket keeps one gzipped HTML and one gzipped NDJSON file; re-closing a ticket replaces them.
+    Blobs are only read back on demand (/ticket_transcript).
+    """
+    FORMATS = ("html", "ndjson")
+
+    @staticmethod
+    async def store(ticket: Ticket, html: bytes, ndjson_gz: bytes, message_count: int):
+        """Archive a rendered transcript, replacing any previous version for the ticket."""
+        bucket = Database.transcripts_bucket()
+        html_gz = await asyncio.to_thread(gzip.compress, html)
+
+        previous = [
+            doc["_id"] async for doc in
+            Database.get_db()["transcripts.files"].find({"metadata.ticket_id": ticket.id}, {"_id": 1})
+        ]
+
+        for fmt, data, raw_size in (("html", html_gz, len(html)), ("ndjson", ndjson_gz, None)):
+            await bucket.upload_from_stream(
+                f"{ticket.id}.{fmt}.gz",
+                data,
+                metadata={
+                    "ticket_id": ticket.id,
+                    "guild_id": ticket.guild_id,
+                    "user_id": ticket.user_id,
+                    "format": fmt,
+                    "raw_size": raw_size,
+                    "message_count": message_count,
+                }
+            )
+
+        for file_id in previous:
+            try:
+                await bucket.delete(file_id)
+            except NoFile:
+                pass
+
+        logger.info(f"[TranscriptArchive] Archived ticket {ticket.id}: {len(html)} -> {len(html_gz)} bytes html")
+
+    @staticmethod
+    async def load(ticket_id: ObjectId, guild_id: int, fmt: str = "html") -> tuple[str, io.BytesIO] | None:
+        """Stream an archived transcript back. Returns (filename, gzipped data) or None if not archived."""
+        file_doc = await Database.get_db()["transcripts.files"].find_one(
+            {"metadata.ticket_id": ticket_id, "metadata.guild_id": guild_id, "metadata.format": fmt},
+            sort=[("uploadDate", -1)]
+        )
+        if not file_doc:
+            return None
+
+        buffer = io.BytesIO()
+        await Database.transcripts_bucket().download_to_stream(file_doc["_id"], buffer)
+        buffer.seek(0)
+        return file_doc["filename"], buffer
+
+    @staticmethod
+    async def get_storage_stats(guild_id: int) -> dict:
+        """Archive size for a guild, in total and per month of upload."""
+        pipeline = [
+            {"$match": {"metadata.guild_id": guild_id}},
+            {"$group": {
+                "_id": {"$dateToString": {"format": "%Y-%m", "date": "$uploadDate"}},
+                "tickets": {"$addToSet": "$metadata.ticket_id"},
+                "stored_bytes": {"$sum": "$length"},
+                "html_bytes": {"$sum": {"$ifNull": ["$metadata.raw_size", 0]}},
+            }},
+            {"$sort": {"_id": 1}},
+        ]
+        months = [
+            {
+                "month": row["_id"],
+                "tickets": len(row["tickets"]),
+                "stored_bytes": row["stored_bytes"],
+                "html_bytes": row["html_bytes"],
+            }
+            async for row in Database.get_db()["transcripts.files"].aggregate(pipeline)
+        ]
+
+        stored = sum(month["stored_bytes"] for month in months)
+        raw = sum(month["html_bytes"] for month in months)
+        return {
+            "tickets": sum(month["tickets"] for month in months),
+            "stored_bytes": stored,
+            "html_bytes": raw,
+            "ratio": raw / stored if stored else 0.0,
+            "months": months,
+        }
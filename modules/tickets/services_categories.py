@@ -0,0 +1,146 @@
+import asyncio
+import re
+import time
+
+import discord
+from loguru import logger
+
+
+class TicketCategoryPoolService:
+    """
+    Ticket category pools. Discord caps a category at 50 channels, so each pool is the configured
+    category plus overflow categories named "<configured category name> 2..N", created on demand
+    and deleted once empty.
+    Channel counts are tracked in memory: the gateway cache plus our own in-flight placements.
+    """
+    CATEGORY_CHANNEL_LIMIT = 50
+
+    # How long a channel we placed is counted even if the gateway cache does not show it yet
+    RECENT_TTL_SECONDS = 30
+
+    # Names used only when the configured category has to be created
+    DEFAULT_NAMES = {"open": "Open Ticket", "close": "Close Ticket"}
+
+    # Per-guild lock so concurrent tickets don't both create the same overflow category
+    _locks: dict[int, asyncio.Lock] = {}
+
+    # Structure: { category_id: channels reserved but not placed yet }
+    _pending: dict[int, int] = {}
+
+    # Structure: { category_id: { channel_id: expires_at } }
+    _recent: dict[int, dict[int, float]] = {}
+
+    @classmethod
+    def _get_lock(cls, guild_id: int) -> asyncio.Lock:
+        if guild_id not in cls._locks:
+            cls._locks[guild_id] = asyncio.Lock()
+        return cls._locks[guild_id]
+
+    @classmethod
+    def channel_count(cls, category: discord.CategoryChannel) -> int:
+        """Channels in a category, including placements the gateway has not confirmed yet."""
+        now = time.monotonic()
+        recent = cls._recent.get(category.id, {})
+        for channel_id in [cid for cid, expires_at in recent.items() if expires_at <= now]:
+            del recent[channel_id]
+
+        channel_ids = {channel.id for channel in category.channels} | recent.keys()
+        return len(channel_ids) + cls._pending.get(category.id, 0)
+
+    @classmethod
+    def get_pool(cls, guild: discord.Guild, primary: discord.CategoryChannel) -> list[discord.CategoryChannel]:
+        """Primary category followed by its overflow categories ("<primary name> N") in number order."""
+        pattern = re.compile(rf"{re.escape(primary.name)} (\d+)")
+        overflow = [
+            (int(match.group(1)), category)
+            for category in guild.categories
+            if category.id != primary.id and (match := pattern.fullmatch(category.name))
+        ]
+        overflow.sort(key=lambda entry: (entry[0], entry[1].position))
+        return [primary] + [category for _, category in overflow]
+
+    @classmethod
+    async def acquire(cls, guild: discord.Guild, kind: str) -> discord.CategoryChannel:
+        """
+        Reserve a slot in the first category of the pool with room, creating an overflow category if all are full.
+        Every acquire() must be followed by release() once the channel is placed (or placing it failed).
+        """
+        from modules.tickets.services import TicketService
+
+        async with cls._get_lock(guild.id):
+            primary = await TicketService.create_or_get_ticket_category(
+                guild=guild, category_name=cls.DEFAULT_NAMES[kind], category_type=kind
+            )
+            # Overflow follows whatever the server named its configured category
+            base_name = primary.name
+            pool = cls.get_pool(guild=guild, primary=primary)
+
+            category = next((c for c in pool if cls.channel_count(c) < cls.CATEGORY_CHANNEL_LIMIT), None)
+            if category is None:
+                number = len(pool) + 1
+                taken = {c.name for c in guild.categories}
+                while f"{base_name} {number}" in taken:
+                    number += 1
+                category = await guild.create_category(
+                    name=f"{base_name} {number}",
+                    overwrites=primary.overwrites,
+                    position=pool[-1].position + 1,
+                    reason="Ticket category full"
+                )
+                logger.info(f"[TicketCategories] Created overflow category {category.name} in guild {guild.id}")
+
+            cls._pending[category.id] = cls._pending.get(category.id, 0) + 1
+            return category
+
+    @classmethod
+    def release(cls, category: discord.CategoryChannel, channel: discord.abc.GuildChannel | None = None):
+        """End a reservation. Pass the channel that was placed, or None if placing it failed."""
+        remaining = cls._pending.get(category.id, 0) - 1
+        if remaining > 0:
+            cls._pending[category.id] = remaining
+        else:
+            cls._pending.pop(category.id, None)
+
+        if channel is not None:
+            cls._recent.setdefault(category.id, {})[channel.id] = time.monotonic() + cls.RECENT_TTL_SECONDS
+
+    @classmethod
+    def schedule_reclaim(cls, guild: discord.Guild, kind: str, delay: float = 5):
+        """Reclaim after a short delay, once the gateway cache reflects channels that just moved or were deleted."""
+        async def _later():
+            await asyncio.sleep(delay)
+            try:
+                await cls.reclaim(guild=guild, kind=kind)
+            except Exception as e:
+                logger.error(f"[TicketCategories] Reclaim failed for guild {guild.id}: {e}")
+
+        asyncio.create_task(_later())
+
+    @classmethod
+    async def reclaim(cls, guild: discord.Guild, kind: str) -> int:
+        """Delete empty overflow categories of a pool. The configured category is never removed. Returns the count."""
+        from modules.tickets.services import TicketService
+
+        ticket_settings = await TicketService.get_ticket_settings(guild_id=guild.id)
+        primary_id = ticket_settings.open_ticket_category_id if kind == "open" else ticket_settings.close_ticket_category_id
+        primary = guild.get_channel(int(primary_id)) if primary_id else None
+        if primary is None:
+            return 0
+
+        reclaimed = 0
+        async with cls._get_lock(guild.id):
+            for category in cls.get_pool(guild=guild, primary=primary)[1:]:
+                if cls.channel_count(category) > 0:
+                    continue
+                try:
+                    await category.delete(reason="Empty ticket overflow category")
+                except discord.HTTPException as e:
+                    logger.warning(f"[TicketCategories] Failed to delete {category.name} in guild {guild.id}: {e}")
+                    continue
+                cls._pending.pop(category.id, None)
+                cls._recent.pop(category.id, None)
+                reclaimed += 1
+
+        if reclaimed:
+            logger.info(f"[TicketCategories] Reclaimed {reclaimed} empty {kind} categories in guild {guild.id}")
+        return reclaimed
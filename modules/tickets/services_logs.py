@@ -0,0 +1,124 @@
+import asyncio
+
+import discord
+from loguru import logger
+
+
+class TicketLogBufferService:
+    """
+    Per-guild ticket-log buffer.
+    Log embeds (create, claim, unclaim, close, delete) are queued in memory and sent to the
+    ticket-logs channel packed EMBEDS_PER_MESSAGE to a message, every FLUSH_INTERVAL_SECONDS
+    or as soon as a guild has a full message worth of embeds.
+    """
+    FLUSH_INTERVAL_SECONDS = 5
+    # Discord allows at most 10 embeds per message
+    EMBEDS_PER_MESSAGE = 10
+    # Embeds kept per guild while the logs channel is unreachable; the oldest are dropped first
+    MAX_BUFFERED_PER_GUILD = 100
+
+    # Structure: { guild_id: [discord.Embed] }
+    _buffers: dict[int, list[discord.Embed]] = {}
+    # Structure: { guild_id: discord.Guild }
+    _guilds: dict[int, discord.Guild] = {}
+    # Per-guild lock so a guild's embeds go out in order and the logs channel is created once
+    _locks: dict[int, asyncio.Lock] = {}
+
+    _flush_task: asyncio.Task | None = None
+
+    @classmethod
+    def start(cls):
+        """Start the background flush loop (idempotent)."""
+        if cls._flush_task is None or cls._flush_task.done():
+            cls._flush_task = asyncio.create_task(cls._flush_loop())
+
+    @classmethod
+    async def stop(cls):
+        """Stop the flush loop and send whatever is still buffered."""
+        if cls._flush_task:
+            cls._flush_task.cancel()
+            try:
+                await cls._flush_task
+            except asyncio.CancelledError:
+                pass
+            cls._flush_task = None
+        await cls.flush()
+
+    @classmethod
+    def _get_lock(cls, guild_id: int) -> asyncio.Lock:
+        if guild_id not in cls._locks:
+            cls._locks[guild_id] = asyncio.Lock()
+        return cls._locks[guild_id]
+
+    @classmethod
+    async def _flush_loop(cls):
+        while True:
+            await asyncio.sleep(cls.FLUSH_INTERVAL_SECONDS)
+            try:
+                await cls.flush()
+            except Exception as e:
+                logger.error(f"[TicketLogs] Flush loop error: {e}")
+
+    @classmethod
+    def append(cls, guild: discord.Guild, embed: discord.Embed):
+        """Queue a log embed for a guild. No Discord call on the ticket path."""
+        cls._guilds[guild.id] = guild
+        buffer = cls._buffers.setdefault(guild.id, [])
+        queued_before = len(buffer)
+        buffer.append(embed)
+
+        if len(buffer) > cls.MAX_BUFFERED_PER_GUILD:
+            del buffer[:len(buffer) - cls.MAX_BUFFERED_PER_GUILD]
+            logger.warning(f"[TicketLogs] Buffer full for guild {guild.id}, dropping oldest log entries")
+
+        # Only when a full message worth first builds up, not on every append to a full buffer
+        if queued_before < cls.EMBEDS_PER_MESSAGE <= len(buffer):
+            asyncio.create_task(cls.flush(guild_id=guild.id))
+
+    @classmethod
+    async def flush(cls, guild_id: int = None) -> int:
+        """
+        Send buffered embeds. Flushes a single guild if guild_id is given, else all guilds.
+        Returns the number of messages sent.
+        """
+        guild_ids = [guild_id] if guild_id is not None else list(cls._buffers)
+        sent = 0
+        for gid in guild_ids:
+            try:
+                sent += await cls._flush_guild(gid)
+            except Exception as e:
+                logger.error(f"[TicketLogs] Failed to flush logs for guild {gid}: {e}")
+        return sent
+
+    @classmethod
+    async def _flush_guild(cls, guild_id: int) -> int:
+        from modules.tickets.services import TicketService
+
+        async with cls._get_lock(guild_id):
+            embeds = cls._buffers.pop(guild_id, [])
+            guild = cls._guilds.get(guild_id)
+            if not embeds or guild is None:
+                return 0
+
+            sent = 0
+            try:
+                channel = await TicketService.get_logs_channel(guild=guild)
+                for start in range(0, len(embeds), cls.EMBEDS_PER_MESSAGE):
+                    await channel.send(embeds=embeds[start:start + cls.EMBEDS_PER_MESSAGE])
+                    sent += 1
+            except discord.HTTPException as e:
+                unsent = embeds[sent * cls.EMBEDS_PER_MESSAGE:]
+                if 400 <= e.status < 500 and e.status != 429:
+                    # Forbidden, missing channel, rejected embed: retrying cannot succeed
+                    logger.error(f"[TicketLogs] Dropping {len(unsent)} log entries for guild {guild_id}: {e}")
+                else:
+                    cls._requeue(guild_id, unsent, e)
+            except Exception as e:
+                cls._requeue(guild_id, embeds[sent * cls.EMBEDS_PER_MESSAGE:], e)
+            return sent
+
+    @classmethod
+    def _requeue(cls, guild_id: int, unsent: list[discord.Embed], error: Exception):
+        """Put back what was not sent, ahead of anything queued meanwhile."""
+        cls._buffers[guild_id] = (unsent + cls._buffers.get(guild_id, []))[-cls.MAX_BUFFERED_PER_GUILD:]
+        logger.warning(f"[TicketLogs] Re-queueing {len(unsent)} log entries for guild {guild_id}: {error}")
@@ -0,0 +1,161 @@
+import asyncio
+from typing import List
+
+import discord
+from bson import ObjectId
+from loguru import logger
+from pymongo.errors import BulkWriteError
+
+from core.database import Database
+from modules.tickets.models import TicketMessage
+
+
+class TicketMessageLogService:
+    """
+    Append-only ticket message log.
+    Messages are buffered per channel in memory and written with a single
+    insert_many every FLUSH_INTERVAL_SECONDS (or sooner when a channel fills up).
+    """
+    FLUSH_INTERVAL_SECONDS = 3
+    # Early flush threshold, and the most kept per channel while the database is unreachable
+    MAX_BUFFERED_PER_CHANNEL = 200
+    # Rejections per message before it is dropped (a document the server keeps refusing, e.g. validation)
+    MAX_WRITE_ATTEMPTS = 5
+    # writeErrors codes that are transient (elections, shutdown, timeouts) and never count as a rejection
+    RETRYABLE_WRITE_CODES = {6, 7, 50, 89, 91, 189, 262, 9001, 10107, 11600, 11602, 13435, 13436}
+
+    # Structure: { channel_id: [ticket message documents] }
+    _buffers: dict[int, list[dict]] = {}
+
+    # Structure: { message document _id: rejected write attempts }
+    _attempts: dict[ObjectId, int] = {}
+
+    _flush_task: asyncio.Task | None = None
+    _flush_lock: asyncio.Lock = asyncio.Lock()
+
+    @classmethod
+    def start(cls):
+        """Start the background flush loop (idempotent)."""
+        if cls._flush_task is None or cls._flush_task.done():
+            cls._flush_task = asyncio.create_task(cls._flush_loop())
+
+    @classmethod
+    async def stop(cls):
+        """Stop the flush loop and write out whatever is still buffered."""
+        if cls._flush_task:
+            cls._flush_task.cancel()
+            try:
+                await cls._flush_task
+            except asyncio.CancelledError:
+                pass
+            cls._flush_task = None
+        await cls.flush()
+
+    @classmethod
+    async def _flush_loop(cls):
+        while True:
+            await asyncio.sleep(cls.FLUSH_INTERVAL_SECONDS)
+            try:
+                await cls.flush()
+            except Exception as e:
+                logger.error(f"[TicketMessages] Flush loop error: {e}")
+
+    @classmethod
+    def append(cls, ticket_id: ObjectId, message: discord.Message):
+        """Buffer a chat message for a ticket. No DB round trip on the message path."""
+        entry = TicketMessage(
+            ticket_id=ticket_id,
+            channel_id=message.channel.id,
+            user_id=message.author.id,
+            message_id=message.id,
+            username=message.author.display_name,
+            content=message.content,
+            attachments=[attachment.url for attachment in message.attachments],
+            is_staff=message.author.bot,  # Simple check, assumes bot = system/staff context often
+            created_at=message.created_at.replace(tzinfo=None)
+        )
+        buffer = cls._buffers.setdefault(message.channel.id, [])
+        buffer.append(entry.to_mongo())
+
+        if len(buffer) == cls.MAX_BUFFERED_PER_CHANNEL:
+            asyncio.create_task(cls.flush(channel_id=message.channel.id))
+
+    @classmethod
+    async def flush(cls, channel_id: int = None) -> int:
+        """
+        Write buffered messages. Flushes a single channel if channel_id is given, else all channels.
+        Returns the number of messages written.
+        """
+        async with cls._flush_lock:
+            if channel_id is not None:
+                docs = cls._buffers.pop(channel_id, [])
+            else:
+                buffers, cls._buffers = cls._buffers, {}
+                docs = [doc for buffer in buffers.values() for doc in buffer]
+
+            if not docs:
+                return 0
+
+            try:
+                await Database.ticket_messages().insert_many(docs, ordered=False)
+                for doc in docs:
+                    cls._attempts.pop(doc["_id"], None)
+                return len(docs)
+            except BulkWriteError as e:
+                # Duplicate keys mean a previous (re-queued) attempt already landed
+                errors = [err for err in e.details.get("writeErrors", []) if err.get("code") != 11000]
+                transient = [docs[err["index"]] for err in errors if err.get("code") in cls.RETRYABLE_WRITE_CODES]
+                rejected = [docs[err["index"]] for err in errors if err.get("code") not in cls.RETRYABLE_WRITE_CODES]
+                written = len(docs) - len(errors)
+            except Exception as e:
+                # Connection errors / timeouts: nothing is known to be written, retry everything
+                transient, rejected, written = docs, [], 0
+                logger.error(f"[TicketMessages] Failed to write {len(docs)} messages: {e}")
+
+            failed_ids = {doc["_id"] for doc in transient + rejected}
+            for doc in docs:
+                if doc["_id"] not in failed_ids:
+                    cls._attempts.pop(doc["_id"], None)
+
+            dropped = 0
+            for doc in rejected:
+                attempts = cls._attempts.get(doc["_id"], 0) + 1
+                if attempts >= cls.MAX_WRITE_ATTEMPTS:
+                    cls._attempts.pop(doc["_id"], None)
+                    dropped += 1
+                    continue
+                cls._attempts[doc["_id"]] = attempts
+                transient.append(doc)
+            if dropped:
+                logger.error(f"[TicketMessages] Dropped {dropped} messages rejected {cls.MAX_WRITE_ATTEMPTS} times")
+
+            if transient:
+                cls._requeue(transient)
+            return written
+
+    @classmethod
+    def _requeue(cls, docs: list[dict]):
+        """Put failed documents back ahead of anything buffered since, keeping at most MAX_BUFFERED_PER_CHANNEL each."""
+        by_channel: dict[int, list[dict]] = {}
+        for doc in docs:
+            by_channel.setdefault(doc["channel_id"], []).append(doc)
+
+        overflow = 0
+        for channel_id, failed in by_channel.items():
+            buffer = failed + cls._buffers.get(channel_id, [])
+            if len(buffer) > cls.MAX_BUFFERED_PER_CHANNEL:
+                for doc in buffer[:-cls.MAX_BUFFERED_PER_CHANNEL]:
+                    cls._attempts.pop(doc["_id"], None)
+                overflow += len(buffer) - cls.MAX_BUFFERED_PER_CHANNEL
+                buffer = buffer[-cls.MAX_BUFFERED_PER_CHANNEL:]
+            cls._buffers[channel_id] = buffer
+
+        logger.warning(f"[TicketMessages] Re-queueing {len(docs)} messages")
+        if overflow:
+            logger.error(f"[TicketMessages] Buffer full while the database is unreachable, dropped {overflow} oldest messages")
+
+    @staticmethod
+    async def get_messages(ticket_id: ObjectId) -> List[TicketMessage]:
+        """Fetch the stored log for a ticket in chronological order."""
+        cursor = Database.ticket_messages().find({"ticket_id": ticket_id}).sort("created_at", 1)
+        return [TicketMessage(**doc) async for doc in cursor]
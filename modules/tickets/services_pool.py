@@ -0,0 +1,137 @@
+import asyncio
+import secrets
+
+import discord
+from loguru import logger
+
+from modules.tickets.services_categories import TicketCategoryPoolService
+from modules.tickets.services_queue import TicketCreationQueueService
+
+
+class TicketChannelPoolService:
+    """
+    Optional per-guild pool of pre-created, hidden ticket channels (TicketSettingsModel.channel_pool_size).
+    Opening a ticket claims one with a single edit (name, topic, overwrites) instead of a create.
+    The pool is refilled in the background only while the guild's ticket queue is idle and the
+    channel-create budget has room to spare, so refilling never competes with real buyers.
+    """
+    CHANNEL_PREFIX = "ticket-pool-"
+    REPLENISH_INTERVAL_SECONDS = 60
+
+    # Channel-create tokens always left for real tickets
+    RESERVED_TOKENS = 3
+
+    _bot: discord.Client | None = None
+    _task: asyncio.Task | None = None
+
+    # Structure: { guild_id: [pooled channel ids] }
+    _pools: dict[int, list[int]] = {}
+
+    @classmethod
+    def start(cls, bot: discord.Client):
+        """Start the background replenish loop (idempotent)."""
+        cls._bot = bot
+        if cls._task is None or cls._task.done():
+            cls._task = asyncio.create_task(cls._replenish_loop())
+
+    @classmethod
+    async def stop(cls):
+        if cls._task:
+            cls._task.cancel()
+            try:
+                await cls._task
+            except asyncio.CancelledError:
+                pass
+            cls._task = None
+
+    @classmethod
+    def _get_pool(cls, guild: discord.Guild) -> list[int]:
+        """Pooled channel ids; recovered from channel names after a restart."""
+        if guild.id not in cls._pools:
+            cls._pools[guild.id] = [
+                channel.id for channel in guild.text_channels if channel.name.startswith(cls.CHANNEL_PREFIX)
+            ]
+        return cls._pools[guild.id]
+
+    @classmethod
+    def available(cls, guild: discord.Guild) -> int:
+        return len(cls._get_pool(guild))
+
+    @classmethod
+    async def claim(
+            cls,
+            guild: discord.Guild,
+            name: str,
+            topic: str,
+            overwrites: dict,
+    ) -> discord.TextChannel | None:
+        """Turn a pooled channel into a ticket channel with one edit. Returns None if the pool is empty."""
+        pool = cls._get_pool(guild)
+        while pool:
+            channel = guild.get_channel(pool.pop(0))
+            if channel is None:
+                continue
+            try:
+                await channel.edit(name=name, topic=topic, overwrites=overwrites, reason="Ticket opened")
+            except discord.HTTPException as e:
+                logger.warning(f"[TicketPool] Failed to claim {channel.id} in guild {guild.id}: {e}")
+                continue
+            return channel
+        return None
+
+    @classmethod
+    async def _replenish_loop(cls):
+        await cls._bot.wait_until_ready()
+        while True:
+            for guild in list(cls._bot.guilds):
+                try:
+                    await cls.replenish(guild)
+                except Exception as e:
+                    logger.error(f"[TicketPool] Replenish failed for guild {guild.id}: {e}")
+            await asyncio.sleep(cls.REPLENISH_INTERVAL_SECONDS)
+
+    @classmethod
+    async def replenish(cls, guild: discord.Guild) -> int:
+        """Top the pool up to the configured size while the guild is quiet. Returns channels created."""
+        from modules.tickets.services import TicketService
+
+        ticket_settings = await TicketService.get_ticket_settings(guild_id=guild.id)
+        target = ticket_settings.channel_pool_size or 0
+        pool = cls._get_pool(guild)
+
+        # Pool shrunk (or disabled): drop the extras
+        while len(pool) > target:
+            channel = guild.get_channel(pool.pop())
+            if channel:
+                await channel.delete(reason="Ticket channel pool shrunk")
+
+        created = 0
+        bucket = TicketCreationQueueService.get_bucket(guild.id)
+        while (
+                len(pool) < target
+                and TicketCreationQueueService.is_idle(guild.id)
+                and bucket.available() >= cls.RESERVED_TOKENS + 1
+        ):
+            bucket.take()
+            category = await TicketCategoryPoolService.acquire(guild=guild, kind="open")
+            try:
+                channel = await category.create_text_channel(
+                    name=f"{cls.CHANNEL_PREFIX}{secrets.token_hex(2)}",
+                    overwrites={
+                        guild.default_role: discord.PermissionOverwrite(view_channel=False),
+                        guild.me: discord.PermissionOverwrite(view_channel=True, send_messages=True, manage_messages=True),
+                    },
+                    reason="Ticket channel pool"
+                )
+            except discord.HTTPException as e:
+                TicketCategoryPoolService.release(category)
+                bucket.drain()
+                logger.warning(f"[TicketPool] Failed to create pooled channel in guild {guild.id}: {e}")
+                break
+            TicketCategoryPoolService.release(category, channel)
+            pool.append(channel.id)
+            created += 1
+
+        if created:
+            logger.info(f"[TicketPool] Added {created} pooled channels in guild {guild.id} ({len(pool)}/{target})")
+        return created
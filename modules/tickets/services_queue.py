@@ -0,0 +1,211 @@
+import asyncio
+import time
+from collections import deque
+
+import discord
+from loguru import logger
+
+from core.rate_limit import TokenBucket
+from modules.shop.models import Item
+from modules.tickets.models import Ticket
+
+
+class TicketRequest:
+    """A queued create_ticket call; the caller awaits `future`."""
+
+    def __init__(self, user: discord.Member, guild: discord.Guild, item: Item | None, category_path: str | None,
+                 message_id: int | None):
+        self.user = user
+        self.guild = guild
+        self.item = item
+        self.category_path = category_path
+        self.message_id = message_id
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.queued_at = time.monotonic()
+
+
+class TicketCreationQueueService:
+    """
+    Per-guild ticket creation queue.
+    Requests are served in order by one worker per guild, paced by a token bucket modelling the
+    channel-create limit; buyers who have to wait get their queue position as an ephemeral followup.
+    """
+    # Channel creation budget per guild (matches the limit noted in TicketService.create_ticket)
+    BUCKET_CAPACITY = 10
+    BUCKET_PERIOD_SECONDS = 600
+
+    MAX_QUEUE_DEPTH = 100
+    # Callers deliver the result through interaction.followup, whose token expires after 15 minutes:
+    # a request that could not be served well before that is turned away instead of queued
+    MAX_WAIT_SECONDS = 14 * 60
+    # Wait-time samples kept per guild for metrics
+    WAIT_SAMPLES = 200
+
+    # Structure: { guild_id: deque[TicketRequest] }
+    _queues: dict[int, deque[TicketRequest]] = {}
+    # Structure: { guild_id: TokenBucket }
+    _buckets: dict[int, TokenBucket] = {}
+    # Structure: { guild_id: worker task }
+    _workers: dict[int, asyncio.Task] = {}
+    # Structure: { guild_id: { "processed", "rate_limited", "rejected", "peak_depth", "waits": deque[seconds] } }
+    _metrics: dict[int, dict] = {}
+
+    @classmethod
+    def get_bucket(cls, guild_id: int) -> TokenBucket:
+        if guild_id not in cls._buckets:
+            cls._buckets[guild_id] = TokenBucket(capacity=cls.BUCKET_CAPACITY, period=cls.BUCKET_PERIOD_SECONDS)
+        return cls._buckets[guild_id]
+
+    @classmethod
+    def is_idle(cls, guild_id: int) -> bool:
+        """No one is waiting for a ticket in this guild."""
+        return not cls._queues.get(guild_id)
+
+    @classmethod
+    def _get_metrics(cls, guild_id: int) -> dict:
+        if guild_id not in cls._metrics:
+            cls._metrics[guild_id] = {
+                "processed": 0,
+                "rate_limited": 0,
+                "rejected": 0,
+                "peak_depth": 0,
+                "waits": deque(maxlen=cls.WAIT_SAMPLES),
+            }
+        return cls._metrics[guild_id]
+
+    @classmethod
+    async def submit(
+            cls,
+            interaction: discord.Interaction,
+            item: Item = None,
+            category_path: str = None,
+            message_id: int = None,
+    ) -> tuple[Ticket | None, str]:
+        """
+        Queue a ticket for interaction.user and wait for it. Same return values as TicketService.create_ticket,
+        plus "busy" when the queue is full or the estimated wait would outlive the interaction token
+        (MAX_WAIT_SECONDS). The interaction must already be responded to (followups are used).
+        """
+        guild = interaction.guild
+        queue = cls._queues.setdefault(guild.id, deque())
+        metrics = cls._get_metrics(guild.id)
+
+        # Double clicks share the request already in line
+        for queued in queue:
+            if queued.user.id == interaction.user.id:
+                return await asyncio.shield(queued.future)
+
+        eta = cls.estimate_wait(guild, position=len(queue) + 1)
+        if len(queue) >= cls.MAX_QUEUE_DEPTH or eta >= cls.MAX_WAIT_SECONDS:
+            metrics["rejected"] += 1
+            return None, "busy"
+
+        request = TicketRequest(
+            user=interaction.user,
+            guild=guild,
+            item=item,
+            category_path=category_path,
+            message_id=message_id,
+        )
+        queue.append(request)
+        metrics["peak_depth"] = max(metrics["peak_depth"], len(queue))
+
+        worker = cls._workers.get(guild.id)
+        if worker is None or worker.done():
+            cls._workers[guild.id] = asyncio.create_task(cls._worker_loop(guild.id))
+
+        if eta > 0:
+            try:
+                await interaction.followup.send(
+                    f"⏳ Lots of orders right now! You are **#{len(queue)}** in the ticket queue "
+                    f"(about {max(1, round(eta / 60))} min). Your ticket will be created automatically.",
+                    ephemeral=True
+                )
+            except discord.HTTPException:
+                pass
+
+        return await asyncio.shield(request.future)
+
+    @staticmethod
+    def failure_message(status: str) -> str:
+        """Buyer-facing text for a submit() that did not produce a ticket."""
+        if status == "busy":
+            return "🚦 The ticket queue is full right now (over 15 minutes of wait), please try again in a few minutes."
+        return "❌ Could not create your ticket, please try again."
+
+    @classmethod
+    def estimate_wait(cls, guild: discord.Guild, position: int) -> float:
+        """Rough seconds until the request at `position` (1-based) gets a pooled channel or a creation token."""
+        from modules.tickets.services_pool import TicketChannelPoolService
+        bucket = cls.get_bucket(guild.id)
+        missing = position - TicketChannelPoolService.available(guild) - bucket.available()
+        return max(0.0, missing / bucket.rate)
+
+    @classmethod
+    async def _worker_loop(cls, guild_id: int):
+        from modules.tickets.services import TicketService
+        from modules.tickets.services_pool import TicketChannelPoolService
+
+        queue = cls._queues[guild_id]
+        bucket = cls.get_bucket(guild_id)
+        metrics = cls._get_metrics(guild_id)
+
+        while queue:
+            # A pooled channel is claimed with an edit and needs no create budget
+            pooled = TicketChannelPoolService.available(queue[0].guild) > 0
+            if not pooled:
+                wait = bucket.wait_time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                    continue
+
+            request = queue.popleft()
+            if not pooled:
+                bucket.take()
+            try:
+                ticket, status = await TicketService.create_ticket(
+                    user=request.user,
+                    guild=request.guild,
+                    item=request.item,
+                    category_path=request.category_path,
+                    message_id=request.message_id,
+                )
+            except Exception as e:
+                logger.error(f"[TicketQueue] Unexpected error creating ticket in guild {guild_id}: {e}")
+                ticket, status = None, "error"
+
+            if status == "rate_limited":
+                # Back to the front of the line; wait for the bucket to refill
+                metrics["rate_limited"] += 1
+                bucket.drain()
+                queue.appendleft(request)
+                continue
+            if status != "created" and not pooled:
+                # No channel was created, the token was not spent
+                bucket.refund()
+
+            waited = time.monotonic() - request.queued_at
+            metrics["processed"] += 1
+            metrics["waits"].append(waited)
+            if waited > 1:
+                logger.info(f"[TicketQueue] Guild {guild_id}: served after {waited:.1f}s, {len(queue)} still queued")
+
+            if not request.future.done():
+                request.future.set_result((ticket, status))
+
+    @classmethod
+    def get_metrics(cls, guild_id: int) -> dict:
+        """Queue depth and wait-time stats for a guild."""
+        metrics = cls._get_metrics(guild_id)
+        waits = sorted(metrics["waits"])
+        return {
+            "depth": len(cls._queues.get(guild_id, ())),
+            "peak_depth": metrics["peak_depth"],
+            "processed": metrics["processed"],
+            "rate_limited": metrics["rate_limited"],
+            "rejected": metrics["rejected"],
+            "tokens": round(cls.get_bucket(guild_id).available(), 2),
+            "avg_wait": sum(waits) / len(waits) if waits else 0.0,
+            "p95_wait": waits[min(len(waits) - 1, int(len(waits) * 0.95))] if waits else 0.0,
+            "max_wait": waits[-1] if waits else 0.0,
+        }
@@ -0,0 +1,277 @@
+import asyncio
+import gzip
+import html as html_lib
+import io
+import json
+from datetime import datetime, timedelta
+
+import discord
+from loguru import logger
+from pymongo import ReturnDocument
+
+from core.database import Database
+from modules.tickets.models import Ticket, TicketMessage, TranscriptJob
+from modules.tickets.services_archive import TranscriptArchiveService
+from modules.tickets.services_messages import TicketMessageLogService
+
+
+class TranscriptWorkerService:
+    """
+    Background transcript rendering.
+    Closing a ticket only enqueues a job in transcript_jobs; WORKER_COUNT workers claim jobs
+    one at a time (so at most WORKER_COUNT renders run at once), render and post the transcript,
+    and retry failures with a backoff. Jobs left 'running' by a crash are re-queued on start().
+    """
+    WORKER_COUNT = 2
+    MAX_ATTEMPTS = 3
+    RETRY_BACKOFF_SECONDS = 30
+    POLL_INTERVAL_SECONDS = 30
+
+    _bot: discord.Client | None = None
+    _workers: list[asyncio.Task] = []
+    _wakeup: asyncio.Event = asyncio.Event()
+
+    @classmethod
+    async def start(cls, bot: discord.Client):
+        """Recover interrupted jobs and start the worker pool (idempotent)."""
+        cls._bot = bot
+        if any(not worker.done() for worker in cls._workers):
+            return
+
+        result = await Database.transcript_jobs().update_many(
+            {"status": "running"},
+            {"$set": {"status": "pending", "updated_at": datetime.utcnow()}}
+        )
+        if result.modified_count:
+            logger.info(f"[Transcripts] Re-queued {result.modified_count} interrupted jobs")
+
+        cls._workers = [asyncio.create_task(cls._worker_loop(n)) for n in range(cls.WORKER_COUNT)]
+        cls._wakeup.set()
+
+    @classmethod
+    async def stop(cls):
+        """Cancel the workers. Jobs in flight stay 'running' and are re-queued on the next start()."""
+        for worker in cls._workers:
+            worker.cancel()
+        await asyncio.gather(*cls._workers, return_exceptions=True)
+        cls._workers = []
+
+    @classmethod
+    async def enqueue(cls, ticket: Ticket):
+        """Queue a transcript for a closed ticket. Re-closing a ticket re-queues its job."""
+        job = TranscriptJob(ticket_id=ticket.id, guild_id=ticket.guild_id, channel_id=ticket.channel_id)
+        doc = job.to_mongo()
+        await Database.transcript_jobs().update_one(
+            {"ticket_id": ticket.id},
+            {
+                "$set": {key: doc[key] for key in ("status", "attempts", "last_error", "run_after", "updated_at")},
+                "$setOnInsert": {key: doc[key] for key in ("_id", "guild_id", "channel_id", "created_at")},
+            },
+            upsert=True
+        )
+        cls._wakeup.set()
+
+    @classmethod
+    async def _claim(cls) -> TranscriptJob | None:
+        now = datetime.utcnow()
+        doc = await Database.transcript_jobs().find_one_and_update(
+            {"status": "pending", "run_after": {"$lte": now}},
+            {"$set": {"status": "running", "updated_at": now}, "$inc": {"attempts": 1}},
+            sort=[("run_after", 1), ("created_at", 1)],
+            return_document=ReturnDocument.AFTER
+        )
+        return TranscriptJob(**doc) if doc else None
+
+    @classmethod
+    async def _worker_loop(cls, worker_id: int):
+        # Channels are only resolvable once the gateway cache is populated
+        await cls._bot.wait_until_ready()
+        while True:
+            # Clear before claiming: an enqueue() that lands while the claim is in flight keeps the event set
+            cls._wakeup.clear()
+            try:
+                job = await cls._claim()
+            except Exception as e:
+                logger.error(f"[Transcripts] Worker {worker_id} failed to claim a job: {e}")
+                job = None
+
+            if job is None:
+                try:
+                    await asyncio.wait_for(cls._wakeup.wait(), timeout=cls.POLL_INTERVAL_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            try:
+                try:
+                    await cls._process(job)
+                except Exception as e:
+                    await cls._fail(job, e)
+                else:
+                    await cls._complete(job)
+            except Exception as e:
+                # Job stays 'running' and is re-queued on the next start()
+                logger.error(f"[Transcripts] Worker {worker_id} failed to update job {job.id}: {e}")
+
+    @classmethod
+    async def _process(cls, job: TranscriptJob):
+        from modules.tickets.services import TicketService
+
+        ticket_doc = await Database.tickets().find_one({"_id": job.ticket_id}, {"messages": 0})
+        if not ticket_doc:
+            raise RuntimeError(f"Ticket {job.ticket_id} not found")
+        ticket = Ticket(**ticket_doc)
+
+        guild = cls._bot.get_guild(job.guild_id)
+        if guild is None:
+            raise RuntimeError(f"Guild {job.guild_id} is not available")
+        channel = guild.get_channel(job.channel_id) if job.channel_id else None
+
+        # Anything still buffered for this channel must be in the log before we read it
+        if job.channel_id:
+            await TicketMessageLogService.flush(channel_id=job.channel_id)
+        stored = [TranscriptRenderer.from_log(message) for message in await TicketMessageLogService.get_messages(ticket.id)]
+        gaps = await cls._fetch_gaps(channel=channel, stored=stored) if channel else []
+
+        messages = sorted(stored + gaps, key=lambda m: m["created_at"])
+        if not messages:
+            raise RuntimeError("Nothing to render: no stored log and no channel history")
+
+        # Rendering and compression are pure CPU work; keep them off the event loop
+        name = channel.name if channel else str(ticket.id)
+        html, ndjson_gz = await asyncio.to_thread(TranscriptRenderer.render, ticket, name, messages)
+
+        # Archive first so the transcript survives even if the Discord upload fails
+        await TranscriptArchiveService.store(ticket=ticket, html=html, ndjson_gz=ndjson_gz, message_count=len(messages))
+
+        if len(html) > guild.filesize_limit:
+            html_file = discord.File(io.BytesIO(gzip.compress(html)), filename=f"transcript-{name}.html.gz")
+        else:
+            html_file = discord.File(io.BytesIO(html), filename=f"transcript-{name}.html")
+        ndjson_file = discord.File(io.BytesIO(ndjson_gz), filename=f"transcript-{name}.ndjson.gz")
+
+        transcript_channel = await TicketService.get_transcript_channel(guild=guild)
+        await transcript_channel.send(content=f"Ticket `{ticket.id}`", files=[html_file, ndjson_file])
+        logger.info(
+            f"[Transcripts] Rendered ticket {ticket.id}: {len(stored)} stored + {len(gaps)} fetched messages, "
+            f"{len(html)} bytes html"
+        )
+
+    @staticmethod
+    async def _fetch_gaps(channel: discord.TextChannel, stored: list[dict]) -> list[dict]:
+        """
+        Read the whole channel history and keep what the stored log is missing, merged by message id:
+        bot messages (never logged) and anything sent while the bot was offline, wherever it falls.
+        Legacy entries without message ids are matched on author and content instead.
+        """
+        logged_ids = {m["message_id"] for m in stored if m["message_id"]}
+        legacy = {(m["user_id"], m["content"]) for m in stored if not m["message_id"]}
+
+        gaps = []
+        async for message in channel.history(limit=None, oldest_first=True):
+            if message.id in logged_ids or (message.author.id, message.content) in legacy:
+                continue
+            gaps.append(TranscriptRenderer.from_discord(message))
+        return gaps
+
+    @classmethod
+    async def _complete(cls, job: TranscriptJob):
+        await Database.tickets().update_one({"_id": job.ticket_id}, {"$set": {"transcript_status": "done"}})
+        await Database.transcript_jobs().delete_one({"_id": job.id, "status": "running"})
+        logger.info(f"[Transcripts] Transcript ready for ticket {job.ticket_id} (attempt {job.attempts})")
+
+    @classmethod
+    async def _fail(cls, job: TranscriptJob, error: Exception):
+        if job.attempts < cls.MAX_ATTEMPTS:
+            logger.warning(f"[Transcripts] Attempt {job.attempts} for ticket {job.ticket_id} failed: {error}")
+            await Database.transcript_jobs().update_one(
+                {"_id": job.id, "status": "running"},
+                {"$set": {
+                    "status": "pending",
+                    "last_error": str(error),
+                    "run_after": datetime.utcnow() + timedelta(seconds=cls.RETRY_BACKOFF_SECONDS * job.attempts),
+                    "updated_at": datetime.utcnow(),
+                }}
+            )
+            return
+
+        logger.error(f"[Transcripts] Giving up on ticket {job.ticket_id} after {job.attempts} attempts: {error}")
+        await Database.tickets().update_one({"_id": job.ticket_id}, {"$set": {"transcript_status": "failed"}})
+        await Database.transcript_jobs().delete_one({"_id": job.id, "status": "running"})
+
+
+class TranscriptRenderer:
+    """
+    Native transcript rendering from the stored ticket_messages log.
+    Messages are plain dicts (see from_log/from_discord) so render() can run in a worker thread.
+    """
+
+    STYLE = (
+        "body{font-family:sans-serif;background:#313338;color:#dbdee1;margin:0;padding:16px}"
+        "header{border-bottom:1px solid #4e5058;margin-bottom:12px}"
+        ".msg{padding:4px 0}.author{font-weight:bold;color:#f2f3f5}.staff .author{color:#5865f2}"
+        ".time{color:#949ba4;font-size:12px;margin-left:6px}.content{white-space:pre-wrap}"
+        "a{color:#00a8fc}"
+    )
+
+    @staticmethod
+    def from_log(message: TicketMessage) -> dict:
+        return {
+            "message_id": message.message_id,
+            "user_id": message.user_id,
+            "username": message.username,
+            "content": message.content,
+            "attachments": list(message.attachments),
+            "is_staff": message.is_staff,
+            "created_at": message.created_at,
+        }
+
+    @staticmethod
+    def from_discord(message: discord.Message) -> dict:
+        content = message.content
+        # Bot messages in tickets are mostly embeds; keep their text
+        for embed in message.embeds:
+            content += "".join(f"\n{part}" for part in (embed.title, embed.description) if part)
+        return {
+            "message_id": message.id,
+            "user_id": message.author.id,
+            "username": message.author.display_name,
+            "content": content.strip(),
+            "attachments": [attachment.url for attachment in message.attachments],
+            "is_staff": message.author.bot,
+            "created_at": message.created_at.replace(tzinfo=None),
+        }
+
+    @classmethod
+    def render(cls, ticket: Ticket, name: str, messages: list[dict]) -> tuple[bytes, bytes]:
+        """Returns (html, gzipped ndjson) for a ticket's messages in chronological order."""
+        escape = html_lib.escape
+        parts = [
+            f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>Transcript {escape(name)}</title>"
+            f"<style>{cls.STYLE}</style></head><body>",
+            f"<header><h2>{escape(name)}</h2>"
+            f"<p>Ticket {ticket.id} &middot; {escape(ticket.topic)} &middot; owner {ticket.user_id} &middot; "
+            f"opened {ticket.created_at:%Y-%m-%d %H:%M} UTC"
+            + (f" &middot; closed {ticket.closed_at:%Y-%m-%d %H:%M} UTC" if ticket.closed_at else "")
+            + f" &middot; {len(messages)} messages</p></header>",
+        ]
+        lines = []
+
+        for message in messages:
+            author = message["username"] or str(message["user_id"])
+            attachments = "".join(
+                f"<div><a href='{escape(url, quote=True)}'>{escape(url.rsplit('/', 1)[-1].split('?', 1)[0])}</a></div>"
+                for url in message["attachments"]
+            )
+            parts.append(
+                f"<div class='msg{' staff' if message['is_staff'] else ''}'>"
+                f"<span class='author' title='{message['user_id']}'>{escape(author)}</span>"
+                f"<span class='time'>{message['created_at']:%Y-%m-%d %H:%M:%S}</span>"
+                f"<div class='content'>{escape(message['content'])}</div>{attachments}</div>"
+            )
+            lines.append(json.dumps({**message, "created_at": message["created_at"].isoformat()}, ensure_ascii=False))
+
+        parts.append("</body></html>")
+        html = "".join(parts).encode("utf-8")
+        ndjson_gz = gzip.compress(("\n".join(lines) + "\n").encode("utf-8"))
+        return html, ndjson_gz
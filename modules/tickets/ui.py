@@ -68,6 +68,12 @@ async def get_ticket_settings_embed(guild_id: int) -> discord.Embed:
         inline=True
     )
 
+    embed.add_field(
+        name="Channel Pool",
+        value=f"{data.channel_pool_size} pre-created channels" if data.channel_pool_size else "Disabled",
+        inline=True
+    )
+
     embed.set_footer(text="Ticket System • OPShop")
 
     return embed
@@ -188,11 +194,9 @@ class TicketPanelModal(discord.ui.Modal):
             ticket_manager_role_id=role_id
         )
 
-        await Database.ticket_settings().update_one(
-            {"guild_id": interaction.guild_id},
-            {"$set": data.model_dump()},
-            upsert=True
-        )
+        from modules.tickets.services import TicketService
+        # The channel pool size is set with /ticket_pool, not from this modal
+        await TicketService.update_ticket_settings(interaction.guild_id, data.model_dump(exclude={"channel_pool_size"}))
 
         embed = await get_ticket_settings_embed(interaction.guild_id)
         await interaction.edit_original_response(embed=embed, view=self.root_view)
@@ -211,92 +215,157 @@ class TicketSettingsView(View):
         await interaction.response.send_modal(modal)
 
 
-class TicketControlView(View):
-    def __init__(self, ticket_id: str, is_custom_ticket: bool = False, is_item_ticket: bool = False,
-                 claimed_by: int = None):
-        super().__init__(timeout=None)  # Persistent view logic needs setup, for now simple
-        self.ticket_id = ticket_id
-        self.is_custom_ticket = is_custom_ticket
-        self.is_item_ticket = is_item_ticket
+# ========================================
+# Ticket Controls (Dynamic, Persistent)
+# ========================================
+# Each button parses the ticket id out of its custom_id, so startup registers one handler
+# per button type (bot.add_dynamic_items) regardless of how many tickets exist.
+
+TICKET_ID_PATTERN = r"(?P<ticket_id>[0-9a-f]{24})"
 
-        complete_button = discord.ui.Button(
-            label="Complete Order",
-            style=discord.ButtonStyle.green,
-            emoji="✅",
-            custom_id=f"complete_order_{ticket_id}",
-        )
-        complete_button.callback = self.complete_order
 
-        close_button = discord.ui.Button(
-            label="Close",
-            style=discord.ButtonStyle.red,
-            emoji="🔒",
-            custom_id=f"close_order_{ticket_id}",
+class CompleteOrderButton(discord.ui.DynamicItem[Button], template=rf"complete_order_{TICKET_ID_PATTERN}"):
+    def __init__(self, ticket_id: str):
+        super().__init__(
+            Button(
+                label="Complete Order",
+                style=discord.ButtonStyle.green,
+                emoji="✅",
+                custom_id=f"complete_order_{ticket_id}",
+            )
         )
-        close_button.callback = self.close_ticket_btn
+        self.ticket_id = ticket_id
 
-        # Create claim button based on current state
-        if claimed_by:
-            # Ticket is already claimed - show Unclaim button
-            claim_ticket_button = discord.ui.Button(
-                label="Unclaim Ticket",
-                style=discord.ButtonStyle.grey,
-                emoji="📍",
-                custom_id=f"unclaim_ticket_{ticket_id}",
+    @classmethod
+    async def from_custom_id(cls, interaction: Interaction, item: Button, match):
+        return cls(match["ticket_id"])
+
+    async def callback(self, interaction: discord.Interaction):
+        from modules.tickets.services import TicketService
+        await TicketService.complete_order(interaction=interaction)
+
+
+class CloseTicketButton(discord.ui.DynamicItem[Button], template=rf"close_order_{TICKET_ID_PATTERN}"):
+    def __init__(self, ticket_id: str):
+        super().__init__(
+            Button(
+                label="Close",
+                style=discord.ButtonStyle.red,
+                emoji="🔒",
+                custom_id=f"close_order_{ticket_id}",
             )
-            claim_ticket_button.callback = self.unclaim_ticket_btn
-        else:
-            # Ticket not claimed - show Claim button
-            claim_ticket_button = discord.ui.Button(
+        )
+        self.ticket_id = ticket_id
+
+    @classmethod
+    async def from_custom_id(cls, interaction: Interaction, item: Button, match):
+        return cls(match["ticket_id"])
+
+    async def callback(self, interaction: discord.Interaction):
+        from modules.tickets.services import TicketService
+        await TicketService.close_ticket_btn(interaction=interaction)
+
+
+class ClaimTicketButton(discord.ui.DynamicItem[Button], template=rf"claim_ticket_{TICKET_ID_PATTERN}"):
+    def __init__(self, ticket_id: str):
+        super().__init__(
+            Button(
                 label="Claim Ticket",
                 style=discord.ButtonStyle.green,
                 emoji="📌",
                 custom_id=f"claim_ticket_{ticket_id}",
             )
-            claim_ticket_button.callback = self.claim_ticket_btn
+        )
+        self.ticket_id = ticket_id
 
-        self.add_item(complete_button)
-        self.add_item(claim_ticket_button)
-        self.add_item(close_button)
+    @classmethod
+    async def from_custom_id(cls, interaction: Interaction, item: Button, match):
+        return cls(match["ticket_id"])
 
-    async def complete_order(self, interaction: discord.Interaction):
+    async def callback(self, interaction: discord.Interaction):
         from modules.tickets.services import TicketService
-        await TicketService.complete_order(interaction= interaction, root_view= self)
+        await TicketService.claim_ticket_func(interaction=interaction)
 
-    async def close_ticket_btn(self, interaction: discord.Interaction):
-        from modules.tickets.services import TicketService
-        await TicketService.close_ticket_btn(interaction= interaction, root_view= self)
 
-    async def claim_ticket_btn(self, interaction: discord.Interaction):
-        from modules.tickets.services import TicketService
-        await TicketService.claim_ticket_func(interaction= interaction, ticket_id= self.ticket_id, root_view= self)
+class UnclaimTicketButton(discord.ui.DynamicItem[Button], template=rf"unclaim_ticket_{TICKET_ID_PATTERN}"):
+    def __init__(self, ticket_id: str):
+        super().__init__(
+            Button(
+                label="Unclaim Ticket",
+                style=discord.ButtonStyle.grey,
+                emoji="📍",
+                custom_id=f"unclaim_ticket_{ticket_id}",
+            )
+        )
+        self.ticket_id = ticket_id
 
+    @classmethod
+    async def from_custom_id(cls, interaction: Interaction, item: Button, match):
+        return cls(match["ticket_id"])
 
-    async def unclaim_ticket_btn(self, interaction: discord.Interaction):
+    async def callback(self, interaction: discord.Interaction):
         from modules.tickets.services import TicketService
-        await TicketService.unclaim_ticket_btn(interaction= interaction, root_view= self)
+        await TicketService.unclaim_ticket_btn(interaction=interaction)
 
 
-class TicketClosedView(View):
-    def __init__(self, ticket_id: str, root_view: discord.ui.View):
-        super().__init__(timeout=None)
+class DeleteTicketButton(discord.ui.DynamicItem[Button], template=rf"close_ticket_{TICKET_ID_PATTERN}"):
+    def __init__(self, ticket_id: str):
+        super().__init__(
+            Button(
+                label="Delete Ticket",
+                style=discord.ButtonStyle.red,
+                emoji="🗑️",
+                custom_id=f"close_ticket_{ticket_id}",
+            )
+        )
         self.ticket_id = ticket_id
-        self.root_view = root_view
 
-        delete_btn = discord.ui.Button(
-            label="Delete Ticket",
-            style=discord.ButtonStyle.red,
-            emoji="🗑️",
-            custom_id=f"close_ticket_{ticket_id}",
-        )
-        delete_btn.callback = self.delete_ticket_btn
-        self.add_item(delete_btn)
+    @classmethod
+    async def from_custom_id(cls, interaction: Interaction, item: Button, match):
+        return cls(match["ticket_id"])
 
-    async def delete_ticket_btn(self, interaction: discord.Interaction):
+    async def callback(self, interaction: discord.Interaction):
         from modules.tickets.services import TicketService
         await TicketService.delete_ticket_btn(interaction=interaction)
 
 
+TICKET_DYNAMIC_ITEMS = (
+    CompleteOrderButton,
+    CloseTicketButton,
+    ClaimTicketButton,
+    UnclaimTicketButton,
+    DeleteTicketButton,
+)
+
+
+class TicketControlView(View):
+    """Controls for an open ticket. Only used to render; clicks are routed by the dynamic items."""
+
+    def __init__(self, ticket_id: str, is_custom_ticket: bool = False, is_item_ticket: bool = False,
+                 claimed_by: int = None):
+        super().__init__(timeout=None)
+        self.ticket_id = ticket_id
+        self.is_custom_ticket = is_custom_ticket
+        self.is_item_ticket = is_item_ticket
+
+        self.add_item(CompleteOrderButton(ticket_id))
+        # Create claim button based on current state
+        if claimed_by:
+            self.add_item(UnclaimTicketButton(ticket_id))
+        else:
+            self.add_item(ClaimTicketButton(ticket_id))
+        self.add_item(CloseTicketButton(ticket_id))
+
+
+class TicketClosedView(View):
+    """Controls for a closed ticket."""
+
+    def __init__(self, ticket_id: str):
+        super().__init__(timeout=None)
+        self.ticket_id = ticket_id
+        self.add_item(DeleteTicketButton(ticket_id))
+
+
 class EmbedJsonModal(Modal):
     """
     Reusable modal that parses Discohook JSON
@@ -401,10 +470,8 @@ class CustomTicketButton(Button):
         try:
             ### Create ticket
             from modules.tickets.services import TicketService
-            ticket, status = await TicketService.create_ticket(
-                user=interaction.user,
-                guild=interaction.guild,
-            )
+            from modules.tickets.services_queue import TicketCreationQueueService
+            ticket, status = await TicketCreationQueueService.submit(interaction=interaction)
 
             if status == "exists":
                 channel = interaction.guild.get_channel(ticket.channel_id)
@@ -414,6 +481,10 @@ class CustomTicketButton(Button):
                 )
                 return
 
+            if not ticket:
+                await interaction.followup.send(TicketCreationQueueService.failure_message(status), ephemeral=True)
+                return
+
             channel = interaction.guild.get_channel(ticket.channel_id)
             view = TicketControlView(str(ticket.id), is_custom_ticket=True)
             ticket_manager = await TicketService.get_ticket_manager_role(guild=interaction.guild)
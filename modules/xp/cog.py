@@ -3,6 +3,10 @@ from discord import app_commands
 from discord.ext import commands
 from modules.economy.services import EconomyService
 from modules.xp.services import XPService
+from modules.xp.services_accumulator import XPAccumulatorService
+from modules.xp.services_activity import ActivityXPService
+from modules.xp.services_levels import LevelTableService
+from modules.xp.services_roles import LevelRoleQueueService
 from loguru import logger
 
 
@@ -10,6 +14,24 @@ class XPCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
+    async def cog_load(self) -> None:
+        levels = await LevelTableService.load()
+        logger.info(f"Loaded level table ({levels} levels)" if levels else "No level table, using the default curve")
+        XPAccumulatorService.start(bot=self.bot)
+        ActivityXPService.start()
+
+    async def cog_unload(self) -> None:
+        await ActivityXPService.stop()
+        await XPAccumulatorService.stop()
+
+    @commands.Cog.listener(name="on_message")
+    async def on_message(self, message: discord.Message):
+        await ActivityXPService.on_message(message=message)
+
+    @commands.Cog.listener(name="on_xp_level_up")
+    async def on_xp_level_up(self, user_id: int, old_level: int, new_level: int):
+        LevelRoleQueueService.sync_member(bot=self.bot, user_id=user_id, level=new_level)
+
     @app_commands.command(name="profile", description="View your shop profile and stats")
     async def profile_command(self, interaction: discord.Interaction, user: discord.User = None):
         target = user or interaction.user
@@ -34,6 +56,7 @@ class XPCog(commands.Cog):
         embed.add_field(name="Reputation Score", value=f"**{db_user.reputations}**", inline=True)
 
         embed.add_field(name="Tokens", value=f"{db_user.tokens:,}", inline=True)
+        embed.add_field(name="Rank", value=f"#{await XPService.get_rank(db_user):,}", inline=True)
         
         await interaction.response.send_message(embed=embed)
 
@@ -49,5 +72,79 @@ class XPCog(commands.Cog):
         await interaction.response.send_message(embed=embed)
 
 
+    levels_group = app_commands.Group(
+        name="levels",
+        description="Level curve and level rewards",
+        guild_only=True,
+        default_permissions=discord.Permissions(administrator=True)
+    )
+
+    @levels_group.command(name="show", description="Show the level table")
+    @app_commands.checks.has_permissions(administrator=True)
+    async def levels_show(self, interaction: discord.Interaction):
+        configs = LevelTableService.get_configs()
+        if not configs:
+            await interaction.response.send_message(
+                "No level table configured, the default curve is used (Level = floor(sqrt(XP / 100)) + 1).",
+                ephemeral=True
+            )
+            return
+
+        desc = ""
+        for config in configs[:50]:
+            reward = f" | <@&{config.role_reward_id}>" if config.role_reward_id else ""
+            desc += f"**Lvl {config.level}** - {config.xp_required:,} XP{reward}\n"
+        embed = discord.Embed(title="📈 Level Table", description=desc, color=discord.Color.blue())
+        footer = f"Showing 50 of {len(configs)} levels · " if len(configs) > 50 else ""
+        embed.set_footer(text=f"{footer}{LevelRoleQueueService.pending_count(interaction.guild_id)} role rewards pending")
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @levels_group.command(name="set", description="Add or change a level")
+    @app_commands.checks.has_permissions(administrator=True)
+    @app_commands.describe(role="Role given when a member reaches this level")
+    async def levels_set(
+            self,
+            interaction: discord.Interaction,
+            level: app_commands.Range[int, 1],
+            xp_required: app_commands.Range[int, 0],
+            role: discord.Role = None
+    ):
+        await interaction.response.defer(ephemeral=True)
+        error = await LevelTableService.set_level(
+            level=level, xp_required=xp_required, role_reward_id=role.id if role else 0, bot=self.bot
+        )
+        if error:
+            await interaction.followup.send(f"❌ {error}", ephemeral=True)
+            return
+        await interaction.followup.send(
+            f"✅ Level {level} now needs {xp_required:,} XP. Run `/levels recompute` to re-level existing users.",
+            ephemeral=True
+        )
+
+    @levels_group.command(name="remove", description="Remove a level from the table")
+    @app_commands.checks.has_permissions(administrator=True)
+    async def levels_remove(self, interaction: discord.Interaction, level: int):
+        await interaction.response.defer(ephemeral=True)
+        if not await LevelTableService.remove_level(level=level, bot=self.bot):
+            await interaction.followup.send(f"Level {level} is not in the table.", ephemeral=True)
+            return
+        await interaction.followup.send(
+            f"✅ Level {level} removed. Run `/levels recompute` to re-level existing users.", ephemeral=True
+        )
+
+    @levels_group.command(name="recompute", description="Recompute every user's level from the current curve")
+    @app_commands.checks.has_permissions(administrator=True)
+    async def levels_recompute(self, interaction: discord.Interaction):
+        await interaction.response.defer(ephemeral=True)
+        report = await LevelTableService.recompute_all(bot=self.bot)
+        await interaction.followup.send(
+            f"✅ Recomputed **{report['scanned']:,}** users, **{report['changed']:,}** changed level, "
+            f"in {report['seconds']:.2f}s ({report['per_second']:,.0f} users/s). "
+            f"Reward roles of re-levelled members are being synced "
+            f"({LevelRoleQueueService.pending_count(interaction.guild_id):,} pending here).",
+            ephemeral=True
+        )
+
+
 async def setup(bot):
     await bot.add_cog(XPCog(bot))
@@ -1,15 +1,29 @@
+import bisect
 import math
+import time
 from core.database import Database
 from core.models.user import User
-from loguru import logger
-from modules.economy.services import EconomyService
+from modules.xp.services_accumulator import XPAccumulatorService
+from modules.xp.services_levels import LevelTableService
 
 
 class XPService:
+    # In-memory leaderboard: the top LEADERBOARD_SIZE users, kept sorted by add_xp
+    # and reloaded from the (level, xp) index every LEADERBOARD_RELOAD_SECONDS.
+    LEADERBOARD_SIZE = 100
+    LEADERBOARD_RELOAD_SECONDS = 600
+
+    # Structure: [(-level, -xp, discord_id)] ascending, i.e. rank order
+    _top: list[tuple[int, int, int]] | None = None
+    # Structure: { discord_id: key in _top }
+    _top_keys: dict[int, tuple[int, int, int]] = {}
+    _top_loaded_at: float = 0.0
+
     @staticmethod
     def calculate_level(xp: int) -> int:
         """
         Calculate level based on XP.
+        Uses the LevelConfig table when one is configured, else the formula below.
         Formula: Level = floor(sqrt(XP / 100)) + 1
         Examples:
         - 0 XP -> Lvl 1
@@ -17,6 +31,8 @@ class XPService:
         - 400 XP -> Lvl 3
         - 2500 XP -> Lvl 6
         """
+        if LevelTableService.is_configured():
+            return LevelTableService.level_for_xp(xp)
         if xp < 100:
             return 1
         return math.floor(math.sqrt(xp / 100)) + 1
@@ -24,50 +40,82 @@ class XPService:
     @staticmethod
     def calculate_xp_for_level(level: int) -> int:
         """Calculate minimum XP required for a level."""
+        if LevelTableService.is_configured():
+            return LevelTableService.xp_for_level(level)
         if level <= 1:
             return 0
         return (level - 1) ** 2 * 100
 
     @staticmethod
-    async def add_xp(user_id: int, amount: int, source: str) -> dict:
+    async def add_xp(user_id: int, amount: int, source: str):
         """
-        Add XP to a user. Returns dict with 'leveled_up': bool, 'new_level': int.
+        Add XP to a user. The award is buffered and written by XPAccumulatorService within a few
+        seconds (global multiplier applied there); level-ups are dispatched as `xp_level_up` after the write.
         """
-        user = await EconomyService.get_user(user_id)
-        
-        # Apply Global Multiplier
-        from modules.economy.services import EconomyConfigService
-        config = await EconomyConfigService.get_config()
-        effective_amount = int(amount * config.xp_multiplier)
+        XPAccumulatorService.add(user_id=user_id, amount=amount)
 
-        new_xp = user.xp + effective_amount
-        new_level = XPService.calculate_level(new_xp)
-        
-        leveled_up = new_level > user.level
-        
-        updates = {"xp": new_xp}
-        if leveled_up:
-            updates["level"] = new_level
+    @classmethod
+    async def _load_leaderboard(cls):
+        cursor = Database.users().find({}, {"discord_id": 1, "level": 1, "xp": 1}) \
+            .sort([("level", -1), ("xp", -1)]).limit(cls.LEADERBOARD_SIZE)
+        keys = [(-doc["level"], -doc["xp"], doc["discord_id"]) async for doc in cursor]
+        cls._top = sorted(keys)
+        cls._top_keys = {key[2]: key for key in keys}
+        cls._top_loaded_at = time.monotonic()
 
-        await Database.users().update_one(
-            {"discord_id": user_id},
-            {"$set": updates}
-        )
-        
-        if leveled_up:
-            logger.info(f"User {user_id} leveled up to {new_level}!")
+    @classmethod
+    async def _get_top(cls) -> list[tuple[int, int, int]]:
+        if cls._top is None or time.monotonic() - cls._top_loaded_at > cls.LEADERBOARD_RELOAD_SECONDS:
+            await cls._load_leaderboard()
+        return cls._top
 
-        return {
-            "leveled_up": leveled_up,
-            "new_level": new_level,
-            "xp_added": effective_amount
-        }
+    @classmethod
+    def reset_leaderboard(cls):
+        """Drop the in-memory top list; it is reloaded on the next read."""
+        cls._top = None
+        cls._top_keys = {}
 
-    @staticmethod
-    async def get_leaderboard(limit: int = 10):
+    @classmethod
+    def update_leaderboard(cls, user_id: int, level: int, xp: int):
+        """Apply a user's new (level, xp) to the in-memory top list. O(log K) search + O(K) insert."""
+        if cls._top is None:
+            return
+        key = (-level, -xp, user_id)
+        old = cls._top_keys.pop(user_id, None)
+        if old is not None:
+            cls._top.remove(old)
+            if key > old and len(cls._top) + 1 >= cls.LEADERBOARD_SIZE:
+                # Moved down: someone outside the list may now outrank them
+                cls._top = None
+                return
+
+        if len(cls._top) < cls.LEADERBOARD_SIZE or key < cls._top[-1]:
+            bisect.insort(cls._top, key)
+            cls._top_keys[user_id] = key
+            if len(cls._top) > cls.LEADERBOARD_SIZE:
+                del cls._top_keys[cls._top.pop()[2]]
+
+    @classmethod
+    async def get_rank(cls, user: User) -> int:
+        """1-based leaderboard position. From memory for the top list, else an indexed count."""
+        top = await cls._get_top()
+        key = (-user.level, -user.xp, user.discord_id)
+        if cls._top_keys.get(user.discord_id) == key:
+            return top.index(key) + 1
+
+        ahead = await Database.users().count_documents({"$or": [
+            {"level": {"$gt": user.level}},
+            {"level": user.level, "xp": {"$gt": user.xp}},
+        ]})
+        return ahead + 1
+
+    @classmethod
+    async def get_leaderboard(cls, limit: int = 10):
         """Get top users by Level/XP."""
-        cursor = Database.users().find({}).sort([("level", -1), ("xp", -1)]).limit(limit)
-        users = []
-        async for doc in cursor:
-            users.append(User(**doc))
-        return users
+        if limit > cls.LEADERBOARD_SIZE:
+            cursor = Database.users().find({}).sort([("level", -1), ("xp", -1)]).limit(limit)
+            return [User(**doc) async for doc in cursor]
+
+        ids = [key[2] for key in (await cls._get_top())[:limit]]
+        docs = {doc["discord_id"]: doc async for doc in Database.users().find({"discord_id": {"$in": ids}})}
+        return [User(**docs[user_id]) for user_id in ids if user_id in docs]
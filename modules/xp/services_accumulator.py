@@ -0,0 +1,141 @@
+import asyncio
+
+import discord
+from loguru import logger
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from core.database import Database
+
+
+class XPAccumulatorService:
+    """
+    Write-coalescing XP buffer.
+    add_xp only adds to a per-user delta in memory; every FLUSH_INTERVAL_SECONDS all deltas are
+    written with one bulk_write of $inc upserts. Levels are then recomputed from the flushed totals
+    and each level-up is dispatched as the `xp_level_up` event (member id, old level, new level).
+    """
+    FLUSH_INTERVAL_SECONDS = 3
+
+    _bot: discord.Client | None = None
+
+    # Structure: { discord_id: raw xp delta (before the global multiplier) }
+    _deltas: dict[int, int] = {}
+
+    _flush_task: asyncio.Task | None = None
+    _flush_lock: asyncio.Lock = asyncio.Lock()
+
+    @classmethod
+    def start(cls, bot: discord.Client):
+        """Start the background flush loop (idempotent)."""
+        cls._bot = bot
+        if cls._flush_task is None or cls._flush_task.done():
+            cls._flush_task = asyncio.create_task(cls._flush_loop())
+
+    @classmethod
+    async def stop(cls):
+        """Stop the flush loop and write out whatever is still buffered."""
+        if cls._flush_task:
+            cls._flush_task.cancel()
+            try:
+                await cls._flush_task
+            except asyncio.CancelledError:
+                pass
+            cls._flush_task = None
+        await cls.flush()
+
+    @classmethod
+    async def _flush_loop(cls):
+        while True:
+            await asyncio.sleep(cls.FLUSH_INTERVAL_SECONDS)
+            try:
+                await cls.flush()
+            except Exception as e:
+                logger.error(f"[XPAccumulator] Flush loop error: {e}")
+
+    @classmethod
+    def add(cls, user_id: int, amount: int):
+        """Buffer an XP award. No DB round trip."""
+        cls._deltas[user_id] = cls._deltas.get(user_id, 0) + amount
+
+    @classmethod
+    async def flush(cls) -> int:
+        """Write all buffered deltas, then apply and dispatch level-ups. Returns the number of users written."""
+        from modules.economy.services import EconomyConfigService, EconomyService
+
+        async with cls._flush_lock:
+            deltas, cls._deltas = cls._deltas, {}
+            if not deltas:
+                return 0
+
+            try:
+                config = await EconomyConfigService.get_config()
+            except Exception as e:
+                cls._requeue(deltas)
+                logger.error(f"[XPAccumulator] Failed to read economy config: {e}")
+                return 0
+
+            user_ids = list(deltas)
+            operations = [
+                UpdateOne(
+                    {"discord_id": user_id},
+                    {
+                        "$inc": {"xp": int(deltas[user_id] * config.xp_multiplier)},
+                        "$setOnInsert": EconomyService._new_user_defaults(user_id, exclude=("xp",)),
+                    },
+                    upsert=True
+                )
+                for user_id in user_ids
+            ]
+            try:
+                await Database.users().bulk_write(operations, ordered=False)
+                written = user_ids
+            except BulkWriteError as e:
+                failed = {user_ids[err["index"]] for err in e.details.get("writeErrors", [])}
+                cls._requeue({user_id: deltas[user_id] for user_id in failed})
+                written = [user_id for user_id in user_ids if user_id not in failed]
+            except Exception as e:
+                cls._requeue(deltas)
+                logger.error(f"[XPAccumulator] Failed to write XP for {len(deltas)} users: {e}")
+                return 0
+
+            try:
+                await cls._apply_levels(written)
+            except Exception as e:
+                # XP is safe; levels catch up on the user's next flush
+                logger.error(f"[XPAccumulator] Failed to update levels: {e}")
+            return len(written)
+
+    @classmethod
+    def _requeue(cls, deltas: dict[int, int]):
+        for user_id, amount in deltas.items():
+            cls.add(user_id, amount)
+        if deltas:
+            logger.warning(f"[XPAccumulator] Re-queueing XP for {len(deltas)} users")
+
+    @classmethod
+    async def _apply_levels(cls, user_ids: list[int]):
+        """Recompute levels from the flushed totals; one bulk_write for every level-up."""
+        from modules.xp.services import XPService
+
+        level_ups = []
+        cursor = Database.users().find({"discord_id": {"$in": user_ids}}, {"discord_id": 1, "xp": 1, "level": 1})
+        async for doc in cursor:
+            new_level = XPService.calculate_level(doc["xp"])
+            if new_level > doc["level"]:
+                level_ups.append((doc["discord_id"], doc["level"], new_level))
+            XPService.update_leaderboard(user_id=doc["discord_id"], level=max(new_level, doc["level"]), xp=doc["xp"])
+
+        if not level_ups:
+            return
+
+        # The level filter keeps a concurrent flush from moving anyone backwards
+        await Database.users().bulk_write([
+            UpdateOne({"discord_id": user_id, "level": {"$lt": new_level}}, {"$set": {"level": new_level}})
+            for user_id, _, new_level in level_ups
+        ], ordered=False)
+
+        for user_id, old_level, new_level in level_ups:
+            logger.info(f"User {user_id} leveled up to {new_level}!")
+            if cls._bot:
+                cls._bot.dispatch("xp_level_up", user_id, old_level, new_level)
@@ -0,0 +1,85 @@
+import asyncio
+import time
+
+import discord
+from loguru import logger
+
+from modules.economy.models import EconomyConfig
+
+
+class ActivityXPService:
+    """
+    Message-activity XP.
+    A member earns EconomyConfig.activity_xp for a message at most once per
+    activity_cooldown_seconds. Last-award times live in memory (evicted once the window
+    has passed) and awards go through XPAccumulatorService, so a message costs no DB call.
+    """
+    EVICT_INTERVAL_SECONDS = 300
+
+    # Cached from EconomyConfig, refreshed on every eviction pass
+    _amount: int = EconomyConfig.model_fields["activity_xp"].default
+    _cooldown: float = EconomyConfig.model_fields["activity_cooldown_seconds"].default
+
+    # Structure: { discord_id: monotonic time of the last award }
+    _last_award: dict[int, float] = {}
+
+    _task: asyncio.Task | None = None
+
+    @classmethod
+    def start(cls):
+        """Start the eviction / config refresh loop (idempotent)."""
+        if cls._task is None or cls._task.done():
+            cls._task = asyncio.create_task(cls._maintenance_loop())
+
+    @classmethod
+    async def stop(cls):
+        if cls._task:
+            cls._task.cancel()
+            try:
+                await cls._task
+            except asyncio.CancelledError:
+                pass
+            cls._task = None
+
+    @classmethod
+    def apply_config(cls, config: EconomyConfig):
+        cls._amount = config.activity_xp
+        cls._cooldown = config.activity_cooldown_seconds
+
+    @classmethod
+    async def _maintenance_loop(cls):
+        from modules.economy.services import EconomyConfigService
+
+        while True:
+            try:
+                cls.apply_config(await EconomyConfigService.get_config())
+            except Exception as e:
+                logger.error(f"[ActivityXP] Failed to refresh config: {e}")
+            cls.evict()
+            await asyncio.sleep(cls.EVICT_INTERVAL_SECONDS)
+
+    @classmethod
+    def evict(cls) -> int:
+        """Drop members whose window has passed; they would be awarded on their next message anyway."""
+        cutoff = time.monotonic() - cls._cooldown
+        expired = [user_id for user_id, awarded_at in cls._last_award.items() if awarded_at <= cutoff]
+        for user_id in expired:
+            del cls._last_award[user_id]
+        return len(expired)
+
+    @classmethod
+    async def on_message(cls, message: discord.Message) -> bool:
+        """Award activity XP for a guild message if the author is out of their window. Returns True if awarded."""
+        from modules.xp.services import XPService
+
+        if message.author.bot or message.guild is None or cls._amount <= 0:
+            return False
+
+        now = time.monotonic()
+        awarded_at = cls._last_award.get(message.author.id)
+        if awarded_at is not None and now - awarded_at < cls._cooldown:
+            return False
+
+        cls._last_award[message.author.id] = now
+        await XPService.add_xp(user_id=message.author.id, amount=cls._amount, source="activity")
+        return True
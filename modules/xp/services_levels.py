@@ -0,0 +1,202 @@
+import asyncio
+import bisect
+import time
+
+import discord
+import numpy as np
+from loguru import logger
+from pymongo import UpdateOne
+
+from core.database import Database
+from modules.xp.models import LevelConfig
+
+
+class LevelTableService:
+    """
+    Level curve from the level_configs collection (one LevelConfig per level).
+    The table is held as two sorted arrays so a level is one bisect over the thresholds.
+    XP and levels are stored per user, not per guild, so there is one curve for the whole bot;
+    role_reward_id is a role snowflake and identifies its guild by itself.
+    With no table configured XPService keeps its built-in formula.
+    """
+    # Users read, compared and written per batch by recompute_all
+    RECOMPUTE_CHUNK_SIZE = 5000
+
+    # Structure: [xp_required] ascending, and the level at the same index
+    _thresholds: list[int] = []
+    _levels: list[int] = []
+    # Structure: { level: LevelConfig }
+    _configs: dict[int, LevelConfig] = {}
+
+    _recompute_lock: asyncio.Lock = asyncio.Lock()
+
+    @classmethod
+    def is_configured(cls) -> bool:
+        return bool(cls._thresholds)
+
+    @classmethod
+    async def load(cls) -> int:
+        """(Re)load the table from the database. Returns the number of levels."""
+        configs = [LevelConfig(**doc) async for doc in Database.level_configs().find({})]
+        configs.sort(key=lambda c: (c.xp_required, c.level))
+        cls._configs = {config.level: config for config in configs}
+        cls._thresholds = [config.xp_required for config in configs]
+        cls._levels = [config.level for config in configs]
+        return len(configs)
+
+    @classmethod
+    def get_configs(cls) -> list[LevelConfig]:
+        return [cls._configs[level] for level in sorted(cls._configs)]
+
+    @classmethod
+    def get_config(cls, level: int) -> LevelConfig | None:
+        return cls._configs.get(level)
+
+    @classmethod
+    def level_for_xp(cls, xp: int) -> int:
+        """Highest configured level whose xp_required is <= xp (1 below the first threshold)."""
+        index = bisect.bisect_right(cls._thresholds, xp)
+        return cls._levels[index - 1] if index else 1
+
+    @classmethod
+    def xp_for_level(cls, level: int) -> int:
+        """xp_required of a level; the last configured threshold for levels past the table."""
+        config = cls._configs.get(level)
+        if config:
+            return config.xp_required
+        # The curve is monotonic, so _levels is sorted too
+        index = bisect.bisect_right(cls._levels, level)
+        return cls._thresholds[index - 1] if index else 0
+
+    @classmethod
+    def validate(cls, configs: list[LevelConfig]) -> str | None:
+        """The curve must be monotonic: a higher level can never need less XP."""
+        ordered = sorted(configs, key=lambda c: c.level)
+        for lower, higher in zip(ordered, ordered[1:]):
+            if higher.xp_required <= lower.xp_required:
+                return f"Level {higher.level} must need more than the {lower.xp_required:,} XP of level {lower.level}"
+        return None
+
+    @classmethod
+    async def set_level(
+            cls, level: int, xp_required: int, role_reward_id: int = 0, bot: discord.Client = None
+    ) -> str | None:
+        """
+        Add or change a level. Returns an error message if it would break the curve.
+        With a bot, a changed reward role is re-synced for every member it concerns.
+        """
+        config = LevelConfig(level=level, xp_required=xp_required, role_reward_id=role_reward_id)
+        error = cls.validate([c for c in cls._configs.values() if c.level != level] + [config])
+        if error:
+            return error
+
+        doc = config.to_mongo()
+        doc.pop("_id", None)
+        doc.pop("created_at", None)
+        await Database.level_configs().update_one(
+            {"level": level},
+            {"$set": doc, "$setOnInsert": {"created_at": config.created_at}},
+            upsert=True
+        )
+        old = cls._configs.get(level)
+        await cls.load()
+        await cls._sync_reward_change(bot, level, old.role_reward_id if old else 0, role_reward_id)
+        return None
+
+    @classmethod
+    async def remove_level(cls, level: int, bot: discord.Client = None) -> bool:
+        result = await Database.level_configs().delete_one({"level": level})
+        old = cls._configs.get(level)
+        await cls.load()
+        if result.deleted_count:
+            await cls._sync_reward_change(bot, level, old.role_reward_id if old else 0, 0)
+        return result.deleted_count > 0
+
+    @classmethod
+    async def _sync_reward_change(cls, bot: discord.Client | None, level: int, old_role_id: int, new_role_id: int):
+        from modules.xp.services_roles import LevelRoleQueueService
+
+        if bot is None or old_role_id == new_role_id:
+            return
+        try:
+            await LevelRoleQueueService.sync_reward_change(
+                bot=bot, level=level, old_role_id=old_role_id, new_role_id=new_role_id
+            )
+        except Exception as e:
+            # The table itself is saved; the next level-up or recompute syncs these members
+            logger.error(f"[LevelTable] Failed to sync reward roles for level {level}: {e}")
+
+    @classmethod
+    def _compute_levels(cls, xps: list[int], thresholds: list[int], levels: list[int]) -> list[int]:
+        """Levels for a batch of XP totals: one vectorised searchsorted, same rule as level_for_xp."""
+        index = np.searchsorted(np.asarray(thresholds), np.asarray(xps), side="right")
+        table = np.asarray([1] + levels)
+        return table[index].tolist()
+
+    @classmethod
+    async def recompute_all(cls, bot: discord.Client = None) -> dict:
+        """
+        Re-level every user against the current curve (levels may go down as well as up).
+        Users are streamed in chunks; only changed levels are written, and only if the user's
+        XP did not move in the meantime (the next XP flush re-levels those anyway).
+        With a bot, reward roles of every re-levelled user are re-synced through LevelRoleQueueService.
+        """
+        from modules.xp.services import XPService
+
+        async with cls._recompute_lock:
+            start = time.perf_counter()
+            thresholds, levels = list(cls._thresholds), list(cls._levels)
+            scanned = changed = 0
+
+            cursor = Database.users().find({}, {"_id": 1, "discord_id": 1, "xp": 1, "level": 1}).batch_size(cls.RECOMPUTE_CHUNK_SIZE)
+            chunk = []
+            async for doc in cursor:
+                chunk.append(doc)
+                if len(chunk) >= cls.RECOMPUTE_CHUNK_SIZE:
+                    changed += await cls._recompute_chunk(chunk, thresholds, levels, bot)
+                    scanned += len(chunk)
+                    chunk = []
+            if chunk:
+                changed += await cls._recompute_chunk(chunk, thresholds, levels, bot)
+                scanned += len(chunk)
+
+            # Ranks may have moved wholesale
+            XPService.reset_leaderboard()
+
+            seconds = time.perf_counter() - start
+            report = {
+                "scanned": scanned,
+                "changed": changed,
+                "seconds": seconds,
+                "per_second": scanned / seconds if seconds else 0.0,
+            }
+            logger.info(
+                f"[LevelTable] Recomputed {scanned:,} users ({changed:,} changed) in {seconds:.2f}s "
+                f"({report['per_second']:,.0f} users/s)"
+            )
+            return report
+
+    @classmethod
+    async def _recompute_chunk(
+            cls, chunk: list[dict], thresholds: list[int], levels: list[int], bot: discord.Client = None
+    ) -> int:
+        from modules.xp.services import XPService
+        from modules.xp.services_roles import LevelRoleQueueService
+
+        if thresholds:
+            new_levels = await asyncio.to_thread(cls._compute_levels, [doc["xp"] for doc in chunk], thresholds, levels)
+        else:
+            new_levels = [XPService.calculate_level(doc["xp"]) for doc in chunk]
+
+        changed = [(doc, new_level) for doc, new_level in zip(chunk, new_levels) if new_level != doc["level"]]
+        if not changed:
+            return 0
+        result = await Database.users().bulk_write([
+            UpdateOne({"_id": doc["_id"], "xp": doc["xp"]}, {"$set": {"level": new_level}})
+            for doc, new_level in changed
+        ], ordered=False)
+
+        if bot:
+            for doc, new_level in changed:
+                LevelRoleQueueService.sync_member(bot=bot, user_id=doc["discord_id"], level=new_level)
+        return result.modified_count
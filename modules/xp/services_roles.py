@@ -0,0 +1,143 @@
+import asyncio
+
+import discord
+from loguru import logger
+
+from core.database import Database
+from core.rate_limit import TokenBucket
+from modules.xp.services_levels import LevelTableService
+
+
+class LevelRoleQueueService:
+    """
+    Level reward roles (LevelConfig.role_reward_id), applied through a per-guild role-edit queue.
+    Pending edits are keyed by member and role, so repeated level-ups in a burst collapse into one
+    add (or a cancelled add/remove pair into nothing); one worker per guild drains the queue in
+    order, paced by a token bucket so a mass XP event never fires a wall of add_roles calls.
+    """
+    # Role edit calls per guild (one per member and direction): BUCKET_CAPACITY, refilled over BUCKET_PERIOD_SECONDS
+    BUCKET_CAPACITY = 5
+    BUCKET_PERIOD_SECONDS = 5
+
+    # Structure: { guild_id: { member_id: { role_id: True (add) / False (remove) } } }
+    _pending: dict[int, dict[int, dict[int, bool]]] = {}
+    # Structure: { guild_id: TokenBucket }
+    _buckets: dict[int, TokenBucket] = {}
+    # Structure: { guild_id: worker task }
+    _workers: dict[int, asyncio.Task] = {}
+
+    @classmethod
+    def get_bucket(cls, guild_id: int) -> TokenBucket:
+        if guild_id not in cls._buckets:
+            cls._buckets[guild_id] = TokenBucket(capacity=cls.BUCKET_CAPACITY, period=cls.BUCKET_PERIOD_SECONDS)
+        return cls._buckets[guild_id]
+
+    @classmethod
+    def pending_count(cls, guild_id: int) -> int:
+        return sum(len(roles) for roles in cls._pending.get(guild_id, {}).values())
+
+    @classmethod
+    def enqueue(cls, guild: discord.Guild, member_id: int, role_id: int, add: bool):
+        """Queue a role edit. The latest operation for a (member, role) pair replaces any pending one."""
+        cls._pending.setdefault(guild.id, {}).setdefault(member_id, {})[role_id] = add
+
+        worker = cls._workers.get(guild.id)
+        if worker is None or worker.done():
+            cls._workers[guild.id] = asyncio.create_task(cls._worker_loop(guild))
+
+    @classmethod
+    def sync_member(cls, bot: discord.Client, user_id: int, level: int) -> int:
+        """
+        Queue the reward roles a member should have at `level` in every guild that owns one:
+        rewards up to their level are added, rewards above it removed. Returns edits queued.
+        """
+        rewards = [config for config in LevelTableService.get_configs() if config.role_reward_id]
+        if not rewards:
+            return 0
+
+        queued = 0
+        for guild in bot.guilds:
+            member = guild.get_member(user_id)
+            if member is None:
+                continue
+            member_role_ids = {role.id for role in member.roles}
+            for config in rewards:
+                if guild.get_role(config.role_reward_id) is None:
+                    continue
+                add = config.level <= level
+                if add != (config.role_reward_id in member_role_ids):
+                    cls.enqueue(guild=guild, member_id=user_id, role_id=config.role_reward_id, add=add)
+                    queued += 1
+        return queued
+
+    @classmethod
+    async def sync_reward_change(cls, bot: discord.Client, level: int, old_role_id: int, new_role_id: int) -> int:
+        """
+        Re-sync after the reward of `level` changed (/levels set or remove): the old role is taken back
+        from every member holding it unless another level still rewards it, and every user at or above
+        the level is synced against the current rewards. Returns edits queued.
+        """
+        queued = 0
+        still_rewarded = any(config.role_reward_id == old_role_id for config in LevelTableService.get_configs())
+        if old_role_id and old_role_id != new_role_id and not still_rewarded:
+            for guild in bot.guilds:
+                role = guild.get_role(old_role_id)
+                if role is None:
+                    continue
+                for member in role.members:
+                    cls.enqueue(guild=guild, member_id=member.id, role_id=old_role_id, add=False)
+                    queued += 1
+
+        cursor = Database.users().find({"level": {"$gte": level}}, {"discord_id": 1, "level": 1})
+        async for doc in cursor:
+            queued += cls.sync_member(bot=bot, user_id=doc["discord_id"], level=doc["level"])
+
+        logger.info(f"[LevelRoles] Reward of level {level} changed, queued {queued} role edits")
+        return queued
+
+    @classmethod
+    async def _worker_loop(cls, guild: discord.Guild):
+        pending = cls._pending[guild.id]
+        bucket = cls.get_bucket(guild.id)
+
+        while pending:
+            # Oldest member first; every role edit for them is applied together
+            member_id = next(iter(pending))
+            roles = pending.pop(member_id)
+
+            member = guild.get_member(member_id)
+            if member is None:
+                continue
+            member_role_ids = {role.id for role in member.roles}
+
+            # One add_roles and one remove_roles call at most per member
+            edits = {True: [], False: []}
+            for role_id, add in roles.items():
+                role = guild.get_role(role_id)
+                if role is not None and add != (role_id in member_role_ids):
+                    edits[add].append(role)
+
+            for add, edit_roles in edits.items():
+                if not edit_roles:
+                    continue
+                names = ", ".join(role.name for role in edit_roles)
+
+                wait = bucket.wait_time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                bucket.take()
+                try:
+                    if add:
+                        await member.add_roles(*edit_roles, reason="Level reward")
+                    else:
+                        await member.remove_roles(*edit_roles, reason="Level reward above current level")
+                    logger.info(f"[LevelRoles] {'Added' if add else 'Removed'} {names} for {member_id} in guild {guild.id}")
+                except discord.Forbidden:
+                    logger.warning(f"[LevelRoles] Missing permissions to edit roles {names} in guild {guild.id}")
+                except discord.HTTPException as e:
+                    if e.status == 429:
+                        # Re-queue unless a newer edit for the same role arrived meanwhile
+                        bucket.drain()
+                        for role in edit_roles:
+                            pending.setdefault(member_id, {}).setdefault(role.id, add)
+                    logger.warning(f"[LevelRoles] Failed to edit roles {names} for {member_id}: {e}")
@@ -20,6 +20,34 @@ async def repair():
     )
     print(f"Updated {result_items.modified_count} items.")
 
+    # Move legacy embedded ticket messages into the ticket_messages collection
+    moved = 0
+    cursor = Database.tickets().find({"messages.0": {"$exists": True}}, {"messages": 1, "channel_id": 1})
+    async for ticket in cursor:
+        docs = [
+            {**msg, "ticket_id": ticket["_id"], "channel_id": ticket.get("channel_id")}
+            for msg in ticket["messages"]
+        ]
+        await Database.ticket_messages().insert_many(docs, ordered=False)
+        await Database.tickets().update_one({"_id": ticket["_id"]}, {"$unset": {"messages": ""}})
+        moved += len(docs)
+    print(f"Moved {moved} embedded ticket messages.")
+
+    # Rebuild the materialized per-inviter invite counters from invites_joins
+    counters = 0
+    pipeline = [
+        {"$match": {"inviter_id": {"$ne": None}}},
+        {"$group": {"_id": {"guild_id": "$guild_id", "inviter_id": "$inviter_id"}, "total": {"$sum": 1}}},
+    ]
+    async for row in Database.invite_joins().aggregate(pipeline):
+        await Database.invite_counts().update_one(
+            {"guild_id": row["_id"]["guild_id"], "inviter_id": row["_id"]["inviter_id"]},
+            {"$set": {"total": row["total"]}},
+            upsert=True
+        )
+        counters += 1
+    print(f"Rebuilt {counters} invite counters.")
+
     await Database.close()
 
 if __name__ == "__main__":